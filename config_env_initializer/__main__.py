@@ -1,18 +1,32 @@
 import sys
+import json
+import time
 from pathlib import Path
-import importlib.util
 
 from config_env_initializer.project_setup import initialize_folders, get_folder_paths, create_auth_examples
-from config_env_initializer.schema_utils import validate_schema_file
 from config_env_initializer.exceptions import ValidationError
-from config_env_initializer.config_utils import generate_config, validate_config
 from config_env_initializer.generate_file_tree import generate_file_tree, DEFAULT_EXCLUDE_CONFIG
 
-def load_schema_module(schema_path: Path):
-    spec = importlib.util.spec_from_file_location("config_schema", schema_path)
-    schema_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(schema_module)
-    return schema_module
+# Validation modules are imported inside the commands that use them, so that
+# `validate-config --daemon` starts quickly. These names used to be imported
+# here and stay importable from this module.
+_DEFERRED_NAMES = {
+    "load_schema_module": "config_env_initializer.schema_registry",
+    "validate_schema_file": "config_env_initializer.schema_utils",
+    "generate_config": "config_env_initializer.config_utils",
+    "prepare_schema": "config_env_initializer.config_utils",
+    "validate_config": "config_env_initializer.config_utils",
+    "expand_config_paths": "config_env_initializer.batch_validation",
+    "validate_files": "config_env_initializer.batch_validation",
+}
+
+
+def __getattr__(name):
+    if name not in _DEFERRED_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(_DEFERRED_NAMES[name]), name)
+
 
 def print_general_help():
     print("""=== Config Environment Initializer ===
@@ -23,12 +37,13 @@ Usage:
 
 Commands:
 --------
-  validate-config <config.yaml> [schema.py]   Validate a config file against the schema
+  validate-config <config.yaml>... [schema.py] Validate config files (paths or globs) against the schema
   validate-schema [schema.py]                 Validate the structure of a schema file
   init-folders    [schema.py]                 Create project folders defined in the schema
   generate-config [schema.py]                 Generate a sample config file from the schema
   initiate        [schema.py]                 Run all setup steps (validate, init, generate)
   file-tree                                   Generate a file tree of the current project directory
+  serve           [--socket <path>]           Keep schemas warm and answer validate-config --daemon requests
 
 Shortcuts:
 ---------
@@ -39,23 +54,233 @@ Shortcuts:
   initiate:        init, i
   file-tree:       ft
 
+validate-config options:
+------------------------
+  --schema <schema.py>   Schema to validate against (Python, or YAML/JSON/TOML)
+                         A positional schema.py, schema.yaml or *.schema.yaml (.yml/.json/.toml) also works
+  --jobs, -j <N>         Worker processes for multiple files (default: CPU count)
+  --json                 Emit one JSON line per file (implied for multiple files)
+  --watch                Re-validate whenever the configs, schema or auth files change
+  --interval <seconds>   Polling interval for --watch (default: 1.0)
+  --stream               Validate multi-document YAML one document at a time
+  --by-key               Like --stream, but validate each top-level key as it is parsed
+  --fail-fast            Stop at the first error (same as --max-errors 1)
+  --max-errors <N>       Stop validating a file after N errors
+  --ledger <db>          Skip configs already validated against the same schema (SQLite ledger)
+  --daemon               Validate through a running `config-init serve` daemon
+  --socket <path>        Daemon socket (implies --daemon; default: $CONFIG_INIT_SOCKET, else $XDG_RUNTIME_DIR or a private temp dir)
+  --profile              Time each validator and print the slowest validators and keys
+  --profile-top <N>      Rows per --profile table (default: 10)
+  --profile-json <file>  Also write all --profile timings to a JSON file
+
 Defaults:
 ---------
   schema.py path defaults to: ./schema/schema.py
 """)
 
+def is_schema_file_name(arg: str) -> bool:
+    """True for a declarative schema named like one: `schema.yaml`, `app.schema.json`, ...
+
+    Configs use the same suffixes, so other names need --schema.
+    """
+    from config_env_initializer.declarative_schema import is_declarative_schema
+
+    path = Path(arg)
+    return is_declarative_schema(path) and (path.stem == "schema" or path.stem.endswith(".schema"))
+
+
+def parse_validate_config_args(args):
+    """Splits validate-config arguments into config patterns and options."""
+    options = {
+        "patterns": [], "schema_path": None, "jobs": None, "json": False,
+        "watch": False, "interval": 1.0, "stream": False, "by_key": False,
+        "profile": False, "profile_top": None, "profile_json": None, "max_errors": None,
+        "ledger": None, "daemon": False, "socket": None,
+    }
+    remaining = list(args)
+    while remaining:
+        arg = remaining.pop(0)
+        if arg in ("--schema", "--jobs", "-j", "--interval", "--profile-top", "--profile-json", "--max-errors", "--ledger", "--socket"):
+            if not remaining:
+                raise ValueError(f"Missing value for {arg}.")
+            value = remaining.pop(0)
+            if arg == "--schema":
+                options["schema_path"] = Path(value)
+            elif arg == "--interval":
+                options["interval"] = float(value)
+            elif arg == "--profile-top":
+                options["profile"] = True
+                options["profile_top"] = int(value)
+            elif arg == "--profile-json":
+                options["profile"] = True
+                options["profile_json"] = Path(value)
+            elif arg == "--max-errors":
+                options["max_errors"] = int(value)
+                if options["max_errors"] < 1:
+                    raise ValueError("--max-errors must be at least 1.")
+            elif arg == "--ledger":
+                options["ledger"] = Path(value)
+            elif arg == "--socket":
+                options["daemon"] = True
+                options["socket"] = Path(value)
+            else:
+                options["jobs"] = int(value)
+        elif arg == "--json":
+            options["json"] = True
+        elif arg == "--watch":
+            options["watch"] = True
+        elif arg == "--daemon":
+            options["daemon"] = True
+        elif arg == "--profile":
+            options["profile"] = True
+        elif arg == "--fail-fast":
+            options["max_errors"] = 1
+        elif arg == "--stream":
+            options["stream"] = True
+        elif arg == "--by-key":
+            options["stream"] = True
+            options["by_key"] = True
+        elif arg.endswith(".py") or is_schema_file_name(arg):
+            if options["schema_path"] is not None:
+                raise ValueError(f"More than one schema given ({options['schema_path']} and {arg}).")
+            options["schema_path"] = Path(arg)
+        else:
+            options["patterns"].append(arg)
+
+    if options["schema_path"] is None:
+        options["schema_path"] = Path("schema/schema.py")
+    return options
+
+
 def validate_config_command(args):
-    if len(args) < 1:
+    try:
+        options = parse_validate_config_args(args)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    if not options["patterns"]:
         print("[ERROR] Missing <config.yaml> path.")
-        print("Usage: config-init validate-config <config.yaml> [schema.py]")
+        print("Usage: config-init validate-config <config.yaml>... [schema.py]")
+        sys.exit(1)
+
+    from config_env_initializer.batch_validation import expand_config_paths
+
+    config_paths = expand_config_paths(options["patterns"])
+    if options["daemon"] and not (options["watch"] or options["profile"] or options["stream"]):
+        from config_env_initializer.daemon_client import DaemonUnavailable
+
+        try:
+            daemon_validate_configs(config_paths, options)
+        except DaemonUnavailable as e:
+            print(f"[WARN] {e}; validating in-process.", file=sys.stderr)
+
+    if options["watch"]:
+        watch_configs(config_paths, options["schema_path"], options["interval"])
+    elif options["profile"]:
+        profile_configs(
+            config_paths, options["schema_path"], options["profile_top"], options["profile_json"],
+            max_errors=options["max_errors"],
+        )
+    elif options["stream"]:
+        stream_validate_configs(config_paths, options["schema_path"], options["by_key"])
+    elif len(config_paths) == 1 and not options["json"]:
+        validate_single_config(
+            config_paths[0], options["schema_path"], max_errors=options["max_errors"], ledger_path=options["ledger"],
+        )
+    else:
+        validate_many_configs(
+            config_paths, options["schema_path"], options["jobs"],
+            max_errors=options["max_errors"], ledger_path=options["ledger"],
+        )
+
+
+def daemon_validate_configs(config_paths, options):
+    """Validates through a running `config-init serve` daemon, printing like the in-process modes.
+
+    Raises DaemonUnavailable, before printing anything, if no daemon answers.
+    """
+    from config_env_initializer.daemon_client import DaemonUnavailable, validate_with_daemon
+
+    if not config_paths:
+        print("[ERROR] No config files matched.")
+        sys.exit(1)
+
+    single = len(config_paths) == 1 and not options["json"]
+    exit_code = 0
+    for index, config_path in enumerate(config_paths):
+        start = time.perf_counter()
+        result = {"path": str(config_path), "valid": False, "errors": []}
+        try:
+            errors = validate_with_daemon(
+                config_path, options["schema_path"], max_errors=options["max_errors"], socket_path=options["socket"],
+            )
+            result["valid"] = not errors
+            result["errors"] = errors
+        except DaemonUnavailable:
+            if index == 0:
+                raise
+            print("[ERROR] The validation daemon stopped responding.")
+            sys.exit(2)
+        except Exception as e:
+            result["exception"] = str(e)
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        if single:
+            if "exception" in result:
+                print(f"[ERROR] Unexpected validation error:\n  {result['exception']}")
+                sys.exit(2)
+            if result["errors"]:
+                print("[ERROR] Config failed validation:")
+                for err in result["errors"]:
+                    print(f"  - {err}")
+                sys.exit(1)
+            print("[SUCCESS] Config is valid.")
+            sys.exit(0)
+
+        print(json.dumps(result), flush=True)
+        if "exception" in result:
+            exit_code = 2
+        elif not result["valid"] and exit_code == 0:
+            exit_code = 1
+    sys.exit(exit_code)
+
+
+def serve_command(args):
+    socket_path = None
+    remaining = list(args)
+    while remaining:
+        arg = remaining.pop(0)
+        if arg == "--socket" and remaining:
+            socket_path = Path(remaining.pop(0))
+        else:
+            print(f"[ERROR] Unknown serve option '{arg}'.")
+            print("Usage: config-init serve [--socket <path>]")
+            sys.exit(1)
+
+    from config_env_initializer.validation_daemon import ValidationDaemon
+
+    daemon = ValidationDaemon(socket_path)
+    print(f"[INFO] Validation daemon listening on {daemon.socket_path}. Press Ctrl+C to stop.", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[INFO] Stopped validation daemon.")
+    except OSError as e:
+        print(f"[ERROR] {e}")
         sys.exit(1)
 
-    config_path = Path(args[0])
-    schema_path = Path(args[1]) if len(args) > 1 else Path("schema/schema.py")
+
+def validate_single_config(config_path: Path, schema_path: Path, max_errors=None, ledger_path: Path = None):
+    from config_env_initializer.config_utils import validate_config
 
     try:
-        load_schema_module(schema_path)
-        errors = validate_config(config_path=config_path, schema_path=schema_path)
+        if ledger_path:
+            from config_env_initializer.validation_ledger import ValidationLedger
+            ledger = ValidationLedger(ledger_path)
+        else:
+            ledger = None
+        errors = validate_config(config_path=config_path, schema_path=schema_path, max_errors=max_errors, ledger=ledger)
         if errors:
             print("[ERROR] Config failed validation:")
             for err in errors:
@@ -67,7 +292,110 @@ def validate_config_command(args):
         print(f"[ERROR] Unexpected validation error:\n  {e}")
         sys.exit(2)
 
+
+def profile_configs(config_paths, schema_path: Path, top: int = None, json_path: Path = None, max_errors=None):
+    """Validates config files in-process, then prints the slowest validators and keys."""
+    from config_env_initializer.config_utils import prepare_schema, validate_config
+    from config_env_initializer.validation_profile import DEFAULT_TOP_N, ValidationProfile
+
+    top = DEFAULT_TOP_N if top is None else top
+    profile = ValidationProfile()
+    failed = 0
+    try:
+        prepared_schema = prepare_schema(schema_path)
+        for config_path in config_paths:
+            errors = validate_config(config_path, prepared_schema=prepared_schema, profile=profile, max_errors=max_errors)
+            if errors:
+                failed += 1
+                print(f"[ERROR] {config_path} failed validation:")
+                for err in errors:
+                    print(f"  - {err}")
+            else:
+                print(f"[SUCCESS] {config_path} is valid.")
+    except Exception as e:
+        print(f"[ERROR] Unexpected validation error:\n  {e}")
+        sys.exit(2)
+
+    print()
+    print(profile.format_table(top))
+    if json_path is not None:
+        profile.dump_json(json_path)
+        print(f"\n[INFO] Profile written to {json_path}")
+    if failed:
+        sys.exit(1)
+
+
+def stream_validate_configs(config_paths, schema_path: Path, by_key: bool = False):
+    """Validates each YAML document as it is parsed, printing errors as they are found."""
+    from config_env_initializer.schema_registry import load_schema_module
+    from config_env_initializer.streaming_validation import iter_validation_errors
+
+    error_count = 0
+    failed_documents = set()
+    try:
+        schema_module = load_schema_module(schema_path)
+        for config_path in config_paths:
+            for error in iter_validation_errors(config_path, schema_module, by_key=by_key):
+                print(f"[ERROR] {config_path} document {error.document}: {error.message}", flush=True)
+                error_count += 1
+                failed_documents.add((config_path, error.document))
+    except Exception as e:
+        print(f"[ERROR] Unexpected validation error:\n  {e}")
+        sys.exit(2)
+
+    if error_count:
+        print(f"[ERROR] {error_count} error(s) in {len(failed_documents)} document(s).")
+        sys.exit(1)
+    print("[SUCCESS] All documents are valid.")
+
+
+def watch_configs(config_paths, schema_path: Path, interval: float):
+    """Re-validates config files whenever they, the schema or their auth files change."""
+    from config_env_initializer.config_watcher import watch_config_files
+
+    def report(config_path, errors):
+        if isinstance(errors, Exception):
+            print(f"[ERROR] {config_path}: unexpected validation error:\n  {errors}", flush=True)
+        elif errors:
+            print(f"[ERROR] {config_path} failed validation:")
+            for err in errors:
+                print(f"  - {err}")
+            sys.stdout.flush()
+        else:
+            print(f"[SUCCESS] {config_path} is valid.", flush=True)
+
+    print(f"[INFO] Watching {len(config_paths)} config file(s) against {schema_path}. Press Ctrl+C to stop.")
+    try:
+        watch_config_files(config_paths, schema_path, report, interval=interval)
+    except KeyboardInterrupt:
+        print("\n[INFO] Stopped watching.")
+
+
+def validate_many_configs(config_paths, schema_path: Path, jobs=None, max_errors=None, ledger_path: Path = None):
+    """Streams one JSON line per config file and exits non-zero if any failed."""
+    from config_env_initializer.batch_validation import validate_files
+
+    if not config_paths:
+        print("[ERROR] No config files matched.")
+        sys.exit(1)
+
+    exit_code = 0
+    try:
+        for result in validate_files(config_paths, schema_path, jobs=jobs, max_errors=max_errors, ledger_path=ledger_path):
+            print(json.dumps(result), flush=True)
+            if "exception" in result:
+                exit_code = 2
+            elif not result["valid"] and exit_code == 0:
+                exit_code = 1
+    except Exception as e:
+        print(f"[ERROR] Unexpected validation error:\n  {e}")
+        sys.exit(2)
+    sys.exit(exit_code)
+
 def validate_schema_command(args):
+    from config_env_initializer.schema_registry import load_schema_module
+    from config_env_initializer.schema_utils import validate_schema_file
+
     schema_path = Path(args[0]) if args else Path("schema/schema.py")
     try:
         schema_module = load_schema_module(schema_path)
@@ -83,6 +411,9 @@ def validate_schema_command(args):
         sys.exit(1)
 
 def init_folders_command(args):
+    from config_env_initializer.schema_registry import load_schema_module
+    from config_env_initializer.schema_utils import validate_schema_file
+
     schema_path = Path(args[0]) if args else Path("schema/schema.py")
     try:
         schema_module = load_schema_module(schema_path)
@@ -111,6 +442,8 @@ def init_folders_command(args):
         sys.exit(2)
 
 def generate_config_command(args):
+    from config_env_initializer.config_utils import generate_config
+
     schema_path = Path(args[0]) if args else Path("schema/schema.py")
     try:
         generate_config(schema_path=schema_path)
@@ -164,6 +497,7 @@ COMMANDS = {
     "generate-config": generate_config_command,
     "initiate": initiate_command,
     "file-tree": file_tree_command,
+    "serve": serve_command,
 }
 
 COMMAND_ALIASES = {
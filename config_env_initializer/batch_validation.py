@@ -0,0 +1,106 @@
+"""Validates many config files against one schema, optionally across a process pool."""
+
+import glob
+import os
+import time
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+_GLOB_CHARS = set("*?[")
+
+# Schema prepared once per process; forked workers inherit the parent's copy.
+_worker_schema_path = None
+_worker_prepared_schema = None
+_worker_ledger = None
+
+
+def expand_config_paths(patterns: Iterable[str]) -> List[Path]:
+    """Expands paths and glob patterns (including `**`) into a sorted, de-duplicated list."""
+    seen = set()
+    paths = []
+    for pattern in patterns:
+        if _GLOB_CHARS.intersection(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+        for match in matches:
+            path = Path(match)
+            if path not in seen and not path.is_dir():
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def _load_worker_schema(schema_path: str, ledger_path: Optional[str] = None):
+    """Prepares the schema (and opens the ledger, if any) and stores them for this process."""
+    global _worker_schema_path, _worker_prepared_schema, _worker_ledger
+    # Deferred so that expand_config_paths, which the daemon client needs, stays cheap to import.
+    from config_env_initializer.config_utils import prepare_schema
+
+    _worker_prepared_schema = prepare_schema(Path(schema_path))
+    _worker_schema_path = schema_path
+    if ledger_path:
+        # Deferred so that sqlite3 is only imported by callers that use a ledger.
+        from config_env_initializer.validation_ledger import ValidationLedger
+        _worker_ledger = ValidationLedger(ledger_path)
+    else:
+        _worker_ledger = None
+
+
+def _init_worker(schema_path: str, ledger_path: Optional[str] = None):
+    """Pool initializer: loads the schema unless it was inherited from the parent."""
+    if _worker_schema_path != schema_path or _worker_prepared_schema is None:
+        _load_worker_schema(schema_path, ledger_path)
+
+
+def _validate_one(config_path: str, max_errors: Optional[int] = None) -> dict:
+    """Validates one file with the process's prepared schema and times it."""
+    from config_env_initializer.config_utils import validate_config
+
+    start = time.perf_counter()
+    result = {"path": config_path, "valid": False, "errors": []}
+    try:
+        errors = validate_config(
+            Path(config_path), prepared_schema=_worker_prepared_schema, max_errors=max_errors, ledger=_worker_ledger,
+        )
+        result["valid"] = not errors
+        result["errors"] = errors
+    except Exception as e:
+        result["exception"] = f"{type(e).__name__}: {e}"
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def validate_files(
+    config_paths: Iterable[Path],
+    schema_path: Path,
+    jobs: int = None,
+    max_errors: Optional[int] = None,
+    ledger_path: Optional[Path] = None,
+) -> Iterator[dict]:
+    """Yields one result dict per config file, in input order, as results complete.
+
+    Each result has `path`, `valid`, `errors` and `elapsed_ms`, plus `exception`
+    if the file could not be validated at all. The schema is loaded before any
+    work starts so schema errors are raised immediately. max_errors caps the
+    errors collected per file. With ledger_path, every process consults and
+    updates that ValidationLedger database.
+    """
+    config_paths = [str(path) for path in config_paths]
+    ledger_path = str(ledger_path) if ledger_path else None
+    _load_worker_schema(str(schema_path), ledger_path)
+    validate_one = partial(_validate_one, max_errors=max_errors)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(config_paths) <= 1:
+        for config_path in config_paths:
+            yield validate_one(config_path)
+        return
+
+    # Deferred: the pool machinery is only needed when there is more than one file.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(config_paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(str(schema_path), ledger_path)) as executor:
+        yield from executor.map(validate_one, config_paths, chunksize=chunksize)
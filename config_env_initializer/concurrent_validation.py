@@ -0,0 +1,153 @@
+"""Concurrent execution of I/O-bound and async validators.
+
+asyncio and concurrent.futures are imported only once an async validator
+runs, and inspect only once a validator returns something other than None,
+so importing the package stays cheap.
+"""
+
+import queue
+import threading
+import time
+from typing import List, Optional
+
+DEFAULT_IO_WORKERS = 8
+
+
+def call_validator(step, key, value):
+    """Calls a step's validator, driving coroutines of async validators to completion."""
+    result = step.func(value, key) if step.pass_key else step.func(value)
+    if is_awaitable(result):
+        run_coroutine(result)
+
+
+def is_awaitable(value) -> bool:
+    """Same as inspect.isawaitable, with a fast answer for the usual None and coroutine results."""
+    if value is None:
+        return False
+    if hasattr(type(value), "__await__"):
+        return True
+    from inspect import isawaitable
+    return isawaitable(value)
+
+
+def run_coroutine(awaitable):
+    """Runs an awaitable to completion, even when called from inside a running event loop."""
+    import asyncio
+
+    async def runner():
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, runner()).result()
+
+
+def _format_error(step, key, exc) -> str:
+    """Formats a validator failure the same way serial validation does."""
+    return f"[{key}] {step.label}: {str(exc)}"
+
+
+def run_io_validators(jobs, max_workers: int = DEFAULT_IO_WORKERS, timeout: Optional[float] = None) -> List[Optional[str]]:
+    """Runs (step, key, value) jobs concurrently and returns each job's error message or None.
+
+    Sync validators run on a pool of daemon threads; async validators are
+    gathered on one event loop in its own thread. timeout applies to each
+    validator from the moment it starts; a validator that overruns is
+    reported as timed out and left to finish in the background, without
+    delaying process exit.
+    """
+    results: List[Optional[str]] = [None] * len(jobs)
+    sync_jobs = [(i, job) for i, job in enumerate(jobs) if not job[0].is_async]
+    async_jobs = [(i, job) for i, job in enumerate(jobs) if job[0].is_async]
+
+    async_thread = None
+    if async_jobs:
+        async_thread = threading.Thread(target=_run_async_jobs, args=(async_jobs, results, timeout), daemon=True)
+        async_thread.start()
+
+    if sync_jobs:
+        _run_sync_jobs(sync_jobs, results, max_workers, timeout)
+
+    if async_thread is not None:
+        async_thread.join()
+    return results
+
+
+def _run_sync_jobs(sync_jobs, results, max_workers, timeout):
+    """Runs sync validators on daemon worker threads, enforcing per-validator timeouts.
+
+    The workers are daemon threads, so a validator that overruns its timeout,
+    or never returns, doesn't keep the process alive once validation is
+    done. Each timed-out validator is replaced by a fresh worker, so it
+    doesn't hold up the jobs still queued behind it.
+    """
+    jobs = queue.SimpleQueue()
+    finished = queue.SimpleQueue()
+    started = {}
+
+    def work():
+        while True:
+            item = jobs.get()
+            if item is None:
+                return
+            index, (step, key, value) = item
+            started[index] = time.monotonic()
+            try:
+                call_validator(step, key, value)
+            except BaseException as e:
+                finished.put((index, e))
+            else:
+                finished.put((index, None))
+
+    def add_worker():
+        jobs.put(None)
+        threading.Thread(target=work, name="config-init-validator", daemon=True).start()
+
+    for item in sync_jobs:
+        jobs.put(item)
+    for _ in range(max(1, min(max_workers, len(sync_jobs)))):
+        add_worker()
+
+    pending = dict(sync_jobs)
+    while pending:
+        try:
+            index, exc = finished.get(timeout=timeout / 4 if timeout else None)
+        except queue.Empty:
+            pass
+        else:
+            job = pending.pop(index, None)
+            if job is not None and exc is not None:
+                results[index] = _format_error(job[0], job[1], exc)
+
+        if timeout is None:
+            continue
+        now = time.monotonic()
+        for index, (step, key, _) in list(pending.items()):
+            if index in started and now - started[index] > timeout:
+                del pending[index]
+                results[index] = f"[{key}] {step.label}: timed out after {timeout}s"
+                add_worker()
+
+
+def _run_async_jobs(async_jobs, results, timeout):
+    """Gathers async validators on a private event loop."""
+    import asyncio
+
+    async def run_one(index, step, key, value):
+        try:
+            await asyncio.wait_for(step.func(value, key) if step.pass_key else step.func(value), timeout)
+        except asyncio.TimeoutError:
+            results[index] = f"[{key}] {step.label}: timed out after {timeout}s"
+        except Exception as e:
+            results[index] = _format_error(step, key, e)
+
+    async def gather_all():
+        await asyncio.gather(*(run_one(i, *job) for i, job in async_jobs))
+
+    asyncio.run(gather_all())
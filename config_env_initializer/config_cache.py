@@ -0,0 +1,87 @@
+"""On-disk cache of normalized, validated configs keyed by file fingerprints."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config_env_initializer.fingerprint import file_fingerprint
+
+CACHE_FORMAT_VERSION = 1
+
+
+class ConfigCache:
+    """Stores one pickle sidecar per config file under a cache directory.
+
+    An entry is only reused when the config file and schema file fingerprints
+    both match the ones recorded when it was written. Validators defined
+    outside the schema file are not part of the key.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir).expanduser().resolve()
+
+    def cache_key(self, config_path, schema_path: Path, environment: Optional[str] = None) -> tuple:
+        """Builds the cache key for a config/schema pair; config_path may be a list of layer files.
+
+        environment is a hash of the environment variables the config
+        interpolates (see interpolation.environment_key).
+        """
+        if isinstance(config_path, (list, tuple)):
+            config_fingerprint = tuple(file_fingerprint(path) for path in config_path)
+        else:
+            config_fingerprint = file_fingerprint(config_path)
+        return (CACHE_FORMAT_VERSION, config_fingerprint, file_fingerprint(schema_path), environment)
+
+    def entry_path(self, config_path) -> Path:
+        """Returns the sidecar path used for the given config file (or list of layer files)."""
+        if isinstance(config_path, (list, tuple)):
+            config_path = "\0".join(str(path) for path in config_path)
+        name = hashlib.sha256(str(config_path).encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{name}.pickle"
+
+    def load(self, config_path: Path, key: tuple) -> Optional[Tuple[dict, dict]]:
+        """Returns (raw_config, validated_config) on a hit, or None on a miss."""
+        # Deferred, like every import only needed by loaders that pass cache_dir.
+        import pickle
+
+        try:
+            with open(self.entry_path(config_path), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        return entry["raw_config"], entry["config"]
+
+    def store(self, config_path: Path, key: tuple, raw_config: dict, config: dict) -> bool:
+        """Writes an entry atomically; returns False if the config can't be pickled or written.
+
+        A cache that can't be written, e.g. an unwritable cache_dir, never
+        fails the load that tried to fill it.
+        """
+        import pickle
+
+        try:
+            payload = pickle.dumps(
+                {"key": key, "raw_config": raw_config, "config": config},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        entry_path = self.entry_path(config_path)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+        return True
@@ -0,0 +1,149 @@
+"""Layered configs: YAML files deep-merged in order, later layers overriding earlier ones.
+
+Mappings merge key by key at every depth; any other value, including a
+list, replaces what earlier layers set. Each layer's parse is cached per
+process by file fingerprint, and every prefix of the layer list keeps its
+merged result, so a change to one layer only re-merges that layer and the
+ones after it.
+"""
+
+import re
+import threading
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from config_env_initializer.config_scan import parse_path
+from config_env_initializer.config_utils import normalize_config_keys
+from config_env_initializer.fingerprint import file_fingerprint
+
+_ERROR_PATH = re.compile(r"^\[(.*?)\] ")
+
+_layer_cache = {}
+_layer_cache_lock = threading.Lock()
+
+
+class ConfigLayer(NamedTuple):
+    """One parsed layer file with top-level keys normalized, and the line of every key in it."""
+
+    path: Path
+    fingerprint: tuple
+    data: dict
+    lines: dict
+
+
+def load_layer(path) -> ConfigLayer:
+    """Returns the parsed layer at path, re-parsing only when its fingerprint changed."""
+    path = Path(path)
+    fingerprint = file_fingerprint(path)
+    with _layer_cache_lock:
+        layer = _layer_cache.get(path)
+    if layer is not None and layer.fingerprint == fingerprint:
+        return layer
+
+    from config_env_initializer.yaml_loader import load_yaml_with_lines
+    data, lines = load_yaml_with_lines(path)
+    if data is None:
+        # An empty or comment-only overlay, e.g. a host with nothing to override.
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError(f"YAML config must be a dictionary at the top level: {path}")
+    normalized = normalize_config_keys(data)
+    renamed = dict(zip(data, normalized))
+    lines = {(renamed.get(key_path[0], key_path[0]),) + key_path[1:]: line for key_path, line in lines.items()}
+
+    layer = ConfigLayer(path, fingerprint, normalized, lines)
+    with _layer_cache_lock:
+        _layer_cache[path] = layer
+    return layer
+
+
+def deep_merge(base: dict, override: dict) -> dict:
+    """Returns base with override merged in, without modifying either.
+
+    Nested mappings are merged recursively; any other override value
+    replaces the base value. Unchanged subtrees are shared, not copied.
+    """
+    merged = dict(base)
+    stack = [(merged, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                current = target[key] = dict(current)
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return merged
+
+
+class LayeredConfig:
+    """Resolves an ordered list of layer files (lowest precedence first) into one config."""
+
+    def __init__(self, paths: Iterable):
+        self.paths = [Path(path) for path in paths]
+        if not self.paths:
+            raise ValueError("At least one config layer is required.")
+        self.layers: List[ConfigLayer] = []
+        self._prefixes = []
+
+    def __repr__(self):
+        return f"<LayeredConfig {[str(path) for path in self.paths]}>"
+
+    def resolve(self) -> dict:
+        """Returns the merged config, reusing merges of unchanged leading layers.
+
+        The result shares structure with the layer cache; copy it before
+        modifying it in place.
+        """
+        layers = [load_layer(path) for path in self.paths]
+        prefixes = []
+        merged = {}
+        unchanged = True
+        for index, layer in enumerate(layers):
+            unchanged = unchanged and index < len(self._prefixes) and self._prefixes[index][0] == layer.fingerprint
+            if unchanged:
+                merged = self._prefixes[index][1]
+            else:
+                merged = deep_merge(merged, layer.data) if index else layer.data
+            prefixes.append((layer.fingerprint, merged))
+        self.layers = layers
+        self._prefixes = prefixes
+        return merged
+
+    def origin(self, path: tuple) -> Optional[Tuple[Path, int]]:
+        """Returns (file, line) of the layer that set the value at path, or None if no layer did.
+
+        For a path no layer sets exactly, e.g. a missing nested key, the
+        deepest enclosing mapping in the highest-precedence layer is returned.
+        """
+        fallback, fallback_depth = None, 0
+        for layer in reversed(self.layers):
+            for depth in range(len(path), 0, -1):
+                line = layer.lines.get(path[:depth])
+                if line is None:
+                    continue
+                if depth == len(path) or not isinstance(_value_at(layer.data, path[:depth]), dict):
+                    return layer.path, line
+                if depth > fallback_depth:
+                    fallback, fallback_depth = (layer.path, line), depth
+                break
+        return fallback
+
+    def attribute(self, errors: List[str]) -> List[str]:
+        """Appends `(file:line)` to each `[path] ...` error whose value came from a layer."""
+        attributed = []
+        for error in errors:
+            match = _ERROR_PATH.match(error)
+            origin = self.origin(parse_path(match.group(1))) if match else None
+            attributed.append(error if origin is None else f"{error} ({origin[0]}:{origin[1]})")
+        return attributed
+
+
+def _value_at(data, path: tuple):
+    for segment in path:
+        try:
+            data = data[segment]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
@@ -1,59 +1,334 @@
+from copy import deepcopy
 from pathlib import Path
-import yaml
-import importlib.util
-from pprint import pformat
-import textwrap
 
+from config_env_initializer.schema_registry import load_compiled_schema, load_schema_module
 from config_env_initializer.schema_utils import validate_config_against_schema
 from config_env_initializer.sensitive import SensitiveValue, mask_config_for_logging
 from config_env_initializer.config_utils import normalize_config_keys
-from config_env_initializer.logger_setup import prepare_logger
-from config_env_initializer.execution_monitor import Execution_Monitor
 from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.config_cache import ConfigCache
+from config_env_initializer.config_layers import LayeredConfig
+from config_env_initializer.interpolation import environment_key, index_templates, referenced_variables
+from config_env_initializer.config_watcher import RUNTIME_KEYS, FileWatcher, auth_paths, diff_configs, file_signatures
+
+
+class LazyConfig(dict):
+    """Config dict whose factory-backed keys are materialized on first access.
+
+    Lazy keys are visible to `[]`, `get` and `in`, but not to iteration until
+    they have been accessed once.
+    """
+
+    def __init__(self, data: dict, factories: dict):
+        super().__init__(data)
+        self._factories = dict(factories)
+
+    def __missing__(self, key):
+        factory = self._factories.pop(key, None)
+        if factory is None:
+            raise KeyError(key)
+        value = factory()
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._factories.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._factories
+
+    def get(self, key, default=None):
+        """Returns the value for key, materializing lazy keys, else default."""
+        if key in self:
+            return self[key]
+        return default
+
+    def pending_keys(self) -> list:
+        """Returns the lazy keys that have not been materialized yet."""
+        return list(self._factories)
 
 
 class ConfigLoader:
     """Loads, validates, and enriches a YAML config with logging, auth, and monitoring."""
 
-    def __init__(self, config_path_str: str, schema_path_str: str = None):
-        """Initializes the config loader and sets up auth, logger, and execution monitor."""
-        self.config_path = self._resolve_path(config_path_str)
+    def __init__(
+        self, config_path_str, schema_path_str: str = None, cache_dir: str = None, lazy: bool = False, environ=None,
+    ):
+        """Initializes the config loader and sets up auth, logger, and execution monitor.
+
+        config_path_str may also be a list of layer files, e.g. [base, env,
+        host], which are deep-merged with later files taking precedence (see
+        config_layers). The merged config is validated once, and errors name
+        the file and line each offending value came from.
+
+        `${VAR}` and `${VAR:-default}` in config values, at any depth, are
+        expanded from environ (default: os.environ) before validation; see
+        refresh_environment() for picking up later changes.
+
+        When cache_dir is given, the normalized and validated config is cached
+        there and reused while the config and schema files, and the variables
+        they reference, are unchanged.
+
+        With lazy=True, `config["auth"]`, `config["logger"]` and
+        `config["execution_monitor"]` are only built on first access, and the
+        loaded config is not dumped to the log.
+        """
+        if isinstance(config_path_str, (list, tuple)):
+            self.config_paths = [self._resolve_path(path) for path in config_path_str]
+        else:
+            self.config_paths = [self._resolve_path(config_path_str)]
+        self.layers = LayeredConfig(self.config_paths) if len(self.config_paths) > 1 else None
+        self.config_path = self.config_paths[-1]
         self.schema_path = self._resolve_path(schema_path_str) if schema_path_str else self._default_schema_path()
 
-        self._assert_exists(self.config_path, "YAML config")
+        for config_path in self.config_paths:
+            self._assert_exists(config_path, "YAML config")
         self._assert_exists(self.schema_path, "Schema")
 
-        self.raw_config = self._load_yaml(self.config_path)
+        self.lazy = lazy
+        self.cache = ConfigCache(cache_dir) if cache_dir else None
+        self.cache_hit = False
+        self.compiled_schema = None
+        self.environ = environ
+        self.templates = None
+        self._cached_environment = None
+
+        # Taken before anything is read, so watch() also sees edits made while loading.
+        signatures = file_signatures([*self.config_paths, self.schema_path])
         self.schema_module = self._load_schema_module(self.schema_path)
+        self.config = self._load_config_with_cache()
+        self._record_signatures(signatures, self.config)
+
+        if lazy:
+            self.config = LazyConfig(self.config, self._lazy_factories())
+            return
+
+        self.config["auth"] = self._load_auth_data()
+        self.config["logger"] = self._create_logger()
+        self.config["execution_monitor"] = self._create_execution_monitor()
+        self._log_loaded_config()
+
+    @property
+    def auth(self) -> dict:
+        """Loaded auth data keyed by system name."""
+        return self.config["auth"]
+
+    @property
+    def auth_keys(self) -> list:
+        """Names of the systems with loaded auth data."""
+        return list(self.auth.keys())
+
+    @property
+    def logger(self):
+        """Logger configured from the config's log settings."""
+        return self.config["logger"]
+
+    @property
+    def execution_monitor(self):
+        """Execution_Monitor recording this script run."""
+        return self.config["execution_monitor"]
+
+    def _lazy_factories(self) -> dict:
+        """Returns the factories used to materialize lazy config keys."""
+        return {
+            "auth": self._load_auth_data,
+            "logger": self._create_logger,
+            "execution_monitor": self._create_execution_monitor,
+        }
+
+    def watched_paths(self) -> list:
+        """Returns the config, schema and auth files that a reload depends on."""
+        return [*self.config_paths, self.schema_path, *auth_paths(self.config, self._resolve_path)]
+
+    def reload(self):
+        """Re-reads the config, schema and auth files and swaps in the new config.
 
-        self.config = self._load_and_validate_config(self.raw_config, self.schema_module)
-        self.auth = self._load_auth_data()
-        self.logger = self._setup_logger()
+        Runtime objects (logger, execution monitor) are carried over. Returns
+        (config, diff) where diff is a ConfigDiff of the validated values.
+        Raises ValidationError, leaving the current config untouched, if the
+        new config is invalid.
+        """
+        signatures = file_signatures([*self.config_paths, self.schema_path])
+        schema_module = self._load_schema_module(self.schema_path)
+        compiled_schema = load_compiled_schema(self.schema_path)
+        return self._swap_in(schema_module, compiled_schema, self._load_raw_config(), signatures=signatures)
 
-        self.config["auth"] = self.auth
-        self.config["logger"] = self.logger
-        self.logger.info(f"Logger successfully initialized: {self.logger}")
-        self.auth_keys = list(self.auth.keys())
+    def refresh_environment(self, environ=None):
+        """Re-expands `${VAR}` values after an environment change and swaps in the new config.
+
+        Files are not re-read and only the templated paths are re-rendered.
+        Returns (config, diff) like reload(); the diff is empty, and nothing
+        is re-validated, if no referenced variable changed.
+        """
+        if environ is not None:
+            self.environ = environ
+        templates = self.templates
+        if templates is None:
+            # Loaded from the on-disk cache, which is keyed on the referenced variables.
+            names, key = self._cached_environment or ((), None)
+            if key is not None and environment_key(names, self.environ) == key:
+                return self.config, diff_configs(self.config, self.config)
+            compiled_schema = self.compiled_schema or load_compiled_schema(self.schema_path)
+            templates = index_templates(normalize_config_keys(self.raw_config), compiled_schema.index)
+        elif not templates.changed(self.environ):
+            return self.config, diff_configs(self.config, self.config)
+
+        compiled_schema = self.compiled_schema or load_compiled_schema(self.schema_path)
+        return self._swap_in(self.schema_module, compiled_schema, self.raw_config, templates)
+
+    def _swap_in(self, schema_module, compiled_schema, raw_config: dict, templates=None, signatures=None):
+        """Validates raw_config and replaces the current config, carrying runtime objects over.
+
+        signatures are the config and schema file signatures from before they
+        were read; without them the ones recorded by the last load are kept.
+        """
+        validated = self._load_and_validate_config(raw_config, compiled_schema, templates)
+
+        previous = self.config
+        for key in RUNTIME_KEYS:
+            if dict.__contains__(previous, key):
+                validated[key] = dict.__getitem__(previous, key)
+
+        if self.lazy:
+            pending = set(previous.pending_keys())
+            if "auth" not in pending:
+                validated["auth"] = self._load_auth_data(validated)
+            factories = {k: f for k, f in self._lazy_factories().items() if k in pending}
+            config = LazyConfig(validated, factories)
+        else:
+            validated["auth"] = self._load_auth_data(validated)
+            config = validated
+
+        diff = diff_configs(previous, config)
+        self.schema_module = schema_module
+        self.compiled_schema = compiled_schema
+        self.raw_config = raw_config
+        self.config = config
+        self._record_signatures(self.file_signatures if signatures is None else signatures, config)
+        return config, diff
+
+    def _record_signatures(self, signatures: dict, config: dict):
+        """Records the watched files' signatures as of this load, for watch() to start from."""
+        self.file_signatures = {**signatures, **file_signatures(auth_paths(config, self._resolve_path))}
+
+    def watch(self, callback, interval: float = 1.0, stop_event=None, on_error=None):
+        """Blocks, reloading whenever a watched file changes, until stop_event is set.
+
+        callback(config, diff) is called after each reload that changed a value.
+        Reload failures go to on_error(exception) if given, otherwise they are
+        logged and the previous config stays active. Run this in a thread to
+        keep serving while watching.
+        """
+        import threading
+
+        stop_event = stop_event or threading.Event()
+        watcher = FileWatcher(self.watched_paths(), self.file_signatures)
+
+        while not stop_event.wait(interval):
+            if not watcher.poll():
+                continue
+            try:
+                config, diff = self.reload()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e)
+                else:
+                    self.logger.error(f"Config reload failed: {e}")
+                continue
+            watcher.set_paths(self.watched_paths(), self.file_signatures)
+            if diff:
+                callback(config, diff)
+
+    def _create_logger(self):
+        """Sets up the logger and announces it."""
+        logger = self._setup_logger()
+        logger.info(f"Logger successfully initialized: {logger}")
+        return logger
+
+    def _create_execution_monitor(self):
+        """Opens the execution monitor DB and records the script start."""
+        from config_env_initializer.execution_monitor import Execution_Monitor
 
         script_name = self.config.get('script_name', 'script_execution')
-        execution_monitor: Execution_Monitor = Execution_Monitor(self.config, script_name)
-        self.config["execution_monitor"] = execution_monitor
+        execution_monitor = Execution_Monitor(self.config, script_name)
         self.logger.info("Execution monitor successfully initialized")
+        return execution_monitor
+
+    def _log_loaded_config(self):
+        """Logs the loaded config, skipping the pretty-print if INFO is disabled."""
+        import logging
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        import textwrap
+        from pprint import pformat
 
         formatted_config_output = textwrap.indent(pformat(self.config), prefix="\t")
         self.logger.info("Loaded and validated config:\n%s", formatted_config_output)
 
+    def _load_config_with_cache(self) -> dict:
+        """Returns the validated config, reusing the on-disk cache when possible."""
+        cache_key = None
+        if self.cache is not None:
+            names = referenced_variables(self.config_paths)
+            environment = environment_key(names, self.environ)
+            cache_key = self.cache.cache_key(self._cache_target(), self.schema_path, environment)
+            cached = self.cache.load(self._cache_target(), cache_key)
+            if cached is not None:
+                self.raw_config, config = cached
+                self.cache_hit = True
+                self._cached_environment = (names, environment)
+                return config
+
+        self.raw_config = self._load_raw_config()
+        self.compiled_schema = load_compiled_schema(self.schema_path)
+        config = self._load_and_validate_config(self.raw_config, self.compiled_schema)
 
-    def _load_and_validate_config(self, raw_config: dict, schema_module) -> dict:
-        """Normalizes and validates raw config against a schema."""
+        if self.cache is not None:
+            self.cache.store(self._cache_target(), cache_key, self.raw_config, config)
+        return config
+
+    def _cache_target(self):
+        """Returns what the on-disk cache is keyed on: the config file, or all layer files."""
+        return self.config_paths if self.layers is not None else self.config_path
+
+    def _load_raw_config(self) -> dict:
+        """Reads the config file, or merges the layer files, reusing unchanged layers."""
+        if self.layers is None:
+            return self._load_yaml(self.config_path)
+        # The merged tree shares structure with the per-process layer cache.
+        return deepcopy(self.layers.resolve())
+
+    def _load_and_validate_config(self, raw_config: dict, compiled_schema, templates=None) -> dict:
+        """Normalizes, interpolates and validates raw config against a compiled schema.
+
+        templates is the TemplateIndex of raw_config, if already known.
+        """
         normalized_config = normalize_config_keys(raw_config)
         try:
-            return validate_config_against_schema(normalized_config, schema_module)
-        except ValidationError:
-            raise
+            if templates is None:
+                templates = index_templates(normalized_config, compiled_schema.index)
+            if templates:
+                # resolve() copies the containers it writes into, so the raw config is untouched.
+                normalized_config = templates.resolve(normalized_config, self.environ)
+            # normalize_config_keys already built a fresh top-level dict we own.
+            validated = validate_config_against_schema(normalized_config, compiled_schema, copy=False)
+        except ValidationError as e:
+            if templates:
+                # Not swapped in, so the next refresh_environment() must retry.
+                templates.snapshot = None
+            if self.layers is None:
+                raise
+            raise ValidationError(self.layers.attribute(e.errors)) from None
+        self.templates = templates
+        return validated
 
     def _setup_logger(self):
         """Creates a logger based on config settings."""
+        from config_env_initializer.logger_setup import prepare_logger
+
         log_path = Path(self.config["log_dir"])
         use_micro = self.config["log_microseconds"]
         log_level = self.config["log_level"]
@@ -66,10 +341,10 @@ class ConfigLoader:
             log_level=log_level,
         )
 
-    def _load_auth_data(self) -> dict:
+    def _load_auth_data(self, config: dict = None) -> dict:
         """Loads and wraps sensitive auth values from *_auth_path keys."""
         auth_data = {}
-        for key, value in self.config.items():
+        for key, value in (self.config if config is None else config).items():
             if key.endswith("_auth_path"):
                 system = key.replace("_auth_path", "")
                 path = self._resolve_path(value)
@@ -98,18 +373,16 @@ class ConfigLoader:
 
     def _load_yaml(self, path: Path) -> dict:
         """Parses a YAML file and returns its dictionary contents."""
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # Deferred so that a loader served from the config cache never imports yaml.
+        from config_env_initializer.yaml_loader import load_yaml_file
+        data = load_yaml_file(path)
         if not isinstance(data, dict):
             raise ValueError("YAML config must be a dictionary at the top level.")
         return data
 
     def _load_schema_module(self, path: Path):
-        """Loads a Python schema module from a file."""
-        spec = importlib.util.spec_from_file_location("config_schema", path)
-        schema_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(schema_module)
-        return schema_module
+        """Loads a Python schema module from a file, reusing it if the file is unchanged."""
+        return load_schema_module(path)
 
     def get_masked_config(self) -> dict:
         """Returns the config with sensitive values masked for logging."""
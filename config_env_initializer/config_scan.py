@@ -0,0 +1,127 @@
+"""Single-pass scan of a nested config for placeholder strings and sensitive values."""
+
+import re
+from typing import Dict, NamedTuple, Tuple
+
+from config_env_initializer.config_validator import is_placeholder
+from config_env_initializer.sensitive import SensitiveValue
+
+AUTH_KEY = "auth"
+
+_PATH_SEGMENT = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+# Leaf types that can hold neither a placeholder nor a secret.
+_PLAIN_SCALARS = frozenset((int, float, bool, type(None)))
+
+
+class ConfigScan(NamedTuple):
+    """Paths found by scan_config, each a tuple of dict keys and list indices.
+
+    `placeholders` maps each path holding an unresolved placeholder to its
+    string; `sensitive` lists the paths whose values must be masked.
+    `by_prefix` groups the placeholders under every path that leads to one,
+    so looking up a subtree doesn't walk all of them.
+    """
+
+    placeholders: Dict[tuple, str]
+    sensitive: Tuple[tuple, ...]
+    by_prefix: Dict[tuple, Dict[tuple, str]] = {}
+
+    def placeholders_under(self, prefix: tuple) -> Dict[tuple, str]:
+        """Returns the placeholder paths at or below prefix."""
+        if not prefix:
+            return self.placeholders
+        return self.by_prefix.get(prefix, {})
+
+
+def format_path(path: tuple) -> str:
+    """Renders a path tuple as `a.b[0].c`."""
+    rendered = ""
+    for segment in path:
+        if isinstance(segment, int):
+            rendered += f"[{segment}]"
+        else:
+            rendered = f"{rendered}.{segment}" if rendered else str(segment)
+    return rendered
+
+
+def parse_path(text: str) -> tuple:
+    """Parses a path rendered by format_path (`a.b[0].c`) back into a tuple."""
+    return tuple(
+        int(index) if index else key
+        for key, index in _PATH_SEGMENT.findall(text)
+    )
+
+
+def _link_path(prefix: tuple, link, segment) -> tuple:
+    """Rebuilds the path of segment inside the container reached through link."""
+    segments = [segment]
+    while link is not None:
+        link, parent_segment = link
+        segments.append(parent_segment)
+    return prefix + tuple(reversed(segments))
+
+
+def _children(value):
+    """The (key, item) pairs of a dict, list or tuple, or None for anything else."""
+    if isinstance(value, dict):
+        return iter(value.items())
+    if isinstance(value, (list, tuple)):
+        return enumerate(value)
+    return None
+
+
+def scan_config(config, prefix: tuple = ()) -> ConfigScan:
+    """Walks a config once, iteratively, recording placeholder and sensitive paths.
+
+    SensitiveValue instances anywhere are sensitive, as is each provider
+    under the top-level `auth` mapping; sensitive values are not descended
+    into. When scanning a subtree, prefix must be its path in the whole
+    config: it is prepended to every path and decides what is top-level.
+    Containers are linked to their parents rather than given a path, so a
+    path is only built for a value that is recorded.
+    """
+    placeholders = {}
+    by_prefix = {}
+    sensitive = []
+
+    def record_placeholder(path, value):
+        placeholders[path] = value
+        for depth in range(1, len(path) + 1):
+            by_prefix.setdefault(path[:depth], {})[path] = value
+
+    children = _children(config)
+    if children is None:
+        if isinstance(config, SensitiveValue):
+            sensitive.append(prefix)
+        elif is_placeholder(config):
+            record_placeholder(prefix, config)
+        return ConfigScan(placeholders, tuple(sensitive), by_prefix)
+    if prefix == (AUTH_KEY,) and isinstance(config, dict):
+        return ConfigScan(placeholders, tuple(prefix + (name,) for name in config), by_prefix)
+
+    # Each entry is a container's pending items and its link, (parent link, segment).
+    stack = [(children, None)]
+    at_top = not prefix
+    while stack:
+        items, link = stack[-1]
+        for segment, value in items:
+            if type(value) in _PLAIN_SCALARS:
+                continue
+            if isinstance(value, str):
+                if "<" in value and is_placeholder(value):
+                    record_placeholder(_link_path(prefix, link, segment), value)
+            elif isinstance(value, SensitiveValue):
+                sensitive.append(_link_path(prefix, link, segment))
+            elif isinstance(value, dict):
+                if at_top and link is None and segment == AUTH_KEY:
+                    sensitive.extend((AUTH_KEY, name) for name in value)
+                    continue
+                stack.append((iter(value.items()), (link, segment)))
+                break
+            elif isinstance(value, (list, tuple)):
+                stack.append((enumerate(value), (link, segment)))
+                break
+        else:
+            stack.pop()
+    return ConfigScan(placeholders, tuple(sensitive), by_prefix)
@@ -1,23 +1,19 @@
 from pathlib import Path
 from datetime import datetime, timezone
-import importlib.util
-import sys
-import yaml
+from operator import attrgetter
+from typing import Callable, NamedTuple, Optional
 
-from config_env_initializer.config_validator import is_placeholder, REQUIRED_PLACEHOLDER, OPTIONAL_PLACEHOLDER
+from config_env_initializer.config_validator import (
+    DEFAULT_VALIDATOR_COST, EXPENSIVE_VALIDATOR_COST, is_placeholder, REQUIRED_PLACEHOLDER, OPTIONAL_PLACEHOLDER,
+)
+from config_env_initializer.config_scan import format_path, scan_config
+from config_env_initializer.schema_registry import load_schema_module
+from config_env_initializer.fingerprint import content_hash, schema_digest
 
 
 def import_schema_module(schema_path: Path):
-    """Dynamically import the schema module."""
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-    spec = importlib.util.spec_from_file_location("schema_module", schema_path)
-    schema_module = importlib.util.module_from_spec(spec)
-    sys.modules["schema_module"] = schema_module
-    spec.loader.exec_module(schema_module)
-
-    return schema_module
+    """Import the schema module through the per-process schema registry."""
+    return load_schema_module(schema_path)
 
 
 def import_schema(schema_path: Path):
@@ -28,18 +24,98 @@ def import_schema(schema_path: Path):
 
 
 def import_validators(schema_path: Path):
+    schema_module = import_schema_module(schema_path)
+    return _collect_validators(schema_module)
+
+
+def _collect_validators(schema_module) -> dict:
+    """Merges built-in validators with a schema module's `custom_validators`."""
     from config_env_initializer.config_validator import ConfigValidator
     base_validators = ConfigValidator.get_all_validators()
-
-    schema_module = import_schema_module(schema_path)
     custom = getattr(schema_module, "custom_validators", {})
 
     return {**base_validators, **custom}
 
 
+class ValidatorCall(NamedTuple):
+    """A validator resolved by prepare_schema, or the error it always reports."""
+
+    func: Optional[Callable]
+    error: Optional[str] = None
+    name: str = ""
+    cost: int = DEFAULT_VALIDATOR_COST
+
+
+class PreparedSchema(NamedTuple):
+    """A schema loaded once, with each key's validator specs already resolved."""
+
+    schema: dict
+    validator_calls: dict
+    digest: Optional[str] = None
+
+
+def prepare_schema(schema_path: Path = Path("schema/schema.py")) -> PreparedSchema:
+    """Loads the schema module once and resolves its validators for validate_config."""
+    schema_module = import_schema_module(schema_path)
+    if not hasattr(schema_module, "schema"):
+        raise AttributeError(f"{schema_path} must define a 'schema' dictionary")
+    validators = _collect_validators(schema_module)
+
+    # Cheapest validators first; sorted() keeps declaration order for equal costs.
+    validator_calls = {
+        key: tuple(sorted(
+            (_resolve_validator_call(spec, validators) for spec in rules.get("validators", [])),
+            key=attrgetter("cost"),
+        ))
+        for key, rules in schema_module.schema.items()
+    }
+    return PreparedSchema(schema_module.schema, validator_calls, schema_digest(schema_module))
+
+
+def _resolve_validator_call(validator_spec, validators: dict) -> ValidatorCall:
+    """Resolves one validator spec, instantiating parameterized factories."""
+    if isinstance(validator_spec, str):
+        if validator_spec not in validators and not _load_plugin(validator_spec, validators):
+            return ValidatorCall(None, f"unknown validator '{validator_spec}'")
+        return ValidatorCall(validators[validator_spec], name=validator_spec, cost=_validator_cost(validator_spec))
+
+    if isinstance(validator_spec, dict):
+        name = validator_spec.get("name")
+        if name not in validators and not _load_plugin(name, validators):
+            return ValidatorCall(None, f"unknown validator '{name}'")
+        try:
+            return ValidatorCall(
+                validators[name](**{k: v for k, v in validator_spec.items() if k != "name"}),
+                name=name,
+                cost=_validator_cost(name),
+            )
+        except Exception as e:
+            return ValidatorCall(None, f"validation error - {e}")
+
+    return ValidatorCall(None, f"invalid validator spec: {validator_spec}")
+
+
+def _validator_cost(name) -> int:
+    """Returns the registered cost hint for a validator name."""
+    from config_env_initializer.config_validator import ConfigValidator
+    return ConfigValidator.get_validator_options(name)["cost"]
+
+
+def _load_plugin(name, validators: dict) -> bool:
+    """Adds an entry-point validator to validators on first reference; False if none provides name."""
+    from config_env_initializer.validator_plugins import load_plugin_validator
+    validator = load_plugin_validator(name)
+    if validator is None:
+        return False
+    validators[name] = validator
+    return True
+
+
 
 def generate_config(schema_path: Path = Path("schema/schema.py")):
     """Generates a config YAML file based on the provided schema."""
+    import yaml
+
     try:
         print(f"Loading schema from: {schema_path}")
         schema = import_schema(schema_path)
@@ -86,23 +162,78 @@ def generate_config(schema_path: Path = Path("schema/schema.py")):
 
     print(f"Generated config written to: {output_file}")
 
-def validate_config(config_path: Path, schema_path: Path = Path("schema/schema.py")):
-    """Validate a config YAML file against the schema and return a list of error strings."""
+def check_max_errors(max_errors: Optional[int]) -> Optional[int]:
+    """Returns max_errors, raising ValueError unless it is None or at least 1."""
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1, got {max_errors}.")
+    return max_errors
+
+
+def validate_config(
+    config_path: Path,
+    schema_path: Path = Path("schema/schema.py"),
+    prepared_schema: PreparedSchema = None,
+    profile=None,
+    max_errors: Optional[int] = None,
+    ledger=None,
+):
+    """Validate a config YAML file against the schema and return a list of error strings.
+
+    Pass a PreparedSchema to validate many files without reloading the schema,
+    and a ValidationProfile to record the timing of each validator call.
+    With max_errors, validation stops once that many errors were found.
+    With a ValidationLedger, a config file whose contents were already
+    validated against the same schema and validators is not parsed or
+    validated again; profiling bypasses the ledger.
+    """
+    check_max_errors(max_errors)
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
+    if prepared_schema is None:
+        prepared_schema = prepare_schema(schema_path)
+
+    data = config_path.read_bytes()
+    scope = None
+    if ledger is not None and profile is None:
+        # Deferred so that sqlite3 is only imported by callers that use a ledger.
+        from config_env_initializer.validation_ledger import ledger_scope
+        scope = ledger_scope(prepared_schema.schema, prepared_schema.digest)
+    if scope is not None:
+        config_hash = content_hash(data)
+        entry = ledger.lookup(scope, config_hash)
+        if entry is not None:
+            return entry.errors[:max_errors]
+
+    from config_env_initializer.yaml_loader import safe_load
+    config = safe_load(data) or {}
+    errors = validate_config_data(config, prepared_schema, profile=profile, max_errors=max_errors)
+    if scope is not None and (max_errors is None or len(errors) < max_errors):
+        ledger.record(scope, config_hash, errors)
+    return errors
+
 
-    schema = import_schema(schema_path)
-    validators = import_validators(schema_path)
+def validate_config_data(
+    config: dict, prepared_schema: PreparedSchema, profile=None, max_errors: Optional[int] = None,
+):
+    """Validate an already-loaded config dictionary and return a list of error strings.
 
+    Validators run cheapest first, and ones costing EXPENSIVE_VALIDATOR_COST
+    or more are skipped for a key that already has an error. Placeholders
+    nested anywhere inside a value are found by one scan of the whole config.
+    """
+    check_max_errors(max_errors)
     errors = []
+    scan = scan_config(config)
+    placeholders = scan.placeholders
 
-    for key, rules in schema.items():
+    for key, rules in prepared_schema.schema.items():
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+        key_error_count = len(errors)
         value = config.get(key, None)
 
-        if is_placeholder(value):
+        if (key,) in placeholders:
             errors.append(f"{key}: contains placeholder value '{value}', must be replaced")
             continue
 
@@ -116,29 +247,23 @@ def validate_config(config_path: Path, schema_path: Path = Path("schema/schema.p
         if expected_type and not isinstance(value, expected_type):
             errors.append(f"{key}: expected {expected_type.__name__}, got {type(value).__name__}")
 
-        for validator_spec in rules.get("validators", []):
+        if isinstance(value, (dict, list, tuple)):
+            for path, placeholder in scan.placeholders_under((key,)).items():
+                errors.append(f"{format_path(path)}: contains placeholder value '{placeholder}', must be replaced")
+
+        for call in prepared_schema.validator_calls[key]:
+            if call.cost >= EXPENSIVE_VALIDATOR_COST and len(errors) > key_error_count:
+                continue
+            if call.error is not None:
+                errors.append(f"{key}: {call.error}")
+                continue
+            func = call.func if profile is None else profile.timed(call.func, key, call.name)
             try:
-                if isinstance(validator_spec, str):
-                    if validator_spec not in validators:
-                        errors.append(f"{key}: unknown validator '{validator_spec}'")
-                        continue
-                    validators[validator_spec](value, key=key)
-
-                elif isinstance(validator_spec, dict):
-                    name = validator_spec.get("name")
-                    if name not in validators:
-                        errors.append(f"{key}: unknown validator '{name}'")
-                        continue
-                    validator_func = validators[name](**{k: v for k, v in validator_spec.items() if k != "name"})
-                    validator_func(value, key=key)
-
-                else:
-                    errors.append(f"{key}: invalid validator spec: {validator_spec}")
-
+                func(value, key=key)
             except Exception as e:
                 errors.append(f"{key}: validation error - {e}")
 
-    return errors
+    return errors[:max_errors]
 
 
 def normalize_config_keys(config: dict) -> dict:
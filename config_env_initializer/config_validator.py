@@ -3,18 +3,64 @@
 from pathlib import Path
 import platform
 
+from config_env_initializer.string_rules import compile_pattern, forbidden_chars_search, string_rule
+
 REQUIRED_PLACEHOLDER = "<REQUIRED>"
 OPTIONAL_PLACEHOLDER = "<OPTIONAL>"
 
 
 def is_placeholder(value: str) -> bool:
     """Checks if a value is a placeholder string like '<REQUIRED>'."""
-    return isinstance(value, str) and value.strip().startswith("<") and value.strip().endswith(">")
+    if not isinstance(value, str):
+        return False
+    value = value.strip()
+    return value.startswith("<") and value.endswith(">")
+
+
+# Relative cost hints: validators run cheapest first, and validators costing
+# EXPENSIVE_VALIDATOR_COST or more are skipped for values that already failed.
+DEFAULT_VALIDATOR_COST = 1
+EXPENSIVE_VALIDATOR_COST = 10
+
+DEFAULT_VALIDATOR_OPTIONS = {
+    "io_bound": False, "cacheable": False, "ttl": None, "file_based": False, "volatile": False,
+    "cost": DEFAULT_VALIDATOR_COST,
+}
+
+# Shared by valid_filename_string and its bulk variant in sequence_validation.
+FORBIDDEN_FILENAME_CHARS = r'<>:"/\\|?*\0'  # includes null byte
+WINDOWS_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL",
+    *(f"COM{i}" for i in range(1, 10)),
+    *(f"LPT{i}" for i in range(1, 10)),
+})
+EXCEL_TAB_INVALID_CHARS = r':\\/?*[]'
+EXCEL_TAB_MAX_LENGTH = 31
+
+# Compiled once; each check is a single C-level regex scan.
+_find_forbidden_filename_char = forbidden_chars_search(FORBIDDEN_FILENAME_CHARS)
+_is_plain_excel_tab_name = string_rule(EXCEL_TAB_INVALID_CHARS, 1, EXCEL_TAB_MAX_LENGTH)
 
 
 class ConfigValidator:
     """Provides a library of reusable schema validation functions."""
 
+    # Registration options for built-in validators, see CustomValidator.register.
+    _builtin_options = {
+        "file_exists": {
+            "io_bound": True, "cacheable": True, "file_based": True, "volatile": True, "cost": EXPENSIVE_VALIDATOR_COST,
+        },
+    }
+
+    @classmethod
+    def get_validator_options(cls, name) -> dict:
+        """Returns the registration options (io_bound, cacheable, ...) for a validator name."""
+        if name in CustomValidator._options:
+            options = CustomValidator._options[name]
+        else:
+            options = ConfigValidator._builtin_options.get(name, {})
+        return {**DEFAULT_VALIDATOR_OPTIONS, **options}
+
     @classmethod
     def get_all_validators(cls):
         """Returns a dict of all public built-in validator methods."""
@@ -38,13 +84,13 @@ class ConfigValidator:
             return validator
 
         if isinstance(validator, str):
-            if validator not in all_validators:
+            if validator not in all_validators and not cls._load_plugin(validator, all_validators):
                 raise ValueError(f"Unknown validator: '{validator}'")
             return all_validators[validator]
 
         if isinstance(validator, dict):
             name = validator.get("name")
-            if name not in all_validators:
+            if name not in all_validators and not cls._load_plugin(name, all_validators):
                 raise ValueError(f"Unknown validator name: '{name}'")
             factory = all_validators[name]
             kwargs = {k: v for k, v in validator.items() if k != "name"}
@@ -55,6 +101,15 @@ class ConfigValidator:
 
         raise ValueError(f"Invalid validator format: {validator}")
 
+    @staticmethod
+    def _load_plugin(name, all_validators) -> bool:
+        """Adds an entry-point validator to all_validators on first reference."""
+        from config_env_initializer.validator_plugins import load_plugin_validator
+        validator = load_plugin_validator(name)
+        if validator is not None:
+            all_validators[name] = validator
+        return validator is not None
+
     @classmethod
     def apply_validators(cls, value, key, validators):
         """Applies a list of validators to a config value."""
@@ -103,6 +158,18 @@ class ConfigValidator:
                 raise ValueError(f"{key}={value} not in range [{min_value}, {max_value}]")
         return validator
 
+    @staticmethod
+    def regex_match(*, pattern: str, flags: int = 0):
+        """Returns a validator ensuring a string fully matches a regex pattern."""
+        fullmatch = compile_pattern(pattern, flags).fullmatch
+
+        def validator(value, key=None):
+            if not isinstance(value, str):
+                raise ValueError(f"{key} must be a string.")
+            if not fullmatch(value):
+                raise ValueError(f"{key} must match pattern '{pattern}'. Got: '{value}'")
+        return validator
+
     @staticmethod
     def string_in_string(substring):
         """Returns a validator function that checks if substring is in the value."""
@@ -130,14 +197,14 @@ class ConfigValidator:
         """Validates a value is a valid Excel sheet name."""
         if not isinstance(value, str):
             raise ValueError(f"{key} must be a string.")
+        if _is_plain_excel_tab_name(value) and not value.isspace():
+            return
         if not value.strip():
             raise ValueError(f"{key} cannot be empty or whitespace.")
-        if len(value) > 31:
+        if len(value) > EXCEL_TAB_MAX_LENGTH:
             raise ValueError(f"{key} exceeds 31-character limit: '{value}'")
-        invalid_chars = set(r':\\/?*[]')
-        if any(c in value for c in invalid_chars):
-            raise ValueError(f"{key} contains invalid characters: {invalid_chars} — Got: '{value}'")
-        
+        invalid_chars = set(EXCEL_TAB_INVALID_CHARS)
+        raise ValueError(f"{key} contains invalid characters: {invalid_chars} — Got: '{value}'")
 
     @staticmethod
     def valid_filename_string(value, key=None):
@@ -152,19 +219,13 @@ class ConfigValidator:
             raise ValueError(f"{label} must not be empty or whitespace.")
         
         # Check for forbidden characters
-        forbidden_chars = r'<>:"/\\|?*\0'  # includes null byte
-        if any(c in value for c in forbidden_chars):
-            raise ValueError(f"{label} contains forbidden characters: {forbidden_chars}")
+        if _find_forbidden_filename_char(value):
+            raise ValueError(f"{label} contains forbidden characters: {FORBIDDEN_FILENAME_CHARS}")
         
         # Windows reserved filenames (case-insensitive)
         if platform.system() == "Windows":
-            reserved_names = {
-                "CON", "PRN", "AUX", "NUL",
-                *(f"COM{i}" for i in range(1, 10)),
-                *(f"LPT{i}" for i in range(1, 10)),
-            }
             name_without_ext = value.split('.')[0].upper()
-            if name_without_ext in reserved_names:
+            if name_without_ext in WINDOWS_RESERVED_NAMES:
                 raise ValueError(f"{label} is a reserved filename on Windows: '{value}'")
         
         return True
@@ -218,13 +279,45 @@ class CustomValidator(ConfigValidator):
     """Supports user-registered custom validators by name."""
 
     _registry = {}
+    _options = {}
+    _version = 0
 
     @classmethod
-    def register(cls, name=None):
-        """Registers a custom validator with an optional name override."""
+    def register(
+        cls, name=None, io_bound=False, pure=False, cacheable=False, ttl=None, file_based=False, volatile=False, cost=None,
+    ):
+        """Registers a custom validator with an optional name override.
+
+        Mark validators that wait on the filesystem or network with
+        io_bound=True so they run concurrently during validation. `async def`
+        validators are treated as I/O-bound automatically.
+
+        Outcomes of pure validators (result depends only on key and value) are
+        memoized for the life of the process. cacheable=True memoizes for ttl
+        seconds instead, and file_based=True treats the value as a path and
+        invalidates the entry when its mtime, inode or size changes.
+
+        volatile=True marks a validator whose outcome can change while the
+        value stays the same (it reads the clock, the environment or a remote
+        service), so a validation ledger never records schemas that use it.
+        file_based validators are always volatile.
+
+        cost is a relative hint (default 1, or EXPENSIVE_VALIDATOR_COST for
+        io_bound validators) used to run cheap validators first and to skip
+        expensive ones for values that have already failed a check.
+        """
         def decorator(func):
             method_name = name or func.__name__
             cls._registry[method_name] = staticmethod(func)
+            cls._options[method_name] = {
+                "io_bound": io_bound,
+                "cacheable": pure or cacheable or file_based,
+                "ttl": None if pure else ttl,
+                "file_based": file_based,
+                "volatile": volatile or file_based,
+                "cost": cost if cost is not None else (EXPENSIVE_VALIDATOR_COST if io_bound else DEFAULT_VALIDATOR_COST),
+            }
+            CustomValidator._version += 1
             return func
         return decorator
 
@@ -232,3 +325,8 @@ class CustomValidator(ConfigValidator):
     def get_all_validators(cls):
         """Returns all registered custom validator functions."""
         return cls._registry
+
+    @classmethod
+    def get_registry_version(cls) -> int:
+        """Returns a counter that changes whenever a validator is registered."""
+        return CustomValidator._version
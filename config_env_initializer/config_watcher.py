@@ -0,0 +1,170 @@
+"""Change detection helpers used to hot-reload configs."""
+
+import os
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+# Keys ConfigLoader adds at runtime; they are carried over on reload, never diffed.
+RUNTIME_KEYS = ("logger", "execution_monitor", "log_file_name")
+
+
+class ConfigDiff(NamedTuple):
+    """Key-level differences between two validated configs."""
+
+    added: dict
+    removed: dict
+    changed: dict  # key -> (old_value, new_value)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_configs(old: dict, new: dict, ignore: Iterable[str] = RUNTIME_KEYS) -> ConfigDiff:
+    """Compares two config dicts key by key, skipping runtime-only keys."""
+    ignore = set(ignore)
+    old_items = {k: v for k, v in dict.items(old) if k not in ignore}
+    new_items = {k: v for k, v in dict.items(new) if k not in ignore}
+
+    added = {k: v for k, v in new_items.items() if k not in old_items}
+    removed = {k: v for k, v in old_items.items() if k not in new_items}
+    changed = {
+        k: (old_items[k], v)
+        for k, v in new_items.items()
+        if k in old_items and old_items[k] != v
+    }
+    return ConfigDiff(added, removed, changed)
+
+
+def auth_paths(config: dict, resolve=None) -> list:
+    """Returns the paths referenced by `*_auth_path` keys in a config."""
+    paths = []
+    for key, value in dict.items(config):
+        if key.endswith("_auth_path") and isinstance(value, (str, Path)):
+            paths.append(resolve(value) if resolve else Path(value))
+    return paths
+
+
+def _stat_signature(path: Path) -> Optional[tuple]:
+    """Returns (mtime_ns, size, inode) for a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def file_signatures(paths: Iterable[Path]) -> dict:
+    """Returns the current stat signature of each path, for seeding a FileWatcher later."""
+    return {Path(path): _stat_signature(Path(path)) for path in paths}
+
+
+class FileWatcher:
+    """Detects changes to a set of files by polling their stat signatures.
+
+    Only `os.stat` is used, so the watcher works on every platform and on
+    network filesystems where inotify-style notifications are unreliable.
+    signatures (see file_signatures) sets the baseline, e.g. as of when the
+    files were read, so changes made before the watcher existed are seen.
+    """
+
+    def __init__(self, paths: Iterable[Path], signatures: Optional[dict] = None):
+        self._snapshot = {}
+        self.set_paths(paths, signatures)
+
+    @property
+    def paths(self) -> list:
+        """The files currently being watched."""
+        return list(self._snapshot)
+
+    def set_paths(self, paths: Iterable[Path], signatures: Optional[dict] = None):
+        """Replaces the watched files, taking baselines from signatures, then from known files."""
+        snapshot = {}
+        for path in map(Path, paths):
+            if signatures is not None and path in signatures:
+                snapshot[path] = signatures[path]
+            elif path in self._snapshot:
+                snapshot[path] = self._snapshot[path]
+            else:
+                snapshot[path] = _stat_signature(path)
+        self._snapshot = snapshot
+
+    def poll(self) -> list:
+        """Returns the files that changed since the last poll and records their new state."""
+        changed = []
+        for path, signature in self._snapshot.items():
+            current = _stat_signature(path)
+            if current != signature:
+                self._snapshot[path] = current
+                changed.append(path)
+        return changed
+
+
+def watch_config_files(config_paths: Iterable[Path], schema_path: Path, report, interval: float = 1.0, stop_event=None):
+    """Validates config files, then re-validates them whenever they, the schema or their auth files change.
+
+    report(config_path, errors) is called with the list of error strings for
+    each validated file, or with an exception if validation could not run.
+    """
+    import threading
+    from config_env_initializer.config_utils import prepare_schema, validate_config
+    from config_env_initializer.yaml_loader import load_yaml_file
+
+    stop_event = stop_event or threading.Event()
+    config_paths = [Path(path) for path in config_paths]
+    schema_path = Path(schema_path)
+    dependencies = {}
+    prepared_schema = None
+
+    def validate(config_path: Path):
+        try:
+            errors = validate_config(config_path, prepared_schema=prepared_schema)
+        except Exception as e:
+            errors = e
+        try:
+            config = load_yaml_file(config_path)
+            dependencies[config_path] = auth_paths(config) if isinstance(config, dict) else []
+        except Exception:
+            dependencies[config_path] = []
+        report(config_path, errors)
+
+    def load_schema():
+        nonlocal prepared_schema
+        try:
+            prepared_schema = prepare_schema(schema_path)
+        except Exception as e:
+            prepared_schema = None
+            for config_path in config_paths:
+                report(config_path, e)
+            return False
+        return True
+
+    def watched():
+        paths = {schema_path, *config_paths}
+        for auth_files in dependencies.values():
+            paths.update(auth_files)
+        return paths
+
+    if load_schema():
+        for config_path in config_paths:
+            validate(config_path)
+
+    watcher = FileWatcher(watched())
+    while not stop_event.wait(interval):
+        changed = set(watcher.poll())
+        if not changed:
+            continue
+        if schema_path in changed:
+            if load_schema():
+                targets = config_paths
+            else:
+                targets = []
+        elif prepared_schema is None:
+            targets = []
+        else:
+            targets = [
+                path for path in config_paths
+                if path in changed or changed.intersection(dependencies.get(path, ()))
+            ]
+        for config_path in targets:
+            validate(config_path)
+        watcher.set_paths(watched())
@@ -0,0 +1,95 @@
+"""Client for the validation daemon (see validation_daemon), importing only the standard library.
+
+`validate-config --daemon` runs on every editor save or commit hook, so this
+module stays free of yaml and the validation code: asking a running daemon
+costs interpreter startup and one socket round trip.
+"""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+SOCKET_PATH_ENV = "CONFIG_INIT_SOCKET"
+CLIENT_TIMEOUT = 30.0
+
+
+class DaemonUnavailable(ConnectionError):
+    """Raised by the client when no daemon is listening on the socket."""
+
+
+def default_socket_path() -> Path:
+    """Returns $CONFIG_INIT_SOCKET, else a socket in $XDG_RUNTIME_DIR, else one in a per-user temp directory."""
+    if os.environ.get(SOCKET_PATH_ENV):
+        return Path(os.environ[SOCKET_PATH_ENV]).expanduser()
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "config-init.sock"
+    return _fallback_socket_dir() / "daemon.sock"
+
+
+def _fallback_socket_dir() -> Path:
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return Path(tempfile.gettempdir()) / f"config-init-{user}"
+
+
+def _owned_by_us(info: os.stat_result) -> bool:
+    return not hasattr(os, "getuid") or info.st_uid == os.getuid()
+
+
+def _check_socket(path: Path):
+    """Raises DaemonUnavailable unless path is a socket owned by the current user."""
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        raise DaemonUnavailable(f"No validation daemon on {path}.") from None
+    if not stat.S_ISSOCK(info.st_mode):
+        raise DaemonUnavailable(f"{path} is not a socket.")
+    if not _owned_by_us(info):
+        raise DaemonUnavailable(f"{path} belongs to another user.")
+
+
+def request(message: dict, socket_path=None, timeout: float = CLIENT_TIMEOUT) -> dict:
+    """Sends one request to the daemon and returns its response.
+
+    Raises DaemonUnavailable if nothing is listening on the socket, or if
+    the socket is not owned by the current user.
+    """
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("Unix domain sockets are not available on this platform.")
+    _check_socket(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailable(f"No validation daemon on {socket_path}: {e}") from None
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise DaemonUnavailable(f"The validation daemon on {socket_path} closed the connection.")
+    return json.loads(line)
+
+
+def validate_with_daemon(config_path, schema_path, max_errors: Optional[int] = None, socket_path=None) -> List[str]:
+    """Validates a config file in the daemon and returns its errors, like validate_config.
+
+    Raises DaemonUnavailable if no daemon is running, and RuntimeError if the
+    daemon could not validate the file.
+    """
+    response = request(
+        {
+            "op": "validate",
+            "config": str(Path(config_path).expanduser().resolve()),
+            "schema": str(Path(schema_path).expanduser().resolve()),
+            "max_errors": max_errors,
+        },
+        socket_path,
+    )
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "Validation daemon error."))
+    return response["errors"]
@@ -0,0 +1,192 @@
+"""Schemas declared in YAML, JSON or TOML files instead of Python modules.
+
+A declarative schema file holds a `schema` mapping, with types written as
+names, plus optional project settings such as `project_dirs`:
+
+    schema:
+      name: {type: str, required: true, validators: [is_non_empty_str]}
+      port: {type: int, required: true, validators: [{name: int_in_range, min_value: 1, max_value: 65535}]}
+      timeout: {type: [int, float], required: false, default: 30}
+    project_dirs: [data, output]
+
+Loading one never executes code. Given a cache directory (or
+$CONFIG_INIT_SCHEMA_CACHE, for schemas loaded through the registry), the
+parsed file is kept there as JSON, keyed by its SHA-256, so repeated runs
+skip the YAML or TOML parse. Type names are resolved again on every load;
+the cache holds only plain data.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from config_env_initializer.exceptions import ValidationError
+
+SCHEMA_CACHE_VERSION = 2
+SCHEMA_CACHE_DIR_ENV = "CONFIG_INIT_SCHEMA_CACHE"
+
+DECLARATIVE_SCHEMA_SUFFIXES = {".yaml": "yaml", ".yml": "yaml", ".json": "json", ".toml": "toml"}
+
+TYPE_NAMES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "tuple": tuple,
+    "any": None,
+}
+
+
+class DeclarativeSchema:
+    """A schema read from a data file, exposing the attributes of a schema module."""
+
+    def __init__(self, path, attributes: dict):
+        self.__file__ = str(path)
+        self.__dict__.update(attributes)
+
+    def __repr__(self):
+        return f"<DeclarativeSchema {self.__file__}>"
+
+
+def is_declarative_schema(path) -> bool:
+    """True if path names a YAML, JSON or TOML schema file."""
+    return Path(path).suffix.lower() in DECLARATIVE_SCHEMA_SUFFIXES
+
+
+def schema_cache_path(cache_dir, digest: str) -> Path:
+    """Returns the cache file for schema contents with the given SHA-256 hex digest."""
+    return Path(cache_dir).expanduser() / f"schema-{digest[:32]}.json"
+
+
+def load_declarative_schema(path, cache_dir=None) -> DeclarativeSchema:
+    """Loads a declarative schema; with cache_dir, reuses the parse of identical contents.
+
+    Raises ValidationError if the file has no `schema` mapping or names an
+    unknown type.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+
+    parsed = _read_cache(cache_dir, digest) if cache_dir else None
+    if parsed is None:
+        parsed = _parse(path, data)
+        if cache_dir:
+            _write_cache(cache_dir, digest, parsed)
+    return DeclarativeSchema(path, resolve_schema_data(parsed, path))
+
+
+def _parse(path: Path, data: bytes):
+    """Parses the file contents according to its suffix."""
+    file_format = DECLARATIVE_SCHEMA_SUFFIXES[path.suffix.lower()]
+    if file_format == "json":
+        return json.loads(data)
+    if file_format == "toml":
+        return _toml_loads(data.decode("utf-8"))
+    from config_env_initializer.yaml_loader import safe_load
+    return safe_load(data)
+
+
+def _toml_loads(text: str):
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("TOML schemas need Python 3.11+ or the 'tomli' package.") from None
+    return tomllib.loads(text)
+
+
+def resolve_schema_data(data, source="schema file") -> dict:
+    """Validates a parsed declarative schema and replaces its type names with types.
+
+    Returns the module-style attributes: `schema` plus any other top-level
+    settings, unchanged.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("schema"), dict):
+        raise ValidationError([f"{source} must define a `schema` mapping."])
+
+    errors = []
+    attributes = dict(data)
+    attributes["schema"] = schema = {key: dict(rules) if isinstance(rules, dict) else rules for key, rules in data["schema"].items()}
+
+    stack = [(key, rules) for key, rules in reversed(list(schema.items()))]
+    while stack:
+        key, rules = stack.pop()
+        if not isinstance(rules, dict):
+            continue
+        if "type" in rules:
+            rules["type"] = _resolve_type(key, rules["type"], errors)
+
+        item_rules = rules.get("items")
+        if isinstance(item_rules, dict):
+            rules["items"] = item_rules = dict(item_rules)
+            stack.append((f"{key}[]", item_rules))
+
+        nested_schema = rules.get("schema")
+        if isinstance(nested_schema, dict):
+            rules["schema"] = nested_schema = {
+                child_key: dict(child_rules) if isinstance(child_rules, dict) else child_rules
+                for child_key, child_rules in nested_schema.items()
+            }
+            stack.extend(
+                (f"{key}.{child_key}", child_rules) for child_key, child_rules in reversed(list(nested_schema.items()))
+            )
+
+    if errors:
+        raise ValidationError(errors)
+    return attributes
+
+
+def _resolve_type(key, type_name, errors: list):
+    """Maps a type name, or a list of names, to a type or tuple of types."""
+    if isinstance(type_name, list):
+        types = tuple(_resolve_type(key, name, errors) for name in type_name)
+        return None if None in types else types
+    if type_name is None:
+        return None
+    if isinstance(type_name, str) and type_name in TYPE_NAMES:
+        return TYPE_NAMES[type_name]
+    errors.append(f"[{key}] Unknown type name {type_name!r}; expected one of: {', '.join(TYPE_NAMES)}.")
+    return None
+
+
+def _read_cache(cache_dir, digest: str):
+    try:
+        with open(schema_cache_path(cache_dir, digest), "rb") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != [SCHEMA_CACHE_VERSION, digest]:
+        return None
+    return entry.get("data")
+
+
+def _write_cache(cache_dir, digest: str, parsed) -> bool:
+    """Writes the cache atomically; returns False if the data isn't plain JSON or can't be written."""
+    try:
+        payload = json.dumps({"key": [SCHEMA_CACHE_VERSION, digest], "data": parsed})
+    except (TypeError, ValueError):
+        return False
+    if json.loads(payload)["data"] != parsed:
+        # e.g. tuples or non-string keys, which JSON would silently change.
+        return False
+
+    cache_path = schema_cache_path(cache_dir, digest)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    return True
@@ -0,0 +1,62 @@
+"""Content fingerprints for files and config values."""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from config_env_initializer.sensitive import SensitiveValue
+
+_schema_digests = {}
+
+
+def file_fingerprint(path: Path) -> tuple:
+    """Returns (path, mtime_ns, size, sha256 hex digest) identifying a file's current contents."""
+    path = Path(path)
+    stat = path.stat()
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    return (str(path), stat.st_mtime_ns, stat.st_size, digest)
+
+
+def value_fingerprint(value, unmask: bool = False):
+    """Returns a hashable, type-aware snapshot of a config value.
+
+    Two values share a fingerprint only if they are equal and have the same
+    types at every level, so `1`, `1.0` and `True` are kept apart. With
+    unmask=True, SensitiveValues are replaced by their contents, so the
+    repr of the fingerprint tells secrets apart.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, value_fingerprint(item, unmask)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(value_fingerprint(item, unmask) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(value_fingerprint(item, unmask) for item in value))
+    if unmask and isinstance(value, SensitiveValue):
+        return (SensitiveValue, value_fingerprint(value.get(), unmask))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return (type(value), value)
+
+
+def content_hash(data: bytes) -> str:
+    """Returns the SHA-256 hex digest of raw config or schema file contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def schema_digest(schema_module) -> Optional[str]:
+    """Returns the content hash of the file a schema was loaded from, or None if it has none."""
+    schema_file = getattr(schema_module, "__file__", None)
+    if not schema_file:
+        return None
+    path = Path(schema_file)
+    try:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _schema_digests.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = _schema_digests[path] = (stamp, content_hash(path.read_bytes()))
+    except OSError:
+        return None
+    return cached[1]
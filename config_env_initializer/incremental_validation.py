@@ -0,0 +1,101 @@
+"""Incremental re-validation that reuses validator results for unchanged values."""
+
+from typing import Iterable
+
+from config_env_initializer.config_validator import ConfigValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.fingerprint import value_fingerprint
+from config_env_initializer.schema_utils import (
+    _MISSING,
+    CompiledSchema,
+    ValidatedConfig,
+    _validate_key,
+    compile_schema,
+)
+from config_env_initializer.sequence_validation import split_each
+
+
+class IncrementalValidator:
+    """Validates successive versions of a config, re-running only validators whose input changed.
+
+    Each top-level key's outcome (errors and the value with defaults applied,
+    including anything nested under it) is memoized with the fingerprint of
+    the input value. Keys whose value is unchanged reuse that outcome without
+    running any validator. Keys using a volatile validator are never
+    memoized, because its outcome depends on more than the value itself.
+    Validators registered as io_bound, file_based or volatile (such as
+    `file_exists`) are volatile, as is any validator named in `always_rerun`.
+    """
+
+    def __init__(self, schema_module, always_rerun: Iterable[str] = ()):
+        if not isinstance(schema_module, CompiledSchema):
+            schema_module = compile_schema(schema_module)
+        self.compiled_schema = schema_module
+        self.always_rerun = frozenset(always_rerun)
+        self.hits = 0
+        self.misses = 0
+        self.last_validated = None
+        self.last_errors = []
+        self._results = {}
+        self._volatile = {plan.key for plan in schema_module.plans if self._uses_volatile(plan)}
+
+    def validate(self, config: dict) -> dict:
+        """Validates config like validate_config_against_schema, reusing earlier results."""
+        validated = ValidatedConfig(config)
+        errors = []
+        results = {}
+
+        for plan in self.compiled_schema.plans:
+            key = plan.key
+            value = validated.get(key, None)
+            fingerprint = value_fingerprint(value)
+            cached = self._results.get(key)
+
+            if cached is not None and cached[0] == fingerprint and key not in self._volatile:
+                _, key_errors, replaced, result = cached
+                if replaced:
+                    dict.__setitem__(validated, key, result)
+                self.hits += 1
+            else:
+                key_errors = []
+                _validate_key(plan, validated, key_errors)
+                result = validated.get(key, _MISSING)
+                replaced = result is not value and result is not _MISSING
+                self.misses += 1
+
+            results[key] = (fingerprint, key_errors, replaced, result)
+            errors.extend(key_errors)
+
+        self._results = results
+        self.last_errors = errors
+        if errors:
+            raise ValidationError(errors)
+
+        self.last_validated = validated
+        return validated
+
+    def clear(self):
+        """Forgets all memoized results."""
+        self._results = {}
+        self.last_validated = None
+        self.last_errors = []
+
+    def _is_volatile(self, step) -> bool:
+        """True if the step's validator outcome may change while its input does not."""
+        name = split_each(step.label)[0]
+        if step.io_bound or name in self.always_rerun:
+            return True
+        options = ConfigValidator.get_validator_options(name)
+        return options["file_based"] or options["volatile"]
+
+    def _uses_volatile(self, plan) -> bool:
+        """True if plan or anything nested under it uses a volatile validator."""
+        stack = [plan]
+        while stack:
+            current = stack.pop()
+            if any(self._is_volatile(step) for step in current.steps):
+                return True
+            stack.extend(current.children)
+            if current.item_plan is not None:
+                stack.append(current.item_plan)
+        return False
@@ -0,0 +1,227 @@
+"""Environment-variable interpolation of `${VAR}` and `${VAR:-default}` in config values.
+
+Each distinct templated string is parsed once into a CompiledTemplate.
+index_templates() records which paths of a config hold templates, so
+resolving against a different environment only re-renders those paths.
+`$${` stands for a literal `${`. As in the shell, `:-` uses the default
+when the variable is unset or empty.
+
+A value that is exactly one `${...}` can take the type YAML would give the
+substituted text written unquoted, so `port: ${PORT}` with PORT=5432 is the
+int 5432 and `debug: ${DEBUG:-false}` is a bool. Given a schema index, only
+values whose schema type does not accept a string are typed, so a token
+that happens to look like a number stays a string. Text that YAML reads as
+anything but a bool, int or float stays the substituted string, as does
+any value mixing references with literal text.
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+from config_env_initializer.config_scan import format_path
+from config_env_initializer.exceptions import ValidationError
+
+TEMPLATE_CACHE_SIZE = 1024
+
+_TOKEN = re.compile(r"\$\$\{|\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+_VARIABLE_NAME = re.compile(rb"\$\{([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class CompiledTemplate(NamedTuple):
+    """A parsed templated string: literal parts and (variable, default) pairs, in order."""
+
+    parts: tuple
+    variables: frozenset
+
+    def render(self, environ: Mapping[str, str], missing: Optional[list] = None) -> str:
+        """Substitutes variables from environ; unset ones without a default are appended to missing."""
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            name, default = part
+            value = environ.get(name)
+            if value is None or (value == "" and default is not None):
+                if default is None:
+                    if missing is not None:
+                        missing.append(name)
+                    value = ""
+                else:
+                    value = default
+            rendered.append(value)
+        return "".join(rendered)
+
+    def resolve(self, environ: Mapping[str, str], missing: Optional[list] = None):
+        """Renders the template; a lone `${...}` is typed as YAML would type it (see the module docstring)."""
+        rendered = self.render(environ, missing)
+        if len(self.parts) == 1 and not isinstance(self.parts[0], str):
+            return typed_scalar(rendered)
+        return rendered
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def typed_scalar(text: str):
+    """Returns text as a bool, int or float if YAML reads it as one unquoted, else text itself."""
+    import yaml
+
+    from config_env_initializer.yaml_loader import safe_load
+    try:
+        value = safe_load(text)
+    except yaml.YAMLError:
+        return text
+    return value if isinstance(value, (bool, int, float)) else text
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(text: str) -> Optional[CompiledTemplate]:
+    """Parses text once; returns None if it contains no `${...}` reference."""
+    parts = []
+    variables = set()
+    position = 0
+    for match in _TOKEN.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        if match.group(1) is None:
+            parts.append("${")
+        else:
+            parts.append((match.group(1), match.group(2)))
+            variables.add(match.group(1))
+        position = match.end()
+    if not variables and "$${" not in text:
+        return None
+    if position < len(text):
+        parts.append(text[position:])
+    return CompiledTemplate(tuple(parts), frozenset(variables))
+
+
+class TemplateIndex:
+    """The templated values of one config, by path, and the environment they were last resolved in.
+
+    `typed` holds the paths whose lone references are typed like YAML
+    scalars; None types them at every path.
+    """
+
+    def __init__(self, templates: Dict[tuple, CompiledTemplate], typed: Optional[frozenset] = None):
+        self.templates = templates
+        self.typed = typed
+        self.variables = frozenset(name for template in templates.values() for name in template.variables)
+        self.snapshot = None
+
+    def __repr__(self):
+        return f"<TemplateIndex paths={len(self.templates)} variables={sorted(self.variables)}>"
+
+    def __bool__(self):
+        return bool(self.templates)
+
+    def environment_snapshot(self, environ: Optional[Mapping[str, str]] = None) -> Tuple[tuple, ...]:
+        """Returns the values of the referenced variables, the only part of environ that matters."""
+        environ = os.environ if environ is None else environ
+        return tuple((name, environ.get(name)) for name in sorted(self.variables))
+
+    def changed(self, environ: Optional[Mapping[str, str]] = None) -> bool:
+        """True if a referenced variable differs from the last resolve()."""
+        return self.snapshot != self.environment_snapshot(environ)
+
+    def resolve(self, config: dict, environ: Optional[Mapping[str, str]] = None) -> dict:
+        """Returns config with every templated path rendered, copying only the containers on those paths.
+
+        Raises ValidationError naming each path that references an unset
+        variable without a default.
+        """
+        environ = os.environ if environ is None else environ
+        errors = []
+        resolved = dict(config)
+        copied = {id(resolved)}
+        for path, template in self.templates.items():
+            container = resolved
+            for segment in path[:-1]:
+                child = container[segment]
+                if id(child) not in copied:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    copied.add(id(child))
+                    container[segment] = child
+                container = child
+            missing = []
+            if self.typed is None or path in self.typed:
+                container[path[-1]] = template.resolve(environ, missing)
+            else:
+                container[path[-1]] = template.render(environ, missing)
+            errors.extend(
+                f"[{format_path(path)}] Environment variable '{name}' is not set and has no default."
+                for name in missing
+            )
+        if errors:
+            raise ValidationError(errors)
+        self.snapshot = self.environment_snapshot(environ)
+        return resolved
+
+
+def index_templates(config, schema_index: Optional[Mapping] = None) -> TemplateIndex:
+    """Walks config once, iteratively, compiling every string that contains `${`.
+
+    Paths are recorded in document order, so errors come out in that order.
+    schema_index is a CompiledSchema.index; with one, lone references are
+    only typed where the schema's type rejects strings.
+    """
+    templates = {}
+    stack = [((), config)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, str):
+            if "${" in value:
+                template = compile_template(value)
+                if template is not None:
+                    templates[path] = template
+        elif isinstance(value, dict):
+            stack.extend(reversed([(path + (key,), item) for key, item in value.items()]))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(reversed([(path + (index,), item) for index, item in enumerate(value)]))
+    if schema_index is None:
+        return TemplateIndex(templates)
+    typed = frozenset(path for path in templates if _rejects_strings(schema_index.get(_schema_path(path))))
+    return TemplateIndex(templates, typed)
+
+
+def _schema_path(path: tuple) -> str:
+    """Renders a config path as a CompiledSchema.index key, with `[]` for any list index."""
+    rendered = ""
+    for segment in path:
+        if isinstance(segment, int):
+            rendered += "[]"
+        else:
+            rendered = f"{rendered}.{segment}" if rendered else str(segment)
+    return rendered
+
+
+def _rejects_strings(plan) -> bool:
+    """True if a KeyPlan declares a type that a str does not satisfy."""
+    expected_type = getattr(plan, "expected_type", None)
+    if not expected_type:
+        return False
+    try:
+        return not issubclass(str, expected_type)
+    except TypeError:
+        return False
+
+
+def referenced_variables(paths) -> frozenset:
+    """Returns the variable names referenced in files, found by a byte scan without parsing them."""
+    names = set()
+    for path in paths:
+        with open(path, "rb") as f:
+            names.update(name.decode("ascii") for name in _VARIABLE_NAME.findall(f.read()))
+    return frozenset(names)
+
+
+def environment_key(names, environ: Optional[Mapping[str, str]] = None) -> str:
+    """Returns a hash of the values of the named variables, for cache keys that must track them."""
+    environ = os.environ if environ is None else environ
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        value = environ.get(name)
+        digest.update(f"{name}\0{'' if value is None else '=' + value}\0".encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,315 @@
+"""Generates straight-line Python validation code from a CompiledSchema.
+
+Every top-level key becomes a block of inline code: the default, required,
+type and placeholder checks and each validator call are written out with
+the plan's constants bound as globals, so validating runs no per-key
+dispatch at all. Nested schemas and list items are handed to the regular
+walker. The generated source only depends on the schema's shape, so its
+code object is cached by the source's SHA-256, in memory and optionally
+as a marshal file under a cache directory.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from config_env_initializer.config_utils import is_placeholder
+from config_env_initializer.config_validator import EXPENSIVE_VALIDATOR_COST
+from config_env_initializer.schema_utils import (
+    _CONTAINER_TYPES,
+    _Frame,
+    _descend,
+    _drain,
+    _join_path,
+    _report_nested_placeholders,
+    _run_validator_step,
+)
+
+CODE_CACHE_SIZE = 128
+
+_code_cache = OrderedDict()
+_code_cache_lock = threading.Lock()
+
+
+class GeneratedValidator(NamedTuple):
+    """A generated validation function and the source it was compiled from.
+
+    func(validated, errors, deferred, in_place) validates in place like the
+    walker does, appending error messages to errors.
+    """
+
+    func: Callable
+    source: str
+    digest: str
+
+
+class _SourceBuilder:
+    """Collects source lines and the constants they refer to."""
+
+    def __init__(self):
+        self.lines = []
+        self.constants = {}
+        self.indent = 1
+
+    def emit(self, line: str):
+        self.lines.append("    " * self.indent + line)
+
+    def const(self, name: str, value) -> str:
+        self.constants[name] = value
+        return name
+
+
+def generate_source(plans) -> tuple:
+    """Returns (source, constants) for a function validating the given top-level plans."""
+    builder = _SourceBuilder()
+    if any(plan.children or plan.item_plan is not None or _reports_nested(plan) for plan in plans):
+        builder.emit("root = Frame(validated, owned=True)")
+    builder.emit("get = validated.get")
+    for index, plan in enumerate(plans):
+        _emit_plan(builder, index, plan)
+    builder.emit("return None")
+    source = "def validate(validated, errors, deferred, in_place):\n" + "\n".join(builder.lines) + "\n"
+    return source, builder.constants
+
+
+def _emit_plan(builder: _SourceBuilder, i: int, plan):
+    """Emits the checks for one top-level key, mirroring _prepare_node_value and _check_node."""
+    path = _join_path("", plan.key)
+    builder.emit(f"# {path!r}")
+    if plan.error is not None:
+        builder.emit(f"errors.append({builder.const(f'_E{i}', f'[{path}] {plan.error}')})")
+        return
+
+    key = builder.const(f"_K{i}", plan.key)
+    nested = bool(plan.children) or plan.item_plan is not None
+    builder.emit(f"value = get({key}, None)")
+
+    if plan.required and plan.default is None:
+        missing = builder.const(f"_M{i}", f"[{path}] Missing required config key: '{path}'")
+        builder.emit("if value is None:")
+        builder.indent += 1
+        builder.emit(f"errors.append({missing})")
+        builder.indent -= 1
+        builder.emit("else:")
+        builder.indent += 1
+        if nested:
+            builder.emit("from_default = False")
+        _emit_value_checks(builder, i, plan, path)
+        builder.indent -= 1
+        return
+
+    if plan.default is not None:
+        default = builder.const(f"_D{i}", plan.default)
+        if nested:
+            builder.emit("from_default = value is None")
+        builder.emit("if value is None:")
+        builder.indent += 1
+        builder.emit(f"value = {default}")
+        builder.emit(f"validated[{key}] = value")
+        builder.indent -= 1
+    else:
+        if nested:
+            builder.emit("from_default = False")
+        builder.emit(f"if value is None and {key} not in validated:")
+        builder.indent += 1
+        builder.emit(f"validated[{key}] = None")
+        builder.indent -= 1
+    _emit_value_checks(builder, i, plan, path)
+
+
+def _may_be_str(expected_type) -> bool:
+    """Returns False only when the type check already rules out str values."""
+    if not expected_type:
+        return True
+    if isinstance(expected_type, type):
+        return issubclass(expected_type, str) or issubclass(str, expected_type)
+    return True
+
+
+def _reports_nested(plan) -> bool:
+    """True if a value without a nested schema may be a container holding placeholders."""
+    return not plan.children and plan.item_plan is None and _may_be_container(plan.expected_type)
+
+
+def _may_be_container(expected_type) -> bool:
+    """Returns False only when the type check already rules out dicts, lists and tuples."""
+    if not expected_type or not isinstance(expected_type, type):
+        return True
+    return any(issubclass(expected_type, t) or issubclass(t, expected_type) for t in _CONTAINER_TYPES)
+
+
+def _emit_value_checks(builder: _SourceBuilder, i: int, plan, path: str):
+    """Emits the type and placeholder checks, then the validator calls and any descent."""
+    branch = "if"
+    expected_type = plan.expected_type
+    if expected_type:
+        type_name = getattr(expected_type, "__name__", str(expected_type))
+        expected = builder.const(f"_T{i}", expected_type)
+        message = builder.const(f"_TE{i}", f"[{path}] Config key '{path}' must be of type {type_name}, but got ")
+        builder.emit(f"if not isinstance(value, {expected}):")
+        builder.indent += 1
+        builder.emit(f"errors.append({message} + type(value).__name__ + '.')")
+        builder.indent -= 1
+        branch = "elif"
+    if _may_be_str(expected_type):
+        message = builder.const(f"_PH{i}", f"[{path}] contains unresolved placeholder: ")
+        builder.emit(f"{branch} isinstance(value, str) and is_placeholder(value):")
+        builder.indent += 1
+        builder.emit(f"errors.append({message} + value)")
+        builder.indent -= 1
+        branch = "elif"
+    if _reports_nested(plan):
+        key = builder.const(f"_K{i}", plan.key)
+        builder.emit(f"{branch} isinstance(value, CONTAINER_TYPES) and report_nested(value, root, {key}, errors):")
+        builder.emit("    pass")
+        branch = "elif"
+
+    if branch == "elif":
+        builder.emit("else:")
+        builder.indent += 1
+    body_start = len(builder.lines)
+    _emit_steps(builder, i, plan, path)
+    if plan.children or plan.item_plan is not None:
+        node = builder.const(f"_P{i}", plan)
+        builder.emit(f"child = descend({node}, root, {builder.const(f'_K{i}', plan.key)}, value, from_default, errors, in_place)")
+        builder.emit("if child is not None:")
+        builder.indent += 1
+        builder.emit("drain([child], errors, in_place, deferred)")
+        builder.indent -= 1
+    if len(builder.lines) == body_start:
+        builder.emit("pass")
+    if branch == "elif":
+        builder.indent -= 1
+
+
+def _emit_steps(builder: _SourceBuilder, i: int, plan, path: str):
+    """Emits one inline call per validator step, in the plan's (cost) order."""
+    if not plan.steps:
+        return
+    key_path = builder.const(f"_KP{i}", path)
+    track_failures = any(step.cost >= EXPENSIVE_VALIDATOR_COST for step in plan.steps[1:])
+    if track_failures:
+        builder.emit("failed = False")
+
+    for j, step in enumerate(plan.steps):
+        guarded = track_failures and j > 0 and step.cost >= EXPENSIVE_VALIDATOR_COST
+        if guarded:
+            builder.emit("if not failed:")
+            builder.indent += 1
+
+        if step.error is not None:
+            builder.emit(f"errors.append({builder.const(f'_SE{i}_{j}', f'[{path}] {step.error}')})")
+            if track_failures:
+                builder.emit("failed = True")
+        else:
+            step_name = builder.const(f"_S{i}_{j}", step)
+            if step.io_bound:
+                builder.emit("if deferred is not None:")
+                builder.indent += 1
+                builder.emit(f"deferred.append((len(errors), ({step_name}, {key_path}, value)))")
+                builder.emit("errors.append(None)")
+                builder.indent -= 1
+                builder.emit("else:")
+                builder.indent += 1
+            _emit_call(builder, i, j, step, step_name, key_path, path, track_failures)
+            if step.io_bound:
+                builder.indent -= 1
+
+        if guarded:
+            builder.indent -= 1
+
+
+def _emit_call(builder: _SourceBuilder, i: int, j: int, step, step_name: str, key_path: str, path: str, track_failures: bool):
+    """Emits a direct validator call; async validators go through _run_validator_step."""
+    if step.is_async:
+        builder.emit(f"error = run_step({step_name}, {key_path}, value)")
+        builder.emit("if error is not None:")
+        builder.indent += 1
+        builder.emit("errors.append(error)")
+        if track_failures:
+            builder.emit("failed = True")
+        builder.indent -= 1
+        return
+
+    func = builder.const(f"_F{i}_{j}", step.func)
+    label = builder.const(f"_L{i}_{j}", f"[{path}] {step.label}: ")
+    call = f"{func}(value, {key_path})" if step.pass_key else f"{func}(value)"
+    builder.emit("try:")
+    builder.emit(f"    {call}")
+    builder.emit("except Exception as e:")
+    builder.emit(f"    errors.append({label} + str(e))")
+    if track_failures:
+        builder.emit("    failed = True")
+
+
+def generate_validator(plans, cache_dir=None) -> GeneratedValidator:
+    """Generates, compiles (or loads from cache) and binds the validation function for plans."""
+    source, constants = generate_source(plans)
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    code = _load_code(digest, source, cache_dir)
+
+    namespace = {
+        "__builtins__": __builtins__,
+        "Frame": _Frame,
+        "descend": _descend,
+        "drain": _drain,
+        "is_placeholder": is_placeholder,
+        "CONTAINER_TYPES": _CONTAINER_TYPES,
+        "report_nested": _report_nested_placeholders,
+        "run_step": _run_validator_step,
+        **constants,
+    }
+    exec(code, namespace)
+    return GeneratedValidator(namespace["validate"], source, digest)
+
+
+def _load_code(digest: str, source: str, cache_dir):
+    """Returns the code object for source from the memory or disk cache, compiling on a miss."""
+    with _code_cache_lock:
+        code = _code_cache.get(digest)
+        if code is not None:
+            _code_cache.move_to_end(digest)
+            return code
+
+    code = _read_code_file(digest, cache_dir) if cache_dir is not None else None
+    if code is None:
+        code = compile(source, f"<generated schema validator {digest[:12]}>", "exec")
+        if cache_dir is not None:
+            _write_code_file(digest, code, cache_dir)
+
+    with _code_cache_lock:
+        _code_cache[digest] = code
+        while len(_code_cache) > CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    return code
+
+
+def _code_file(digest: str, cache_dir) -> Path:
+    """Bytecode is only valid for the interpreter that wrote it, hence the cache tag."""
+    return Path(cache_dir).expanduser() / f"schema-{digest[:32]}.{sys.implementation.cache_tag}.marshal"
+
+
+def _read_code_file(digest: str, cache_dir):
+    try:
+        with open(_code_file(digest, cache_dir), "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_code_file(digest: str, code, cache_dir) -> Optional[Path]:
+    path = _code_file(digest, cache_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        return None
+    return path
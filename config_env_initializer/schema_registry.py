@@ -0,0 +1,110 @@
+"""Per-process registry of loaded schema modules, keyed by resolved path and mtime.
+
+The CLI, ConfigLoader and config_utils all load schema files through
+load_schema_module, so a schema (and whatever heavy modules it imports) is
+executed once per process and only re-executed after the file changes.
+Declarative YAML/JSON/TOML schemas (see declarative_schema) are read
+instead of executed.
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple, Optional
+
+SCHEMA_MODULE_NAME = "schema_module"
+
+_entries = {}
+_lock = threading.RLock()
+
+
+class _SchemaEntry(NamedTuple):
+    """A loaded schema module, the file stamp it was loaded at and its compiled form.
+
+    compiled_for is the validator registry version the schema was compiled
+    against; registering a validator afterwards makes the compiled form stale.
+    """
+
+    stamp: tuple
+    module: object
+    compiled: Optional[object] = None
+    compiled_for: Optional[int] = None
+
+
+def _stamp(path: Path) -> tuple:
+    """Returns (mtime_ns, size); a change to either means the schema must be re-executed."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _entry(schema_path) -> _SchemaEntry:
+    """Returns the up-to-date registry entry for schema_path, executing the file on a miss."""
+    path = Path(schema_path).expanduser()
+    if not path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    path = path.resolve()
+    stamp = _stamp(path)
+
+    with _lock:
+        entry = _entries.get(path)
+        if entry is None or entry.stamp != stamp:
+            # A schema that fails to load is not stored, so the next call retries it.
+            entry = _entries[path] = _SchemaEntry(stamp, _load(path))
+        return entry
+
+
+def _load(path: Path):
+    """Executes a Python schema file, or reads a declarative (YAML/JSON/TOML) one."""
+    # Deferred so that importing the registry stays cheap for callers that never load a schema.
+    from config_env_initializer.declarative_schema import (
+        SCHEMA_CACHE_DIR_ENV, is_declarative_schema, load_declarative_schema,
+    )
+
+    if is_declarative_schema(path):
+        return load_declarative_schema(path, cache_dir=os.environ.get(SCHEMA_CACHE_DIR_ENV) or None)
+    spec = importlib.util.spec_from_file_location(SCHEMA_MODULE_NAME, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _publish(module):
+    """Makes a Python schema importable as `schema_module`, as config_utils always has."""
+    if isinstance(module, ModuleType):
+        sys.modules[SCHEMA_MODULE_NAME] = module
+
+
+def load_schema_module(schema_path):
+    """Returns the schema module at schema_path, loading it only if it is new or changed.
+
+    For a declarative schema file this is a DeclarativeSchema, which has the
+    same attributes as a schema module.
+    """
+    module = _entry(schema_path).module
+    _publish(module)
+    return module
+
+
+def load_compiled_schema(schema_path):
+    """Returns the CompiledSchema for schema_path, compiled once per loaded module and validator set."""
+    from config_env_initializer.config_validator import CustomValidator
+    from config_env_initializer.schema_utils import compile_schema
+
+    with _lock:
+        entry = _entry(schema_path)
+        if entry.compiled is None or entry.compiled_for != CustomValidator.get_registry_version():
+            compiled = compile_schema(entry.module)
+            # Read after compiling, which may register validators from plugins.
+            entry = entry._replace(compiled=compiled, compiled_for=CustomValidator.get_registry_version())
+            _entries[Path(schema_path).expanduser().resolve()] = entry
+        _publish(entry.module)
+        return entry.compiled
+
+
+def clear_schema_registry():
+    """Forgets every loaded schema, so the next load re-executes the files."""
+    with _lock:
+        _entries.clear()
@@ -1,32 +1,218 @@
 """Validation logic for checking user config dictionaries against a schema."""
 
-from copy import deepcopy
-from config_env_initializer.config_validator import ConfigValidator, CustomValidator
+import os
+from copy import copy as shallow_copy, deepcopy
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Tuple
+
+from config_env_initializer.config_scan import format_path, scan_config
+from config_env_initializer.concurrent_validation import DEFAULT_IO_WORKERS, call_validator
+from config_env_initializer.config_validator import (
+    DEFAULT_VALIDATOR_COST,
+    EXPENSIVE_VALIDATOR_COST,
+    ConfigValidator,
+    CustomValidator,
+)
 from config_env_initializer.exceptions import ValidationError
-from config_env_initializer.config_utils import is_placeholder
+from config_env_initializer.fingerprint import value_fingerprint
+from config_env_initializer.schema_registry import load_schema_module
+from config_env_initializer.sequence_validation import BULK_VALIDATORS, each, split_each
+from config_env_initializer.validator_cache import cached_validator
+from config_env_initializer.validator_plugins import load_plugin_validator
+from config_env_initializer.config_utils import check_max_errors, is_placeholder
+
+
+class ValidatorStep(NamedTuple):
+    """A validator resolved at compile time, ready to be called on a value."""
+
+    label: str
+    func: Optional[Callable]
+    pass_key: bool = True
+    error: Optional[str] = None
+    io_bound: bool = False
+    is_async: bool = False
+    cost: int = DEFAULT_VALIDATOR_COST
+
+
+class KeyPlan(NamedTuple):
+    """The resolved rules for a single schema key.
+
+    `children` holds the plans of a nested `schema` for dict values and
+    `item_plan` the plan applied to every element of a list (`items`).
+    `path` is the dotted index path, with `[]` marking list elements.
+    """
+
+    key: Any
+    required: bool
+    default: Any
+    expected_type: Any
+    steps: Tuple[ValidatorStep, ...]
+    error: Optional[str] = None
+    children: Tuple["KeyPlan", ...] = ()
+    item_plan: Optional["KeyPlan"] = None
+    path: str = ""
+
+
+class ValidatedConfig(dict):
+    """Validated config that shares unchanged subtrees with the config it was built from.
+
+    Only the top-level mapping is copied; nested dicts and lists are the same
+    objects as in the input, and only keys that received defaults differ.
+    Call own(key) before mutating a nested value in place so the change does
+    not leak back into the source config.
+    """
+
+    def __init__(self, source: dict):
+        super().__init__(source)
+        self._owned = set()
+
+    def own(self, key):
+        """Replaces a shared nested value with a private deep copy (once) and returns it."""
+        if key not in self._owned:
+            dict.__setitem__(self, key, deepcopy(self[key]))
+            self._owned.add(key)
+        return self[key]
+
+
+class CompiledSchema(NamedTuple):
+    """An immutable validation plan built once from a schema module.
+
+    `index` maps every dotted schema path (e.g. `db.host`, `servers[].port`)
+    to its KeyPlan. `generated` holds the code-generated validator when the
+    schema was compiled with generate_code=True.
+    """
+
+    plans: Tuple[KeyPlan, ...]
+    schema_module: Any
+    index: Mapping[str, KeyPlan] = MappingProxyType({})
+    generated: Any = None
+
+    def validate(
+        self,
+        config: dict,
+        copy: bool = True,
+        io_workers: int = DEFAULT_IO_WORKERS,
+        io_timeout: Optional[float] = None,
+        profile=None,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> dict:
+        """Validates a config dictionary by executing the compiled plan.
+
+        By default a ValidatedConfig sharing nested values with config is
+        returned. With copy=False, defaults are written into config itself.
+
+        I/O-bound and async validators run concurrently on up to io_workers
+        threads (io_workers=1 runs everything serially); io_timeout bounds
+        each of them in seconds. Errors keep their serial order either way.
+
+        Pass a ValidationProfile as profile to time every validator call.
+
+        max_errors stops validation once that many errors were found
+        (fail_fast is max_errors=1), for callers that only need pass/fail.
+        """
+        if fail_fast:
+            max_errors = 1
+        check_max_errors(max_errors)
+        validated = ValidatedConfig(config) if copy else config
+        errors = []
+        deferred = [] if io_workers > 1 else None
+
+        if self.generated is not None and profile is None and max_errors is None:
+            self.generated.func(validated, errors, deferred, not copy)
+            stopped = False
+        else:
+            stopped = _walk_plans(
+                self.plans, validated, errors, in_place=not copy,
+                deferred=deferred, profile=profile, max_errors=max_errors,
+            )
+        if stopped:
+            # Already failed; pending I/O-bound validators can't change that.
+            errors = [error for error in errors if error is not None][:max_errors]
+        elif deferred:
+            errors = _resolve_deferred(deferred, errors, io_workers, io_timeout)[:max_errors]
+
+        if errors:
+            raise ValidationError(errors)
+
+        return validated
+
 
+def compile_schema(schema_module, generate_code: bool = False, code_cache_dir=None) -> CompiledSchema:
+    """Resolves each key's defaults, type check and validators into a CompiledSchema.
 
-def validate_config_against_schema(config: dict, schema_module) -> dict:
-    """Validates a config dictionary against a schema module."""
+    Validators are looked up and parameterized factories instantiated once, so the
+    plan reflects the validator registry at the time of compilation.
+
+    With generate_code=True the plan is also turned into generated Python
+    (see schema_codegen), which validates several times faster and pays off
+    when a schema validates many configs. code_cache_dir keeps its bytecode
+    on disk between runs. schema_module may also be the path of a Python or
+    declarative (YAML/JSON/TOML) schema file.
+    """
+    if isinstance(schema_module, (str, os.PathLike)):
+        schema_module = load_schema_module(schema_module)
     schema = _extract_schema(schema_module)
     custom_validators = CustomValidator.get_all_validators()
-    validated = deepcopy(config)
-    errors = []
+    plans = tuple(_compile_key(key, rules, custom_validators, key) for key, rules in schema.items())
+    generated = None
+    if generate_code:
+        from config_env_initializer.schema_codegen import generate_validator
+        generated = generate_validator(plans, cache_dir=code_cache_dir)
+    return CompiledSchema(plans=plans, schema_module=schema_module, index=_build_index(plans), generated=generated)
+
+
+def validate_config_against_schema(config: dict, schema_module, copy: bool = True, ledger=None, **options) -> dict:
+    """Validates a config dictionary against a schema module or CompiledSchema.
+
+    See CompiledSchema.validate for copy and the other keyword options. With
+    a ValidationLedger, a config already validated against the same schema
+    file and validators is not validated again: a recorded failure raises its
+    errors, and a recorded pass only has its defaults applied.
+    """
+    if not isinstance(schema_module, CompiledSchema):
+        schema_module = compile_schema(schema_module)
+    if ledger is None or options.get("profile") is not None:
+        return schema_module.validate(config, copy=copy, **options)
+
+    # Deferred so that sqlite3 is only imported by callers that use a ledger.
+    from config_env_initializer.validation_ledger import config_hash, ledger_scope, schema_digest
+    scope = ledger_scope(_extract_schema(schema_module.schema_module), schema_digest(schema_module.schema_module))
+    if scope is None:
+        return schema_module.validate(config, copy=copy, **options)
+
+    max_errors = check_max_errors(1 if options.get("fail_fast") else options.get("max_errors"))
+    key = config_hash(config)
+    entry = ledger.lookup(scope, key)
+    if entry is not None and not entry.valid:
+        raise ValidationError(entry.errors[:max_errors])
+    if entry is not None:
+        # Already passed: only defaults need applying, so skip the validators.
+        return CompiledSchema(_without_validators(schema_module.plans), schema_module.schema_module).validate(
+            config, copy=copy, io_workers=1,
+        )
 
-    for key, rules in schema.items():
-        try:
-            value = validated.get(key, None)
-            validated[key] = _apply_defaults_and_check_required(key, value, rules)
-            value = validated[key]
-            _check_type(key, value, rules)
-            _run_validators(key, value, rules, custom_validators, errors)
-        except Exception as e:
-            errors.append(f"[{key}] {str(e)}")
+    try:
+        validated = schema_module.validate(config, copy=copy, **options)
+    except ValidationError as e:
+        if max_errors is None or len(e.errors) < max_errors:
+            ledger.record(scope, key, e.errors)
+        raise
+    ledger.record(scope, key, [])
+    return validated
 
-    if errors:
-        raise ValidationError(errors)
 
-    return validated
+def _without_validators(plans: Tuple[KeyPlan, ...]) -> Tuple[KeyPlan, ...]:
+    """Copies plans, nested and item plans included, without their validator steps."""
+    return tuple(
+        plan._replace(
+            steps=(),
+            children=_without_validators(plan.children),
+            item_plan=_without_validators((plan.item_plan,))[0] if plan.item_plan is not None else None,
+        )
+        for plan in plans
+    )
 
 
 def _extract_schema(schema_module):
@@ -37,77 +223,402 @@ def _extract_schema(schema_module):
     return schema
 
 
-def _apply_defaults_and_check_required(key, value, rules):
-    """Applies default values or raises if a required key is missing."""
-    required = rules.get("required", False)
-    default = rules.get("default", None)
+def _lookup_validator(name, custom_validators):
+    """Returns the validator registered under name, or None if unknown.
 
-    if value is None:
-        if required and default is None:
-            raise ValueError(f"Missing required config key: '{key}'")
-        return default
+    Names that are neither registered nor built in are looked up in the
+    installed validator plugins, importing the providing module on first use.
+    """
+    if name in custom_validators:
+        validator = custom_validators[name]
+        return getattr(validator, "__func__", validator)
+    if name and hasattr(ConfigValidator, name):
+        return getattr(ConfigValidator, name)
+    return load_plugin_validator(name)
+
+
+def _validator_specs(rules):
+    """Returns the list of validator specs declared for a key."""
+    validator_specs = rules.get("validators") or []
+    if rules.get("validator") and not validator_specs:
+        validator_specs = [rules["validator"]]
+    return validator_specs
+
+
+def _compile_key(key, rules, custom_validators, path) -> KeyPlan:
+    """Builds the KeyPlan for a schema entry, including any nested schema or list items.
+
+    Nested entries are expanded with an explicit stack and assembled
+    bottom-up, so schema depth is not bounded by the recursion limit.
+    """
+    nodes = []  # (key, rules, path, parent index, is item rules)
+    stack = [(key, rules, path, None, False)]
+    while stack:
+        node = stack.pop()
+        index = len(nodes)
+        nodes.append(node)
+        node_rules, node_path = node[1], node[2]
+        if not isinstance(node_rules, dict):
+            continue
+        nested_schema = node_rules.get("schema")
+        if isinstance(nested_schema, dict):
+            for child_key, child_rules in reversed(list(nested_schema.items())):
+                stack.append((child_key, child_rules, f"{node_path}.{child_key}", index, False))
+        item_rules = node_rules.get("items")
+        if isinstance(item_rules, dict):
+            stack.append((None, item_rules, f"{node_path}[]", index, True))
+
+    children = [[] for _ in nodes]
+    item_plans = [None] * len(nodes)
+    plans = [None] * len(nodes)
+    for index in range(len(nodes) - 1, -1, -1):
+        node_key, node_rules, node_path, parent, is_item = nodes[index]
+        plan = _compile_rules(
+            node_key, node_rules, custom_validators, node_path,
+            tuple(reversed(children[index])), item_plans[index],
+        )
+        plans[index] = plan
+        if parent is not None:
+            if is_item:
+                item_plans[parent] = plan
+            else:
+                children[parent].append(plan)
+    return plans[0]
+
+
+def _compile_rules(key, rules, custom_validators, path, children, item_plan) -> KeyPlan:
+    """Builds one KeyPlan from its rules and already-compiled nested plans."""
+    try:
+        required = rules.get("required", False)
+        default = rules.get("default", None)
+        expected_type = rules.get("type")
+        specs = _validator_specs(rules)
+    except Exception as e:
+        return KeyPlan(key, False, None, None, (), error=str(e), path=path)
+
+    # Cheapest first; sorted() is stable, so equal costs keep declaration order.
+    steps = tuple(sorted((_compile_validator(spec, custom_validators) for spec in specs), key=attrgetter("cost")))
+    return KeyPlan(
+        key, required, default, expected_type, steps,
+        children=children, item_plan=item_plan, path=path,
+    )
+
+
+def _build_index(plans) -> Mapping[str, KeyPlan]:
+    """Flattens nested plans into a read-only {dotted path: KeyPlan} mapping."""
+    index = {}
+    stack = list(reversed(plans))
+    while stack:
+        plan = stack.pop()
+        index[plan.path] = plan
+        if plan.item_plan is not None:
+            stack.append(plan.item_plan)
+        stack.extend(reversed(plan.children))
+    return MappingProxyType(index)
+
+
+def _compile_validator(validator_spec, custom_validators) -> ValidatorStep:
+    """Resolves a validator spec (callable, str or dict) into a ValidatorStep."""
+    # Deferred: inspect is only needed while compiling, not to import the package.
+    from inspect import iscoroutinefunction
+
+    if callable(validator_spec):
+        is_async = iscoroutinefunction(validator_spec)
+        return ValidatorStep(
+            "inline validator", validator_spec, pass_key=False, io_bound=is_async, is_async=is_async,
+            cost=EXPENSIVE_VALIDATOR_COST if is_async else DEFAULT_VALIDATOR_COST,
+        )
+
+    if isinstance(validator_spec, str):
+        validator_name = validator_spec
+        args = None
+    elif isinstance(validator_spec, dict):
+        validator_name = validator_spec.get("name")
+        args = {k: v for k, v in validator_spec.items() if k != "name"}
+    else:
+        return ValidatorStep("", None, error=f"Invalid validator format: {validator_spec}")
+
+    base_name, is_each = split_each(validator_name)
+    try:
+        validator_factory = base_factory = _lookup_validator(base_name, custom_validators)
+    except Exception as e:
+        return ValidatorStep(validator_name, None, error=f"Validator '{validator_name}' failed to load: {e}")
+    if is_each and base_name in BULK_VALIDATORS and base_name not in custom_validators:
+        validator_factory = BULK_VALIDATORS[base_name]
+        is_each = False
+    if validator_factory is None:
+        return ValidatorStep(
+            validator_name,
+            None,
+            error=(
+                f"Validator '{validator_name}' not found. "
+                f"Define it using @CustomValidator.register or in ConfigValidator."
+            ),
+        )
+
+    if args is not None:
+        try:
+            validator_factory = validator_factory(**args)
+        except Exception as e:
+            return ValidatorStep(validator_name, None, error=f"{validator_name}: {str(e)}")
+
+    options = ConfigValidator.get_validator_options(base_name)
+    if options["cacheable"]:
+        token = (validator_name, base_factory, value_fingerprint(args))
+        validator_factory = cached_validator(validator_factory, token, options["ttl"], options["file_based"])
+
+    is_async = iscoroutinefunction(validator_factory)
+    io_bound = is_async or options["io_bound"]
+    if is_each:
+        validator_factory = each(validator_factory)
+        is_async = False
+    return ValidatorStep(
+        validator_name, validator_factory, io_bound=io_bound, is_async=is_async, cost=options["cost"],
+    )
+
+
+_MISSING = object()
+_CONTAINER_TYPES = (dict, list, tuple)
+
+
+def _join_path(parent_path: str, segment) -> str:
+    """Appends a dict key (`.key`) or list index (`[i]`) to a rendered path."""
+    if isinstance(segment, int):
+        return f"{parent_path}[{segment}]"
+    return f"{parent_path}.{segment}" if parent_path else str(segment)
+
+
+class _Frame:
+    """A container being validated, linked to its parent for copy-on-write and error paths."""
+
+    __slots__ = ("container", "parent", "segment", "owned", "_path", "_key_path")
+
+    def __init__(self, container, parent=None, segment=None, owned=False):
+        self.container = container
+        self.parent = parent
+        self.segment = segment
+        self.owned = owned
+        self._path = "" if parent is None else None
+        self._key_path = () if parent is None else None
+
+    @property
+    def path(self) -> str:
+        """The rendered path of this container, built once on first use."""
+        if self._path is None:
+            self._path = _join_path(self.parent.path, self.segment)
+        return self._path
+
+    @property
+    def key_path(self) -> tuple:
+        """The path of this container as a tuple of keys and indices."""
+        if self._key_path is None:
+            self._key_path = self.parent.key_path + (self.segment,)
+        return self._key_path
+
+    def set(self, segment, value):
+        """Writes into the container, first copying it and any shared ancestors."""
+        if not self.owned:
+            chain = []
+            frame = self
+            while not frame.owned:
+                chain.append(frame)
+                frame = frame.parent
+            for frame in reversed(chain):
+                frame.container = shallow_copy(frame.container)
+                frame.parent.container[frame.segment] = frame.container
+                frame.owned = True
+        self.container[segment] = value
+
+
+def _walk_plans(
+    plans, validated: dict, errors: list, in_place: bool = False,
+    deferred: list = None, profile=None, max_errors: Optional[int] = None,
+) -> bool:
+    """Validates a config against top-level plans, descending into nested values iteratively.
+
+    An explicit stack replaces recursion, so arbitrarily large or deep configs
+    never hit the interpreter's recursion limit. Paths are rendered only for
+    errors and validator calls. When deferred is a list, I/O-bound validator
+    calls are queued there, each holding a reserved slot in errors. A
+    ValidationProfile passed as profile records the timing of every call.
+
+    Returns True if the walk stopped early because max_errors was reached.
+    """
+    root = _Frame(validated, owned=True)
+    if not any(plan.children or plan.item_plan is not None for plan in plans):
+        return _walk_flat(plans, root, errors, deferred, profile, max_errors)
+    return _drain([(root, ((plan, plan.key) for plan in plans))], errors, in_place, deferred, profile, max_errors)
+
+
+def _walk_flat(plans, root: _Frame, errors: list, deferred: list = None, profile=None, max_errors=None) -> bool:
+    """_walk_plans for plans without nested schemas or list items: one loop, no stack or generators."""
+    for plan in plans:
+        value, _ = _prepare_node_value(plan, root, plan.key, errors)
+        if value is not _MISSING and plan.steps:
+            _run_steps(plan, _join_path("", plan.key), value, errors, deferred, profile)
+        if max_errors is not None and len(errors) - (len(deferred) if deferred else 0) >= max_errors:
+            return True
+    return False
+
+
+def _drain(stack: list, errors: list, in_place: bool, deferred: list = None, profile=None, max_errors=None) -> bool:
+    """Runs _check_node over a stack of (frame, items) pairs until it is empty; see _walk_plans."""
+    while stack:
+        if max_errors is not None and len(errors) - (len(deferred) if deferred else 0) >= max_errors:
+            return True
+        frame, items = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
 
-    return value
+        plan, segment = item
+        child = _check_node(plan, frame, segment, errors, in_place, deferred, profile)
+        if child is not None:
+            stack.append(child)
+    return False
 
 
-def _check_type(key, value, rules):
-    """Validates that the config value is of the expected type."""
-    expected_type = rules.get("type")
+def _check_node(plan: KeyPlan, frame: _Frame, segment, errors: list, in_place: bool, deferred: list = None, profile=None):
+    """Validates one value; returns a (frame, items) pair to descend into, or None."""
+    value, from_default = _prepare_node_value(plan, frame, segment, errors)
+    if value is _MISSING:
+        return None
+
+    if plan.steps:
+        _run_steps(plan, _join_path(frame.path, segment), value, errors, deferred, profile)
+    return _descend(plan, frame, segment, value, from_default, errors, in_place)
+
+
+def _run_steps(plan: KeyPlan, path: str, value, errors: list, deferred: list = None, profile=None):
+    """Runs a plan's validator steps on one value; expensive ones are skipped once one has failed."""
+    failed = False
+    for step in plan.steps:
+        if failed and step.cost >= EXPENSIVE_VALIDATOR_COST:
+            continue
+        if profile is not None and step.func is not None:
+            step = step._replace(func=profile.timed(step.func, plan.path, step.label))
+        if deferred is not None and step.io_bound and step.error is None:
+            deferred.append((len(errors), (step, path, value)))
+            errors.append(None)
+            continue
+        error = _run_validator_step(step, path, value)
+        if error is not None:
+            errors.append(error)
+            failed = True
+
+
+def _descend(plan: KeyPlan, frame: _Frame, segment, value, from_default: bool, errors: list, in_place: bool):
+    """Returns the (frame, items) pair for a value's nested schema or list items, or None."""
+    if value is None or (not plan.children and plan.item_plan is None):
+        return None
+
+    owned = in_place and not from_default
+    if plan.children:
+        if not isinstance(value, dict):
+            errors.append(f"[{_join_path(frame.path, segment)}] must be a mapping to apply its nested schema.")
+            return None
+        child_frame = _Frame(value, frame, segment, owned)
+        return child_frame, ((child, child.key) for child in plan.children)
+
+    if not isinstance(value, list):
+        errors.append(f"[{_join_path(frame.path, segment)}] must be a list to apply its item schema.")
+        return None
+    child_frame = _Frame(value, frame, segment, owned)
+    item_plan = plan.item_plan
+    return child_frame, ((item_plan, index) for index in range(len(value)))
+
+
+def _prepare_node_value(plan: KeyPlan, frame: _Frame, segment, errors: list):
+    """Applies defaults, type and placeholder checks to one value.
+
+    Returns (value, from_default); value is _MISSING if a check failed.
+    """
+    if plan.error is not None:
+        errors.append(f"[{_join_path(frame.path, segment)}] {plan.error}")
+        return _MISSING, False
+
+    container = frame.container
+    if isinstance(container, dict):
+        value = container.get(segment, None)
+        present = segment in container
+    else:
+        value = container[segment]
+        present = True
+
+    from_default = False
+    if value is None:
+        if plan.required and plan.default is None:
+            path = _join_path(frame.path, segment)
+            errors.append(f"[{path}] Missing required config key: '{path}'")
+            return _MISSING, False
+        value = plan.default
+        from_default = value is not None
+        # Missing top-level keys are always materialized; nested ones only for real defaults.
+        if from_default or (not present and frame.parent is None):
+            frame.set(segment, value)
+
+    expected_type = plan.expected_type
     if expected_type and not isinstance(value, expected_type):
-        raise TypeError(
-            f"Config key '{key}' must be of type {expected_type.__name__}, "
+        path = _join_path(frame.path, segment)
+        type_name = getattr(expected_type, "__name__", str(expected_type))
+        errors.append(
+            f"[{path}] Config key '{path}' must be of type {type_name}, "
             f"but got {type(value).__name__}."
         )
+        return _MISSING, False
 
-
-def _run_validators(key, value, rules, custom_validators, errors):
-    """Runs any attached validators on the given key/value."""
     if isinstance(value, str) and is_placeholder(value):
-        errors.append(f"[{key}] contains unresolved placeholder: {value}")
-        return
+        errors.append(f"[{_join_path(frame.path, segment)}] contains unresolved placeholder: {value}")
+        return _MISSING, False
 
-    validator_specs = rules.get("validators") or []
-    if rules.get("validator") and not validator_specs:
-        validator_specs = [rules["validator"]]
+    if (
+        isinstance(value, _CONTAINER_TYPES)
+        and not plan.children
+        and plan.item_plan is None
+        and _report_nested_placeholders(value, frame, segment, errors)
+    ):
+        return _MISSING, False
 
-    for validator_spec in validator_specs:
-        if callable(validator_spec):
-            # Inline callable validator
-            try:
-                validator_spec(value)
-            except Exception as e:
-                errors.append(f"[{key}] inline validator: {str(e)}")
-            continue
+    return value, from_default
 
-        if isinstance(validator_spec, str):
-            validator_name = validator_spec
-            args = {}
-        elif isinstance(validator_spec, dict):
-            validator_name = validator_spec.get("name")
-            args = {k: v for k, v in validator_spec.items() if k != "name"}
-        else:
-            errors.append(f"[{key}] Invalid validator format: {validator_spec}")
-            continue
 
-        if validator_name in custom_validators:
-            validator_factory = custom_validators[validator_name]
-        elif hasattr(ConfigValidator, validator_name):
-            validator_factory = getattr(ConfigValidator, validator_name)
-        else:
-            errors.append(
-                f"[{key}] Validator '{validator_name}' not found. "
-                f"Define it using @CustomValidator.register or in ConfigValidator."
-            )
-            continue
+def _report_nested_placeholders(value, frame: _Frame, segment, errors: list) -> bool:
+    """Reports placeholders anywhere inside a container that has no nested schema; True if any.
 
-        try:
-            if isinstance(validator_spec, dict):
-                validator_fn = validator_factory(**args)
-                validator_fn(value, key)
-            else:
-                validator_factory(value, key)
-        except Exception as e:
-            errors.append(f"[{key}] {validator_name}: {str(e)}")
+    Only this container is scanned, so validating one key at a time
+    (incrementally or while streaming) stays linear in the config size.
+    """
+    placeholders = scan_config(value, prefix=frame.key_path + (segment,)).placeholders
+    for nested_path, placeholder in placeholders.items():
+        errors.append(f"[{format_path(nested_path)}] contains unresolved placeholder: {placeholder}")
+    return bool(placeholders)
+
+
+def _validate_key(plan: KeyPlan, validated: dict, errors: list, in_place: bool = False):
+    """Validates a single top-level key (and anything nested under it)."""
+    _walk_plans((plan,), validated, errors, in_place=in_place)
+
+
+def _run_validator_step(step: ValidatorStep, key, value):
+    """Runs one validator step and returns its error message, or None if it passed."""
+    if step.error is not None:
+        return f"[{key}] {step.error}"
+    try:
+        call_validator(step, key, value)
+    except Exception as e:
+        return f"[{key}] {step.label}: {str(e)}"
+    return None
+
+
+def _resolve_deferred(deferred: list, errors: list, io_workers: int, io_timeout) -> list:
+    """Runs queued I/O-bound validators concurrently and fills their reserved error slots."""
+    from config_env_initializer.concurrent_validation import run_io_validators
+
+    results = run_io_validators([job for _, job in deferred], max_workers=io_workers, timeout=io_timeout)
+    for (slot, _), error in zip(deferred, results):
+        errors[slot] = error
+    return [error for error in errors if error is not None]
 
 
 def generate_config_template(schema_module, include_required_placeholders=True) -> dict:
@@ -118,9 +629,16 @@ def generate_config_template(schema_module, include_required_placeholders=True)
     for key, rules in schema.items():
         default = rules.get("default", None)
         required = rules.get("required", False)
+        nested_schema = rules.get("schema")
 
         if default is not None:
             template[key] = default
+        elif isinstance(nested_schema, dict):
+            nested = generate_config_template(
+                SimpleNamespace(schema=nested_schema), include_required_placeholders
+            )
+            if nested or required:
+                template[key] = nested
         elif required and include_required_placeholders:
             template[key] = "<REQUIRED>"
 
@@ -128,29 +646,34 @@ def generate_config_template(schema_module, include_required_placeholders=True)
 
 
 def validate_schema_file(schema_module):
-    """Checks schema structure and validator references for correctness."""
+    """Checks schema structure and validator references for correctness.
+
+    schema_module may also be a schema file path; declarative schema files
+    are checked without executing any code.
+    """
+    if isinstance(schema_module, (str, os.PathLike)):
+        schema_module = load_schema_module(schema_module)
     errors = []
     schema = _extract_schema(schema_module)
     custom_validators = CustomValidator.get_all_validators()
 
-    for key, rules in schema.items():
+    # (path, rules, is_keyed); item rules need neither 'type' nor 'required'.
+    stack = [(key, rules, True) for key, rules in reversed(list(schema.items()))]
+    while stack:
+        key, rules, is_keyed = stack.pop()
         if not isinstance(rules, dict):
             errors.append(f"[{key}] Schema rules must be a dictionary.")
             continue
 
-        if "type" not in rules:
+        if is_keyed and "type" not in rules:
             errors.append(f"[{key}] Missing required 'type' key in schema rules.")
 
-        if "required" not in rules:
+        if is_keyed and "required" not in rules:
             errors.append(f"[{key}] Missing required 'required' key in schema rules.")
 
-        validator_specs = rules.get("validators") or []
-        if rules.get("validator") and not validator_specs:
-            validator_specs = [rules["validator"]]
-
-        for validator_spec in validator_specs:
+        for validator_spec in _validator_specs(rules):
             if isinstance(validator_spec, str):
-                if validator_spec not in custom_validators and not hasattr(ConfigValidator, validator_spec):
+                if not _check_validator_reference(key, validator_spec, custom_validators, errors):
                     errors.append(
                         f"[{key}] Validator '{validator_spec}' not found in registered validators."
                     )
@@ -158,14 +681,40 @@ def validate_schema_file(schema_module):
                 name = validator_spec.get("name")
                 if not name:
                     errors.append(f"[{key}] Validator dict missing 'name' key: {validator_spec}")
-                elif name not in custom_validators and not hasattr(ConfigValidator, name):
+                elif not _check_validator_reference(key, name, custom_validators, errors):
                     errors.append(
                         f"[{key}] Validator dict references unknown name '{name}' not found in registered validators."
                     )
             elif not callable(validator_spec):
                 errors.append(f"[{key}] Invalid validator format: {validator_spec}")
 
+        item_rules = rules.get("items")
+        if item_rules is not None:
+            if isinstance(item_rules, dict):
+                stack.append((f"{key}[]", item_rules, False))
+            else:
+                errors.append(f"[{key}] 'items' must be a dictionary of rules.")
+
+        nested_schema = rules.get("schema")
+        if nested_schema is not None:
+            if isinstance(nested_schema, dict):
+                stack.extend(
+                    (f"{key}.{child_key}", child_rules, True)
+                    for child_key, child_rules in reversed(list(nested_schema.items()))
+                )
+            else:
+                errors.append(f"[{key}] 'schema' must be a dictionary of nested rules.")
+
     if errors:
         raise ValidationError(errors)
 
     return True
+
+
+def _check_validator_reference(key, name, custom_validators, errors: list) -> bool:
+    """Returns False if name (with any `each:` prefix) is unknown; plugin load failures are reported in errors."""
+    try:
+        return _lookup_validator(split_each(name)[0], custom_validators) is not None
+    except Exception as e:
+        errors.append(f"[{key}] Validator '{name}' failed to load: {e}")
+        return True
@@ -27,17 +27,28 @@ class SensitiveValue:
         return hash(self._value)
 
 
-def mask_config_for_logging(config: dict) -> dict:
-    """Returns a copy of the config with sensitive fields (e.g. auth) masked."""
-    masked = {}
-
-    for key, value in config.items():
-        if key == "auth" and isinstance(value, dict):
-            # Mask each auth provider key but not their structure
-            masked["auth"] = {k: "*****" for k in value.keys()}
-        elif isinstance(value, SensitiveValue):
-            masked[key] = "*****"
-        else:
-            masked[key] = value
+def mask_config_for_logging(config: dict, scan=None) -> dict:
+    """Returns a copy of the config with sensitive fields (e.g. auth) masked.
+
+    SensitiveValues are masked at any depth. Pass the ConfigScan of config,
+    if one was already made, to avoid walking the config again. Only the
+    containers on the way to a masked value are copied.
+    """
+    if scan is None:
+        from config_env_initializer.config_scan import scan_config
+        scan = scan_config(config)
+
+    masked = dict(config)
+    copied = {id(masked)}
+    for path in scan.sensitive:
+        container = masked
+        for segment in path[:-1]:
+            child = container[segment]
+            if id(child) not in copied:
+                child = dict(child) if isinstance(child, dict) else list(child)
+                copied.add(id(child))
+                container[segment] = child
+            container = child
+        container[path[-1]] = "*****"
 
     return masked
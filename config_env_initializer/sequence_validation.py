@@ -0,0 +1,165 @@
+"""Bulk validation of list-valued config entries via the `each:` validator modifier.
+
+A spec such as "each:valid_filename_string" or
+{"name": "each:int_in_range", "min_value": 1, "max_value": 65535} applies a
+validator to every item of a list. Built-ins listed in BULK_VALIDATORS check
+the whole sequence at once; any other validator is called per item.
+"""
+
+import platform
+
+from config_env_initializer.concurrent_validation import is_awaitable, run_coroutine
+from config_env_initializer.config_validator import FORBIDDEN_FILENAME_CHARS, WINDOWS_RESERVED_NAMES
+from config_env_initializer.string_rules import forbidden_chars_search
+
+EACH_PREFIX = "each:"
+MAX_REPORTED_INDICES = 10
+
+
+def split_each(name):
+    """Returns (base validator name, True) for an `each:` name, else (name, False)."""
+    if isinstance(name, str) and name.startswith(EACH_PREFIX):
+        return name[len(EACH_PREFIX):], True
+    return name, False
+
+
+def format_indices(indices) -> str:
+    """Renders offending indices, truncating long lists."""
+    shown = ", ".join(str(i) for i in indices[:MAX_REPORTED_INDICES])
+    if len(indices) > MAX_REPORTED_INDICES:
+        shown += f", ... ({len(indices)} total)"
+    return f"[{shown}]"
+
+
+def _require_sequence(values, key):
+    """Fails unless values is a list or tuple."""
+    if not isinstance(values, (list, tuple)):
+        raise ValueError(f"{key} must be a list.")
+
+
+def _non_matching_type_indices(values, expected_type) -> list:
+    """Returns indices of items that are not instances of expected_type."""
+    if set(map(type, values)) <= {expected_type}:
+        return []
+    return [i for i, v in enumerate(values) if not isinstance(v, expected_type)]
+
+
+def _split_ints(values):
+    """Returns (non-int indices, positions of the ints or None if all are ints, the ints)."""
+    bad_type = _non_matching_type_indices(values, int)
+    if not bad_type:
+        return [], None, values
+    positions = [i for i, v in enumerate(values) if isinstance(v, int)]
+    return bad_type, positions, [values[i] for i in positions]
+
+
+def _remap(indices, positions) -> list:
+    """Maps indices into the filtered int list back to indices into the original list."""
+    return indices if positions is None else [positions[i] for i in indices]
+
+
+def _raise_for(problems, key):
+    """Raises one ValueError listing each (indices, message) pair that has indices."""
+    messages = [f"{key} items at indices {format_indices(indices)} {message}" for indices, message in problems if indices]
+    if messages:
+        raise ValueError("; ".join(messages))
+
+
+def _range_violations(values, low, high) -> list:
+    """Returns indices of ints outside [low, high]; min/max short-circuit the common all-valid case."""
+    if not values:
+        return []
+    if (low is None or min(values) >= low) and (high is None or max(values) <= high):
+        return []
+    return [
+        i for i, v in enumerate(values)
+        if (low is not None and v < low) or (high is not None and v > high)
+    ]
+
+
+def each(validator):
+    """Wraps a scalar validator so it runs on every item, reporting items as key[i]."""
+    def sequence_validator(values, key=None):
+        _require_sequence(values, key)
+        messages = []
+        for i, item in enumerate(values):
+            try:
+                result = validator(item, f"{key}[{i}]")
+                if is_awaitable(result):
+                    run_coroutine(result)
+            except Exception as e:
+                messages.append(str(e))
+        if messages:
+            shown = "; ".join(messages[:MAX_REPORTED_INDICES])
+            if len(messages) > MAX_REPORTED_INDICES:
+                shown += f"; ... ({len(messages)} invalid items)"
+            raise ValueError(shown)
+    return sequence_validator
+
+
+def int_in_range_each(*, min_value: int, max_value: int):
+    """Returns a bulk validator ensuring every item is an int within [min_value, max_value]."""
+    def validator(values, key=None):
+        _require_sequence(values, key)
+        bad_type, positions, ints = _split_ints(values)
+        out_of_range = _range_violations(ints, min_value, max_value)
+        _raise_for([
+            (bad_type, "must be integers."),
+            (_remap(out_of_range, positions), f"not in range [{min_value}, {max_value}]"),
+        ], key)
+    return validator
+
+
+def int_no_leading_zero_each(*, digits=None):
+    """Returns a bulk validator ensuring every item is a positive int, with optional digit count."""
+    def validator(values, key=None):
+        _require_sequence(values, key)
+        bad_type, positions, ints = _split_ints(values)
+        not_positive = _range_violations(ints, 1, None)
+        wrong_length = []
+        if digits is not None:
+            skip = set(not_positive)
+            wrong_length = [
+                i for i in _range_violations(ints, 10 ** (digits - 1), 10 ** digits - 1)
+                if i not in skip
+            ]
+        _raise_for([
+            (bad_type, "must be integers."),
+            (_remap(not_positive, positions), "must be positive integers."),
+            (_remap(wrong_length, positions), f"must be exactly {digits} digits long."),
+        ], key)
+    return validator
+
+
+def valid_filename_string_each(values, key=None):
+    """Bulk-validates that every item is a syntactically valid filename."""
+    label = key or "Value"
+    _require_sequence(values, label)
+    bad_type = _non_matching_type_indices(values, str)
+    if bad_type:
+        _raise_for([(bad_type, "must be strings.")], label)
+
+    names = [v.strip() for v in values]
+    empty = [i for i, name in enumerate(names) if not name] if "" in names else []
+    forbidden = []
+    # One scan over the joined names finds nothing in the common all-valid case.
+    search = forbidden_chars_search(FORBIDDEN_FILENAME_CHARS)
+    if search("\n".join(names)):
+        forbidden = [i for i, name in enumerate(names) if search(name)]
+    reserved = []
+    if platform.system() == "Windows":
+        reserved = [i for i, name in enumerate(names) if name.split(".")[0].upper() in WINDOWS_RESERVED_NAMES]
+    _raise_for([
+        (empty, "must not be empty or whitespace."),
+        (forbidden, f"contain forbidden characters: {FORBIDDEN_FILENAME_CHARS}"),
+        (reserved, "are reserved filenames on Windows."),
+    ], label)
+    return True
+
+
+# Built-in validator name -> bulk variant taking the same arguments.
+BULK_VALIDATORS = {
+    "int_in_range": int_in_range_each,
+    "int_no_leading_zero": int_no_leading_zero_each,
+    "valid_filename_string": valid_filename_string_each,
+}
@@ -0,0 +1,14 @@
+-- validation_ledger.sql
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+-- One row per validated (schema, validator registry, config) combination
+CREATE TABLE IF NOT EXISTS validation_results (
+    schema_hash        TEXT NOT NULL,
+    registry_version   TEXT NOT NULL,
+    config_hash        TEXT NOT NULL,
+    valid              BOOLEAN NOT NULL,
+    errors             TEXT NOT NULL,
+    recorded_ts        INTEGER NOT NULL,
+    PRIMARY KEY (schema_hash, registry_version, config_hash)
+) WITHOUT ROWID;
@@ -0,0 +1,135 @@
+"""Streaming validation of multi-document and very large YAML files."""
+
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import yaml
+from yaml.composer import Composer
+
+from config_env_initializer.config_utils import normalize_config_keys
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import CompiledSchema, _validate_key, compile_schema
+from config_env_initializer.yaml_loader import SafeLoader
+
+
+class StreamError(NamedTuple):
+    """A validation error found while streaming, tagged with its document index."""
+
+    document: int
+    message: str
+
+
+class _KeyStreamLoader(SafeLoader):
+    """Safe loader that can compose one node at a time, including on the libyaml parser."""
+
+    compose_node = Composer.compose_node
+    compose_scalar_node = Composer.compose_scalar_node
+    compose_sequence_node = Composer.compose_sequence_node
+    compose_mapping_node = Composer.compose_mapping_node
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.anchors = {}
+
+    def construct_detached(self, node):
+        """Constructs a node and forgets constructor state so memory is not retained."""
+        data = self.construct_object(node, deep=True)
+        self.constructed_objects = {}
+        self.recursive_objects = {}
+        return data
+
+
+def iter_documents(path: Path) -> Iterator:
+    """Yields each document of a (multi-document) YAML file, one at a time."""
+    with open(path, "rb") as f:
+        yield from yaml.load_all(f, Loader=SafeLoader)
+
+
+def iter_validation_errors(path: Path, schema_module, by_key: bool = False) -> Iterator[StreamError]:
+    """Validates every document in a YAML stream, yielding errors as they are found.
+
+    Keys are normalized as ConfigLoader does. By default each document is
+    parsed whole and validated before the next one is read. With by_key=True,
+    each top-level key is constructed and validated as soon as it is parsed,
+    so even a single huge document never has to fit in memory at once.
+    """
+    if not isinstance(schema_module, CompiledSchema):
+        schema_module = compile_schema(schema_module)
+
+    if not by_key:
+        for document_index, document in enumerate(iter_documents(path)):
+            for message in _document_errors(document, schema_module):
+                yield StreamError(document_index, message)
+        return
+
+    plans = {plan.key: plan for plan in schema_module.plans}
+    with open(path, "rb") as f:
+        loader = _KeyStreamLoader(f)
+        try:
+            loader.get_event()  # StreamStartEvent
+            document_index = 0
+            while not loader.check_event(yaml.StreamEndEvent):
+                loader.get_event()  # DocumentStartEvent
+                for message in _stream_document_keys(loader, plans):
+                    yield StreamError(document_index, message)
+                loader.get_event()  # DocumentEndEvent
+                loader.anchors = {}
+                document_index += 1
+        finally:
+            loader.dispose()
+
+
+def _document_errors(document, compiled_schema: CompiledSchema) -> list:
+    """Returns the validation errors for one fully parsed document."""
+    errors = []
+    if document is None:
+        document = {}
+    if not isinstance(document, dict):
+        errors.append("YAML config must be a dictionary at the top level.")
+        document = {}
+    try:
+        compiled_schema.validate(normalize_config_keys(document), copy=False)
+    except ValidationError as ve:
+        errors.extend(ve.errors)
+    except ValueError as e:
+        errors.append(str(e))
+    return errors
+
+
+def _stream_document_keys(loader: _KeyStreamLoader, plans: dict) -> Iterator[str]:
+    """Validates one document key by key, then reports keys that never appeared."""
+    if not loader.check_event(yaml.MappingStartEvent):
+        value = loader.construct_detached(loader.compose_node(None, None))
+        if value is not None:
+            yield "YAML config must be a dictionary at the top level."
+        for plan in plans.values():
+            yield from _key_errors(plan, {})
+        return
+
+    loader.get_event()  # MappingStartEvent
+    seen = {}
+    while not loader.check_event(yaml.MappingEndEvent):
+        raw_key = loader.construct_detached(loader.compose_node(None, None))
+        value = loader.construct_detached(loader.compose_node(None, None))
+        key = raw_key.strip().replace(" ", "_").lower() if isinstance(raw_key, str) else raw_key
+
+        if key in seen:
+            yield f"Config key collision after normalization: '{raw_key}' → '{key}'"
+            continue
+        seen[key] = raw_key
+
+        plan = plans.get(key)
+        if plan is not None:
+            yield from _key_errors(plan, {key: value})
+    loader.get_event()  # MappingEndEvent
+
+    for key, plan in plans.items():
+        if key not in seen:
+            yield from _key_errors(plan, {})
+
+
+def _key_errors(plan, container: dict) -> list:
+    """Validates a single top-level key held in container."""
+    errors = []
+    _validate_key(plan, container, errors, in_place=True)
+    return errors
@@ -0,0 +1,38 @@
+"""Compiled regex checks for string validators, built once and cached by their parameters."""
+
+import re
+from functools import lru_cache
+from typing import Callable, Optional
+
+PATTERN_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compiles a regex once per (pattern, flags) pair."""
+    return re.compile(pattern, flags)
+
+
+def char_class(chars: str, negate: bool = False) -> str:
+    """Returns a regex character class matching any (or, negated, none) of chars."""
+    escaped = "".join(re.escape(c) for c in dict.fromkeys(chars))
+    return f"[{'^' if negate else ''}{escaped}]"
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def forbidden_chars_search(chars: str) -> Callable[[str], Optional[re.Match]]:
+    """Returns a search function finding the first of chars in a string."""
+    return compile_pattern(char_class(chars)).search
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def string_rule(forbidden: str = "", min_length: int = 0, max_length: Optional[int] = None) -> Callable[[str], Optional[re.Match]]:
+    """Returns a fullmatch function accepting strings that satisfy every rule in one C-level scan.
+
+    A string matches when it is min_length..max_length characters long and
+    contains none of the forbidden characters. Callers use it as a fast
+    path and only work out which rule failed when it does not match.
+    """
+    allowed = char_class(forbidden, negate=True) if forbidden else "."
+    upper = "" if max_length is None else str(max_length)
+    return compile_pattern(f"{allowed}{{{min_length},{upper}}}", re.DOTALL).fullmatch
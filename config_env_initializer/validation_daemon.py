@@ -0,0 +1,177 @@
+"""A long-running validation daemon, speaking JSON lines over a Unix socket.
+
+`config-init serve` keeps prepared schemas warm in one process, so a request
+costs a socket round trip and the validation itself, with no interpreter
+startup, imports or schema execution. Each request and response is one JSON
+object per line:
+
+    {"op": "validate", "config": "/abs/dev.yaml", "schema": "/abs/schema.py", "max_errors": null}
+    -> {"ok": true, "valid": false, "errors": ["..."], "elapsed_ms": 0.41}
+
+    {"op": "ping"}      -> {"ok": true, "pid": 1234, "schemas": 1}
+    {"op": "shutdown"}  -> {"ok": true}
+
+Failures are reported as {"ok": false, "error": "..."}. A connection may send
+any number of requests. Schemas are re-prepared when their mtime changes.
+The client lives in daemon_client, so it can be imported without the
+validation code; its names are also importable from here.
+
+The socket is created owner-only, by default in $XDG_RUNTIME_DIR or a 0700
+per-user directory, and the client only talks to a socket owned by the
+current user, so another local user cannot answer in the daemon's place.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+
+from config_env_initializer.config_utils import prepare_schema, validate_config
+from config_env_initializer.daemon_client import (
+    CLIENT_TIMEOUT,
+    SOCKET_PATH_ENV,
+    DaemonUnavailable,
+    _check_socket,
+    _fallback_socket_dir,
+    _owned_by_us,
+    default_socket_path,
+    request,
+    validate_with_daemon,
+)
+
+
+def _private_directory(path: Path):
+    """Creates path as a 0700 directory, or checks that an existing one is ours and not shared."""
+    path.mkdir(mode=stat.S_IRWXU, parents=True, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or not _owned_by_us(info) or info.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise OSError(f"Refusing to use {path} for the daemon socket: it must be a directory only you can access.")
+
+
+class ValidationDaemon:
+    """Answers validation requests using schemas prepared once and kept in memory."""
+
+    def __init__(self, socket_path=None):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self._schemas = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def __repr__(self):
+        return f'<ValidationDaemon socket="{self.socket_path}">'
+
+    def prepared_schema(self, schema_path):
+        """Returns the PreparedSchema for schema_path, re-preparing it after the file changes."""
+        path = Path(schema_path).expanduser().resolve()
+        file_stat = path.stat()
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self._lock:
+            cached = self._schemas.get(path)
+            if cached is None or cached[0] != stamp:
+                cached = self._schemas[path] = (stamp, prepare_schema(path))
+            return cached[1]
+
+    def handle(self, message) -> dict:
+        """Returns the response for one decoded request."""
+        if not isinstance(message, dict):
+            return {"ok": False, "error": "Request must be a JSON object."}
+        op = message.get("op")
+        try:
+            if op == "validate":
+                return self._validate(message)
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid(), "schemas": len(self._schemas)}
+            if op == "shutdown":
+                return {"ok": True}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": False, "error": f"Unknown op {op!r}."}
+
+    def _validate(self, message: dict) -> dict:
+        start = time.perf_counter()
+        if not message.get("config") or not message.get("schema"):
+            return {"ok": False, "error": "validate needs 'config' and 'schema' paths."}
+        prepared = self.prepared_schema(message["schema"])
+        errors = validate_config(Path(message["config"]), prepared_schema=prepared, max_errors=message.get("max_errors"))
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+        return {"ok": True, "valid": not errors, "errors": errors, "elapsed_ms": elapsed_ms}
+
+    def serve_forever(self):
+        """Listens on the socket until shutdown() or a shutdown request; removes the socket afterwards."""
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("The validation daemon needs Unix domain sockets, which this platform lacks.")
+        self._claim_socket_path()
+        # bind() creates the socket file; it must never exist with looser permissions.
+        umask = os.umask(0o177)
+        try:
+            server = _DaemonServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+        server.validation_daemon = self
+        self._server = server
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def shutdown(self):
+        """Stops a running serve_forever() from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _claim_socket_path(self):
+        """Removes a stale socket left by a previous daemon.
+
+        Raises OSError if another daemon is still listening, or if the path
+        holds anything other than a socket owned by the current user.
+        """
+        if self.socket_path.parent == _fallback_socket_dir():
+            _private_directory(self.socket_path.parent)
+        else:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            info = os.lstat(self.socket_path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(info.st_mode) or not _owned_by_us(info):
+            raise OSError(f"Refusing to replace {self.socket_path}: it is not a socket owned by you.")
+        try:
+            request({"op": "ping"}, self.socket_path, timeout=1.0)
+        except DaemonUnavailable:
+            self.socket_path.unlink()
+            return
+        raise OSError(f"A validation daemon is already listening on {self.socket_path}")
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    validation_daemon = None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads JSON request lines and writes one JSON response line for each."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                message, response = None, {"ok": False, "error": f"Invalid JSON: {e}"}
+            else:
+                response = self.server.validation_daemon.handle(message)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if isinstance(message, dict) and message.get("op") == "shutdown":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
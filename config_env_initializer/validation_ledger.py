@@ -0,0 +1,183 @@
+"""Optional SQLite ledger of validation outcomes, so identical configs are only validated once.
+
+Entries are keyed by (schema content hash, validator registry version,
+config content hash). The registry version hashes every registered
+validator's name, options and bytecode, so editing or adding a validator
+invalidates the ledger. Schemas that use volatile validators (registered
+with volatile=True, or file_based ones such as file_exists) never use the
+ledger: their outcome depends on more than the config. Unregistered
+validators imported by a schema from other modules are not part of the key.
+Only the outcome is stored, never the config itself.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import CodeType
+from typing import List, NamedTuple, Optional
+
+import config_env_initializer
+from config_env_initializer.config_validator import ConfigValidator, CustomValidator
+from config_env_initializer.fingerprint import content_hash, schema_digest, value_fingerprint
+from config_env_initializer.sequence_validation import split_each
+
+LEDGER_SQL = Path(config_env_initializer.__file__).resolve().parent / "sql" / "validation_ledger.sql"
+
+_registry_version = None
+_scopes = {}
+
+
+class LedgerEntry(NamedTuple):
+    """A recorded outcome and the errors found."""
+
+    valid: bool
+    errors: List[str]
+
+
+class ValidationLedger:
+    """Records validation outcomes in a SQLite database shared across processes and runs."""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path).expanduser()
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<ValidationLedger db="{self.db_path}">'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Opens the database on first use, and again in a forked child process."""
+        if self._conn is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.executescript(LEDGER_SQL.read_text(encoding="utf-8"))
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def lookup(self, scope: tuple, config_hash: str) -> Optional[LedgerEntry]:
+        """Returns the recorded outcome for a config under scope (see ledger_scope), or None."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT valid, errors FROM validation_results "
+                    "WHERE schema_hash=? AND registry_version=? AND config_hash=?",
+                    (*scope, config_hash),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return LedgerEntry(bool(row[0]), json.loads(row[1]))
+
+    def record(self, scope: tuple, config_hash: str, errors: List[str]) -> bool:
+        """Stores the outcome of validating a config under scope."""
+        try:
+            with self._lock:
+                self._connection().execute(
+                    "INSERT OR REPLACE INTO validation_results "
+                    "(schema_hash, registry_version, config_hash, valid, errors, recorded_ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (*scope, config_hash, not errors, json.dumps(list(errors)), time.time_ns() // 1_000_000),
+                )
+        except sqlite3.Error:
+            return False
+        return True
+
+    def clear(self):
+        """Deletes every recorded outcome."""
+        with self._lock:
+            self._connection().execute("DELETE FROM validation_results")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+def config_hash(config) -> str:
+    """Returns a content hash of an already-loaded config value.
+
+    SensitiveValues are hashed by their contents, since they all share one
+    masked repr.
+    """
+    return content_hash(repr(value_fingerprint(config, unmask=True)).encode("utf-8"))
+
+
+def validator_registry_version() -> str:
+    """Returns a hash of every registered validator's name, options and bytecode."""
+    global _registry_version
+    counter = CustomValidator.get_registry_version()
+    if _registry_version is not None and _registry_version[0] == counter:
+        return _registry_version[1]
+
+    digest = hashlib.sha256()
+    validators = {**ConfigValidator.get_all_validators(), **CustomValidator.get_all_validators()}
+    for name in sorted(validators, key=str):
+        func = getattr(validators[name], "__func__", validators[name])
+        options = ConfigValidator.get_validator_options(name)
+        digest.update(f"{name}\0{sorted(options.items())!r}\0".encode("utf-8"))
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            _update_with_code(digest, code)
+    _registry_version = (counter, digest.hexdigest())
+    return _registry_version[1]
+
+
+def _update_with_code(digest, code: CodeType):
+    """Feeds a code object, including nested functions, into digest deterministically."""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_with_code(digest, const)
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(map(repr, const))).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+    digest.update(repr(code.co_names).encode("utf-8"))
+
+
+def ledger_scope(schema: dict, digest: Optional[str]) -> Optional[tuple]:
+    """Returns the (schema hash, registry version) part of a ledger key.
+
+    Returns None when the ledger must not be used: the schema was not loaded
+    from a file, or it uses volatile validators.
+    """
+    if digest is None:
+        return None
+    version = validator_registry_version()
+    key = (digest, version)
+    if key not in _scopes:
+        _scopes[key] = None if _uses_volatile_validators(schema) else key
+    return _scopes[key]
+
+
+def _uses_volatile_validators(schema: dict) -> bool:
+    """True if any key, nested key or list item declares a volatile validator."""
+    stack = list(schema.values())
+    while stack:
+        rules = stack.pop()
+        if not isinstance(rules, dict):
+            continue
+        specs = rules.get("validators") or ([rules["validator"]] if rules.get("validator") else [])
+        for spec in specs:
+            name = spec.get("name") if isinstance(spec, dict) else spec
+            if isinstance(name, str) and ConfigValidator.get_validator_options(split_each(name)[0])["volatile"]:
+                return True
+        if isinstance(rules.get("items"), dict):
+            stack.append(rules["items"])
+        if isinstance(rules.get("schema"), dict):
+            stack.extend(rules["schema"].values())
+    return False
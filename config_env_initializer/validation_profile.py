@@ -0,0 +1,100 @@
+"""Optional wall and CPU timing of validator calls, aggregated per config key and per validator."""
+
+import inspect
+import json
+import threading
+import time
+from typing import List, Tuple
+
+DEFAULT_TOP_N = 10
+
+
+class ProfileStat:
+    """Accumulated call count and wall/CPU nanoseconds for one key or validator."""
+
+    __slots__ = ("calls", "wall_ns", "cpu_ns")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "wall_ms": self.wall_ns / 1e6, "cpu_ms": self.cpu_ns / 1e6}
+
+
+class ValidationProfile:
+    """Collects validator timings when passed to a validation function as profile=...
+
+    Keys are schema paths, with list items collapsed to `[]`, so a list of
+    50k entries aggregates into one row. CPU time is measured per thread, so
+    it stays meaningful for validators run concurrently.
+    """
+
+    def __init__(self):
+        self.by_key = {}
+        self.by_validator = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, validator: str, wall_ns: int, cpu_ns: int):
+        """Adds one validator call's timings to the key and validator totals."""
+        with self._lock:
+            for table, name in ((self.by_key, key), (self.by_validator, validator)):
+                stat = table.get(name)
+                if stat is None:
+                    stat = table[name] = ProfileStat()
+                stat.calls += 1
+                stat.wall_ns += wall_ns
+                stat.cpu_ns += cpu_ns
+
+    def timed(self, func, key: str, validator: str):
+        """Wraps a validator so each call is recorded under key and validator."""
+        perf_counter_ns, thread_time_ns = time.perf_counter_ns, time.thread_time_ns
+
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper(*args, **kwargs):
+                wall, cpu = perf_counter_ns(), thread_time_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.record(key, validator, perf_counter_ns() - wall, thread_time_ns() - cpu)
+            return async_wrapper
+
+        def wrapper(*args, **kwargs):
+            wall, cpu = perf_counter_ns(), thread_time_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(key, validator, perf_counter_ns() - wall, thread_time_ns() - cpu)
+        return wrapper
+
+    def top(self, n: int = DEFAULT_TOP_N, by: str = "validator") -> List[Tuple[str, ProfileStat]]:
+        """Returns the n slowest validators (or keys, with by="key") by total wall time."""
+        table = self.by_key if by == "key" else self.by_validator
+        return sorted(table.items(), key=lambda item: item[1].wall_ns, reverse=True)[:n]
+
+    def to_dict(self) -> dict:
+        """Returns all timings in milliseconds, suitable for json.dump."""
+        return {
+            "by_key": {name: stat.to_dict() for name, stat in self.top(len(self.by_key), by="key")},
+            "by_validator": {name: stat.to_dict() for name, stat in self.top(len(self.by_validator))},
+        }
+
+    def dump_json(self, path):
+        """Writes to_dict() to path as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def format_table(self, n: int = DEFAULT_TOP_N) -> str:
+        """Renders the top-n validators and keys as plain-text tables."""
+        lines = []
+        for title, by in (("Validator", "validator"), ("Key", "key")):
+            rows = self.top(n, by=by)
+            width = max([len(title)] + [len(name) for name, _ in rows])
+            lines.append(f"{title:<{width}}  {'calls':>8}  {'wall ms':>10}  {'cpu ms':>10}")
+            for name, stat in rows:
+                lines.append(
+                    f"{name:<{width}}  {stat.calls:>8}  {stat.wall_ns / 1e6:>10.3f}  {stat.cpu_ns / 1e6:>10.3f}"
+                )
+            lines.append("")
+        return "\n".join(lines).rstrip("\n")
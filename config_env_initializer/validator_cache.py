@@ -0,0 +1,155 @@
+"""Process-wide memoization of validator outcomes for validators registered as cacheable."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from config_env_initializer.fingerprint import value_fingerprint
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class ValidatorCacheStats(NamedTuple):
+    """A snapshot of a ValidatorCache's counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class _Entry(NamedTuple):
+    error: Optional[BaseException]
+    expires_at: Optional[float]
+    stamp: Optional[tuple]
+
+
+def stat_stamp(value) -> Optional[tuple]:
+    """Returns (mtime_ns, inode, size) for a path value, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(value)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+
+class ValidatorCache:
+    """A thread-safe LRU of validator outcomes keyed by validator, config key and value.
+
+    Entries for file-based validators are invalidated when the path's
+    mtime, inode or size changes; other entries expire after their ttl in
+    seconds (never, if ttl is None). Failures are cached like successes.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, cache_key, value, file_based: bool):
+        """Returns (True, cached error or None) on a fresh hit, else (False, stamp to store)."""
+        stamp = stat_stamp(value) if file_based else None
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                fresh = (entry.expires_at is None or time.monotonic() < entry.expires_at) and entry.stamp == stamp
+                if fresh:
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return True, entry.error
+                del self._entries[cache_key]
+            self.misses += 1
+        return False, stamp
+
+    def store(self, cache_key, error, ttl: Optional[float], stamp):
+        """Records an outcome, evicting least recently used entries beyond maxsize."""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[cache_key] = _Entry(error, expires_at, stamp)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> ValidatorCacheStats:
+        """Returns the current hit/miss/eviction counters."""
+        with self._lock:
+            return ValidatorCacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+VALIDATOR_CACHE = ValidatorCache()
+
+
+def validator_cache_stats() -> ValidatorCacheStats:
+    """Returns hit/miss statistics for the process-wide validator cache."""
+    return VALIDATOR_CACHE.stats()
+
+
+def cached_validator(func, token, ttl: Optional[float] = None, file_based: bool = False, cache: ValidatorCache = None):
+    """Wraps a validator so its outcome for a (key, value) pair is served from the cache.
+
+    token identifies the validator and its factory arguments. The
+    process-wide VALIDATOR_CACHE is used unless another cache is given.
+    """
+    def begin(value, key):
+        selected = cache if cache is not None else VALIDATOR_CACHE
+        if not selected.enabled:
+            return None, None, False, None
+        cache_key = (token, key, value_fingerprint(value))
+        hit, result = selected.lookup(cache_key, value, file_based)
+        return selected, cache_key, hit, result
+
+    from inspect import iscoroutinefunction
+
+    if iscoroutinefunction(func):
+        async def async_wrapper(value, key=None):
+            selected, cache_key, hit, result = begin(value, key)
+            if selected is None:
+                return await func(value, key)
+            if hit:
+                _raise_cached(result)
+                return None
+            try:
+                await func(value, key)
+            except Exception as e:
+                selected.store(cache_key, e, ttl, result)
+                raise
+            selected.store(cache_key, None, ttl, result)
+        return async_wrapper
+
+    def wrapper(value, key=None):
+        selected, cache_key, hit, result = begin(value, key)
+        if selected is None:
+            return func(value, key)
+        if hit:
+            _raise_cached(result)
+            return None
+        try:
+            func(value, key)
+        except Exception as e:
+            selected.store(cache_key, e, ttl, result)
+            raise
+        selected.store(cache_key, None, ttl, result)
+    return wrapper
+
+
+def _raise_cached(error):
+    """Re-raises a cached validator failure without growing its traceback."""
+    if error is not None:
+        raise error.with_traceback(None)
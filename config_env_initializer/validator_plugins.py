@@ -0,0 +1,79 @@
+"""Lazy discovery of validators published by installed packages through entry points.
+
+A package exposes validators in its packaging metadata, e.g. in pyproject.toml:
+
+    [project.entry-points."config_env_initializer.validators"]
+    checksum_matches = "my_validators.files:checksum_matches"
+
+Only the entry point names are read up front. The module behind a name is
+imported the first time a schema references that name.
+"""
+
+import threading
+from typing import Callable, Mapping, Optional
+
+from config_env_initializer.config_validator import CustomValidator
+
+ENTRY_POINT_GROUP = "config_env_initializer.validators"
+
+_index = None
+_lock = threading.Lock()
+
+
+def plugin_index() -> Mapping[str, object]:
+    """Returns {validator name: entry point} for installed plugins, read once per process."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = _read_entry_points()
+    return _index
+
+
+def refresh_plugin_index():
+    """Forgets the cached entry point index, e.g. after installing a plugin package."""
+    global _index
+    with _lock:
+        _index = None
+
+
+def _read_entry_points() -> dict:
+    """Reads the validator entry points without importing any of them."""
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group=ENTRY_POINT_GROUP)
+    else:  # Python < 3.10
+        group = eps.get(ENTRY_POINT_GROUP, ())
+    return {ep.name: ep for ep in group}
+
+
+def load_plugin_validator(name) -> Optional[Callable]:
+    """Imports and registers the plugin validator called name; None if no plugin provides it.
+
+    The entry point may name the validator function itself or a module whose
+    import registers it with @CustomValidator.register, which also lets the
+    plugin declare options such as io_bound or cacheable. Import errors
+    propagate to the caller.
+    """
+    if not isinstance(name, str):
+        return None
+    registry = CustomValidator.get_all_validators()
+    if name in registry:
+        return _unwrap(registry[name])
+    entry_point = plugin_index().get(name)
+    if entry_point is None:
+        return None
+
+    loaded = entry_point.load()
+    if name not in registry:
+        if not callable(loaded):
+            raise ImportError(f"Entry point '{name}' ({entry_point.value}) did not provide a validator.")
+        CustomValidator.register(name=name)(loaded)
+    return _unwrap(registry[name])
+
+
+def _unwrap(validator):
+    """Returns the function behind a registry entry's staticmethod."""
+    return getattr(validator, "__func__", validator)
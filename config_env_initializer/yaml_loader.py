@@ -0,0 +1,58 @@
+"""Shared YAML reading layer that prefers PyYAML's libyaml-backed C loader."""
+
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+LIBYAML_AVAILABLE = SafeLoader is not yaml.SafeLoader
+
+
+def safe_load(stream):
+    """Parses a single YAML document using the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_yaml_file(path: Path):
+    """Reads and parses a YAML file, returning its contents (None if empty)."""
+    with open(path, "rb") as f:
+        return safe_load(f)
+
+
+def load_yaml_with_lines(path: Path):
+    """Parses a YAML file once, returning (data, lines).
+
+    lines maps the path of every mapping key and sequence item, as a tuple of
+    keys and indices, to its 1-based line number.
+    """
+    with open(path, "rb") as f:
+        loader = SafeLoader(f)
+        try:
+            node = loader.get_single_node()
+            data = loader.construct_document(node) if node is not None else None
+        finally:
+            loader.dispose()
+    return data, _line_index(node)
+
+
+def _line_index(root) -> dict:
+    """Walks a composed node tree, recording where each key and list item starts."""
+    lines = {}
+    stack = [((), root)] if root is not None else []
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                child = path + (key_node.value,)
+                lines[child] = key_node.start_mark.line + 1
+                stack.append((child, value_node))
+        elif isinstance(node, yaml.SequenceNode):
+            for index, item_node in enumerate(node.value):
+                child = path + (index,)
+                lines[child] = item_node.start_mark.line + 1
+                stack.append((child, item_node))
+    return lines
@@ -0,0 +1,65 @@
+"""Compares peak memory and time of deepcopy-based validation with copy-on-write validation."""
+
+import argparse
+import time
+import tracemalloc
+from copy import deepcopy
+
+from config_env_initializer.schema_utils import compile_schema
+
+
+def build_config(target_mb: float) -> dict:
+    """Returns a config with large nested lists and maps of roughly target_mb in memory."""
+    entries = int(target_mb * 1024 * 1024 / 330)
+    return {
+        "project_name": "benchmark",
+        "hosts": [f"host-{i}.internal.example.com" for i in range(entries)],
+        "routes": {f"/api/v1/resource_{i}": {"upstream": f"svc-{i % 97}", "timeout": i % 30} for i in range(entries)},
+        "ports": list(range(entries)),
+    }
+
+
+class BenchmarkSchema:
+    schema = {
+        "project_name": {"type": str, "required": True},
+        "hosts": {"type": list, "required": True},
+        "routes": {"type": dict, "required": True},
+        "ports": {"type": list, "required": True},
+        "log_level": {"type": str, "required": False, "default": "INFO", "validators": ["log_level_valid"]},
+    }
+
+
+def measure(label: str, func):
+    """Runs func under tracemalloc and prints peak allocation and wall time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} peak {peak / (1024 * 1024):8.2f} MB   {elapsed * 1000:9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=10.0, help="Approximate config size in memory.")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    config = build_config(args.size_mb)
+    config_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    compiled = compile_schema(BenchmarkSchema)
+    print(f"Config with {len(config['hosts'])} hosts/routes/ports: {config_mb:.2f} MB in memory")
+
+    def deepcopy_validation():
+        validated = deepcopy(config)
+        compiled.validate(validated, copy=False)
+
+    measure("deepcopy + validate", deepcopy_validation)
+    measure("copy-on-write (default)", lambda: compiled.validate(config))
+    measure("in place (copy=False)", lambda: compiled.validate(dict(config), copy=False))
+
+
+if __name__ == "__main__":
+    main()
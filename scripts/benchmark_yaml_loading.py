@@ -0,0 +1,63 @@
+"""Compares pure-Python and libyaml-backed parsing of a large generated config."""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from config_env_initializer.yaml_loader import LIBYAML_AVAILABLE, SafeLoader
+
+
+def build_config(keys: int) -> dict:
+    """Returns a config dict shaped like a large generated environment config."""
+    return {
+        f"service_{i}": {
+            "host": f"host-{i}.internal",
+            "port": 8000 + (i % 1000),
+            "enabled": i % 3 != 0,
+            "tags": [f"tag_{i % 7}", f"tier_{i % 4}", "generated"],
+            "limits": {"cpu": 0.5 + (i % 8), "memory_mb": 256 * (1 + i % 16)},
+        }
+        for i in range(keys)
+    }
+
+
+def time_loader(text: str, loader, repeat: int) -> float:
+    """Returns the best-of-repeat wall time (seconds) to parse text with loader."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        yaml.load(text, Loader=loader)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=10000, help="Number of top-level entries to generate.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader; the best time is reported.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large_config.yaml"
+        path.write_text(yaml.safe_dump(build_config(args.keys)), encoding="utf-8")
+        text = path.read_text(encoding="utf-8")
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+    print(f"Config size: {size_mb:.2f} MB ({args.keys} entries)")
+    python_time = time_loader(text, yaml.SafeLoader, args.repeat)
+    print(f"yaml.SafeLoader:   {python_time:.3f}s")
+
+    if not LIBYAML_AVAILABLE:
+        print("yaml.CSafeLoader:  unavailable (PyYAML built without libyaml)")
+        return
+
+    c_time = time_loader(text, SafeLoader, args.repeat)
+    print(f"yaml.CSafeLoader:  {c_time:.3f}s")
+    print(f"Speedup:           {python_time / c_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import textwrap
+
+import pytest
+
+# Keys every ConfigLoader project needs; tests append their own.
+BASE_SCHEMA_ENTRIES = (
+    '"log_dir": {"type": str, "required": False, "default": "logs"}',
+    '"log_level": {"type": str, "required": False, "default": "INFO"}',
+    '"log_microseconds": {"type": bool, "required": False, "default": False}',
+    '"execution_monitor_db_path": {"type": str, "required": True}',
+)
+
+
+@pytest.fixture
+def write_project(tmp_path):
+    """Returns a factory that writes schema.py and config.yaml for a ConfigLoader project in tmp_path.
+
+    Positional arguments are extra schema entries as source text and
+    `config` is extra YAML appended after the logging and monitor paths.
+    """
+    def write(*schema_entries, config=""):
+        entries = "".join(f"    {entry},\n" for entry in BASE_SCHEMA_ENTRIES + schema_entries)
+        schema_path = tmp_path / "schema.py"
+        schema_path.write_text(f"schema = {{\n{entries}}}\n")
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            f"log_dir: {tmp_path / 'logs'}\n"
+            f"execution_monitor_db_path: {tmp_path / 'db' / 'metrics.db'}\n"
+            + textwrap.dedent(config)
+        )
+        return config_path, schema_path
+
+    return write
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from config_env_initializer.__main__ import main
+from config_env_initializer.batch_validation import expand_config_paths, validate_files
+
+SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True},
+    "level": {"type": str, "required": True, "validators": ["log_level_valid"]},
+}
+"""
+
+
+def write_configs(tmp_path: Path, count: int = 4):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(SCHEMA)
+    config_dir = tmp_path / "configs" / "nested"
+    config_dir.mkdir(parents=True)
+    for i in range(count):
+        level = "LOUD" if i == 0 else "INFO"
+        (config_dir / f"env_{i}.yaml").write_text(yaml.dump({"name": f"env{i}", "level": level}))
+    return schema_path
+
+
+def test_expand_config_paths_supports_recursive_globs(tmp_path):
+    write_configs(tmp_path, count=3)
+    paths = expand_config_paths([str(tmp_path / "configs" / "**" / "*.yaml")])
+    assert [p.name for p in paths] == ["env_0.yaml", "env_1.yaml", "env_2.yaml"]
+
+
+def test_expand_config_paths_deduplicates(tmp_path):
+    write_configs(tmp_path, count=1)
+    path = tmp_path / "configs" / "nested" / "env_0.yaml"
+    assert expand_config_paths([str(path), str(path)]) == [path]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files_reports_each_file_in_order(tmp_path, jobs):
+    schema_path = write_configs(tmp_path)
+    paths = expand_config_paths([str(tmp_path / "configs" / "**" / "*.yaml")])
+
+    results = list(validate_files(paths, schema_path, jobs=jobs))
+
+    assert [r["path"] for r in results] == [str(p) for p in paths]
+    assert [r["valid"] for r in results] == [False, True, True, True]
+    assert "level: validation error" in results[0]["errors"][0]
+    assert all(r["elapsed_ms"] >= 0 for r in results)
+
+
+def test_validate_files_reports_missing_file(tmp_path):
+    schema_path = write_configs(tmp_path, count=0)
+    results = list(validate_files([tmp_path / "missing.yaml"], schema_path))
+    assert results[0]["exception"].startswith("FileNotFoundError")
+
+
+def test_cli_streams_json_lines(tmp_path, monkeypatch, capsys):
+    schema_path = write_configs(tmp_path, count=3)
+    pattern = str(tmp_path / "configs" / "**" / "*.yaml")
+    monkeypatch.setattr(sys, "argv", ["config-init", "validate-config", pattern, "--schema", str(schema_path), "-j", "1"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exc_info.value.code == 1
+    assert [line["valid"] for line in lines] == [False, True, True]
+
+
+def test_cli_startup_defers_subcommand_modules():
+    deferred = (
+        "sqlite3", "concurrent.futures", "yaml", "config_env_initializer.validation_ledger",
+        "config_env_initializer.config_watcher", "config_env_initializer.streaming_validation",
+        "config_env_initializer.validation_profile",
+    )
+    script = (
+        "import sys, config_env_initializer.__main__, config_env_initializer.batch_validation\n"
+        f"print([name for name in {deferred!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+    assert result.stdout.strip() == "[]"
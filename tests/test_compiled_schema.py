@@ -0,0 +1,136 @@
+import pytest
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.schema_utils import (
+    CompiledSchema,
+    compile_schema,
+    validate_config_against_schema,
+)
+from config_env_initializer.exceptions import ValidationError
+
+
+class RangeSchema:
+    schema = {
+        "timeout": {
+            "type": int,
+            "required": True,
+            "validators": [{"name": "int_in_range", "min_value": 1, "max_value": 10}],
+        },
+        "log_level": {
+            "type": str,
+            "required": False,
+            "validators": ["log_level_valid"],
+            "default": "INFO",
+        },
+    }
+
+
+def test_compile_schema_resolves_factories_once():
+    calls = []
+
+    @CustomValidator.register(name="counting_factory")
+    def counting_factory(*, limit):
+        calls.append(limit)
+
+        def validator(value, key=None):
+            if value > limit:
+                raise ValueError(f"{key} exceeds {limit}")
+        return validator
+
+    class CountingSchema:
+        schema = {"n": {"type": int, "required": True, "validators": [{"name": "counting_factory", "limit": 3}]}}
+
+    compiled = compile_schema(CountingSchema)
+    for _ in range(5):
+        compiled.validate({"n": 2})
+
+    assert calls == [3]
+
+
+def test_compiled_schema_is_immutable():
+    compiled = compile_schema(RangeSchema)
+    assert isinstance(compiled, CompiledSchema)
+    with pytest.raises(AttributeError):
+        compiled.plans = ()
+
+
+def test_compiled_and_module_validation_agree():
+    compiled = compile_schema(RangeSchema)
+    config = {"timeout": 99, "log_level": "LOUD"}
+
+    with pytest.raises(ValidationError) as from_module:
+        validate_config_against_schema(config, RangeSchema)
+    with pytest.raises(ValidationError) as from_plan:
+        validate_config_against_schema(config, compiled)
+
+    assert from_module.value.errors == from_plan.value.errors
+    assert len(from_plan.value.errors) == 2
+
+
+def test_compiled_schema_applies_defaults_without_mutating_input():
+    compiled = compile_schema(RangeSchema)
+    config = {"timeout": 5}
+
+    validated = compiled.validate(config)
+
+    assert validated == {"timeout": 5, "log_level": "INFO"}
+    assert config == {"timeout": 5}
+
+
+def test_unknown_validator_reported_on_each_run():
+    class UnknownSchema:
+        schema = {"name": {"type": str, "required": True, "validators": ["no_such_validator"]}}
+
+    compiled = compile_schema(UnknownSchema)
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            compiled.validate({"name": "x"})
+        assert "Validator 'no_such_validator' not found" in exc_info.value.errors[0]
+
+
+class NestedSchema:
+    schema = {
+        "hosts": {"type": list, "required": True},
+        "log_level": {"type": str, "required": False, "default": "INFO"},
+    }
+
+
+def test_validated_config_shares_unchanged_subtrees():
+    config = {"hosts": ["a", "b"]}
+    validated = validate_config_against_schema(config, NestedSchema)
+
+    assert validated["hosts"] is config["hosts"]
+    assert validated["log_level"] == "INFO"
+    assert "log_level" not in config
+
+
+def test_own_detaches_a_shared_subtree():
+    config = {"hosts": ["a", "b"]}
+    validated = compile_schema(NestedSchema).validate(config)
+
+    validated.own("hosts").append("c")
+
+    assert validated["hosts"] == ["a", "b", "c"]
+    assert config["hosts"] == ["a", "b"]
+
+
+def test_copy_false_validates_in_place():
+    config = {"hosts": ["a"]}
+    validated = validate_config_against_schema(config, NestedSchema, copy=False)
+
+    assert validated is config
+    assert config["log_level"] == "INFO"
+
+
+def test_flat_schemas_skip_the_nested_walker(monkeypatch):
+    from config_env_initializer import schema_utils
+
+    monkeypatch.setattr(schema_utils, "_drain", lambda *args, **kwargs: pytest.fail("flat schema used the stack walker"))
+    compiled = compile_schema(RangeSchema)
+
+    assert compiled.validate({"timeout": 5}) == {"timeout": 5, "log_level": "INFO"}
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"timeout": 50, "log_level": "LOUD"})
+    assert [error.split("]")[0] for error in exc.value.errors] == ["[timeout", "[log_level"]
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"timeout": 50, "log_level": "LOUD"}, max_errors=1)
+    assert len(exc.value.errors) == 1
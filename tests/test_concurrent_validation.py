@@ -0,0 +1,165 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from config_env_initializer.config_validator import ConfigValidator, CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema
+
+ACTIVE = []
+PEAK = []
+LOCK = threading.Lock()
+
+
+@CustomValidator.register(name="slow_remote_check", io_bound=True)
+def slow_remote_check(value, key=None):
+    with LOCK:
+        ACTIVE.append(key)
+        PEAK.append(len(ACTIVE))
+    time.sleep(0.1)
+    with LOCK:
+        ACTIVE.remove(key)
+    if value == "bad":
+        raise ValueError(f"{key} is unreachable")
+
+
+@CustomValidator.register(name="hanging_check", io_bound=True)
+def hanging_check(value, key=None):
+    time.sleep(1)
+
+
+@CustomValidator.register(name="async_remote_check")
+async def async_remote_check(value, key=None):
+    await asyncio.sleep(0.1)
+    if value == "bad":
+        raise ValueError(f"{key} is unreachable")
+
+
+def make_schema(validator, keys=("a", "b", "c", "d")):
+    class Schema:
+        schema = {
+            key: {"type": str, "required": True, "validators": [validator]}
+            for key in keys
+        }
+    return compile_schema(Schema)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    ACTIVE.clear()
+    PEAK.clear()
+
+
+def test_io_bound_validators_run_concurrently():
+    compiled = make_schema("slow_remote_check")
+
+    start = time.monotonic()
+    compiled.validate({"a": "x", "b": "x", "c": "x", "d": "x"})
+
+    assert time.monotonic() - start < 0.3
+    assert max(PEAK) > 1
+
+
+def test_io_workers_one_runs_serially():
+    compiled = make_schema("slow_remote_check")
+
+    compiled.validate({"a": "x", "b": "x", "c": "x", "d": "x"}, io_workers=1)
+
+    assert max(PEAK) == 1
+
+
+def test_errors_are_collected_in_schema_order():
+    class Schema:
+        schema = {
+            "a": {"type": str, "required": True, "validators": ["slow_remote_check"]},
+            "b": {"type": int, "required": True},
+            "c": {"type": str, "required": True, "validators": ["slow_remote_check"]},
+        }
+
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(Schema).validate({"a": "bad", "b": "oops", "c": "bad"})
+
+    assert exc.value.errors == [
+        "[a] slow_remote_check: a is unreachable",
+        "[b] Config key 'b' must be of type int, but got str.",
+        "[c] slow_remote_check: c is unreachable",
+    ]
+
+
+def test_timed_out_validator_is_reported():
+    compiled = make_schema("hanging_check", keys=("a", "b"))
+
+    start = time.monotonic()
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"a": "x", "b": "x"}, io_timeout=0.1)
+
+    assert time.monotonic() - start < 0.8
+    assert exc.value.errors == [
+        "[a] hanging_check: timed out after 0.1s",
+        "[b] hanging_check: timed out after 0.1s",
+    ]
+
+
+def test_async_validators_are_awaited():
+    compiled = make_schema("async_remote_check")
+    assert all(plan.steps[0].is_async for plan in compiled.plans)
+
+    start = time.monotonic()
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"a": "x", "b": "bad", "c": "x", "d": "x"})
+
+    assert time.monotonic() - start < 0.3
+    assert exc.value.errors == ["[b] async_remote_check: b is unreachable"]
+
+
+def test_async_validators_work_serially():
+    compiled = make_schema("async_remote_check", keys=("a",))
+
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"a": "bad"}, io_workers=1)
+
+    assert exc.value.errors == ["[a] async_remote_check: a is unreachable"]
+
+
+def test_builtin_file_exists_is_io_bound():
+    assert ConfigValidator.get_validator_options("file_exists")["io_bound"] is True
+    assert ConfigValidator.get_validator_options("port_range")["io_bound"] is False
+
+
+def test_timed_out_validator_does_not_delay_process_exit(tmp_path):
+    script = tmp_path / "hang.py"
+    script.write_text(textwrap.dedent("""\
+        import threading
+
+        from config_env_initializer.config_validator import CustomValidator
+        from config_env_initializer.exceptions import ValidationError
+        from config_env_initializer.schema_utils import compile_schema
+
+        @CustomValidator.register(name="never_returns", io_bound=True)
+        def never_returns(value, key=None):
+            threading.Event().wait()
+
+        class Schema:
+            schema = {key: {"type": str, "required": True, "validators": ["never_returns"]} for key in "abc"}
+
+        try:
+            compile_schema(Schema).validate({"a": "x", "b": "x", "c": "x"}, io_workers=2, io_timeout=0.2)
+        except ValidationError as e:
+            print(len(e.errors))
+    """))
+
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, timeout=30,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+
+    assert result.stdout.strip() == "3", result.stderr
+    assert time.monotonic() - start < 10
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from config_env_initializer import config_loader as config_loader_module
+from config_env_initializer.config_cache import ConfigCache
+from config_env_initializer.fingerprint import file_fingerprint
+from config_env_initializer.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def project(write_project):
+    return write_project(
+        '"name": {"type": str, "required": True, "validators": ["is_non_empty_str"]}',
+        config="Name: cached\n",
+    )
+
+
+def test_second_load_is_a_cache_hit(tmp_path, project, monkeypatch):
+    config_path, schema_path = project
+    cache_dir = tmp_path / "cache"
+
+    first = ConfigLoader(str(config_path), str(schema_path), cache_dir=str(cache_dir))
+    assert first.cache_hit is False
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("validation should be skipped on a cache hit")
+
+    monkeypatch.setattr(config_loader_module, "validate_config_against_schema", fail_validation)
+    second = ConfigLoader(str(config_path), str(schema_path), cache_dir=str(cache_dir))
+
+    assert second.cache_hit is True
+    assert second.config["name"] == "cached"
+    assert second.raw_config == first.raw_config
+
+
+def test_config_change_invalidates_entry(tmp_path, project):
+    config_path, schema_path = project
+    cache = ConfigCache(tmp_path / "cache")
+
+    key = cache.cache_key(config_path, schema_path)
+    cache.store(config_path, key, {"name": "old"}, {"name": "old"})
+    assert cache.load(config_path, key) == ({"name": "old"}, {"name": "old"})
+
+    config_path.write_text(config_path.read_text().replace("cached", "changed"))
+    assert cache.load(config_path, cache.cache_key(config_path, schema_path)) is None
+
+
+def test_schema_fingerprint_is_part_of_key(tmp_path, project):
+    config_path, schema_path = project
+    cache = ConfigCache(tmp_path / "cache")
+    before = cache.cache_key(config_path, schema_path)
+
+    schema_path.write_text(schema_path.read_text() + "\n# edited\n")
+    assert cache.cache_key(config_path, schema_path) != before
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path, project):
+    config_path, schema_path = project
+    cache = ConfigCache(tmp_path / "cache")
+    key = cache.cache_key(config_path, schema_path)
+
+    cache.cache_dir.mkdir(parents=True)
+    cache.entry_path(config_path).write_bytes(b"not a pickle")
+    assert cache.load(config_path, key) is None
+
+
+def test_unpicklable_config_is_not_stored(tmp_path, project):
+    config_path, schema_path = project
+    cache = ConfigCache(tmp_path / "cache")
+    key = cache.cache_key(config_path, schema_path)
+
+    assert cache.store(config_path, key, {}, {"callback": lambda: None}) is False
+    assert not cache.entry_path(config_path).exists()
+
+
+def test_unwritable_cache_dir_does_not_break_loading(tmp_path, project, monkeypatch):
+    config_path, schema_path = project
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    loader = ConfigLoader(str(config_path), str(schema_path), cache_dir=str(blocker / "cache"), lazy=True)
+    assert loader.config["name"] == "cached"
+
+    cache = ConfigCache(tmp_path / "cache")
+    key = cache.cache_key(config_path, schema_path)
+    monkeypatch.setattr(os, "replace", lambda *args: (_ for _ in ()).throw(PermissionError("read-only")))
+    assert cache.store(config_path, key, {}, {"name": "cached"}) is False
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_file_fingerprint_tracks_content(tmp_path):
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1")
+    first = file_fingerprint(path)
+    path.write_text("a: 2")
+    os.utime(path, ns=(first[1], first[1]))
+
+    assert file_fingerprint(path)[3] != first[3]
@@ -0,0 +1,157 @@
+import os
+import textwrap
+
+import pytest
+
+from config_env_initializer import config_layers, yaml_loader
+from config_env_initializer.config_cache import ConfigCache
+from config_env_initializer.config_layers import LayeredConfig, deep_merge, load_layer
+from config_env_initializer.config_loader import ConfigLoader
+from config_env_initializer.exceptions import ValidationError
+
+SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True},
+    "log_level": {"type": str, "required": False, "default": "INFO", "validators": ["log_level_valid"]},
+    "db": {
+        "type": dict,
+        "required": True,
+        "schema": {"host": {"type": str, "required": True}, "port": {"type": int, "required": True}},
+    },
+    "hosts": {"type": list, "required": False, "default": []},
+}
+"""
+
+
+def write(path, text):
+    path.write_text(textwrap.dedent(text))
+    stat = path.stat()
+    # Layers rewritten within one test must never share a timestamp.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    return path
+
+
+@pytest.fixture
+def layer_files(tmp_path):
+    base = write(tmp_path / "base.yaml", """\
+        name: svc
+        Log Level: DEBUG
+        db:
+          host: db.internal
+          port: 5432
+        hosts: [a, b]
+    """)
+    env = write(tmp_path / "prod.yaml", """\
+        log_level: WARNING
+        db:
+          host: db.prod
+    """)
+    host = write(tmp_path / "host.yaml", """\
+        hosts: [c]
+    """)
+    return [base, env, host]
+
+
+def test_deep_merge_precedence_and_sharing():
+    base = {"a": {"x": 1, "y": [1]}, "b": [1, 2], "c": {"k": 1}}
+    override = {"a": {"x": 2}, "b": [3], "d": None}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {"a": {"x": 2, "y": [1]}, "b": [3], "c": {"k": 1}, "d": None}
+    assert base == {"a": {"x": 1, "y": [1]}, "b": [1, 2], "c": {"k": 1}}
+    assert merged["c"] is base["c"]
+
+
+def test_layers_merge_with_later_files_winning(layer_files):
+    merged = LayeredConfig(layer_files).resolve()
+
+    assert merged == {
+        "name": "svc",
+        "log_level": "WARNING",
+        "db": {"host": "db.prod", "port": 5432},
+        "hosts": ["c"],
+    }
+
+
+def test_only_changed_layers_are_reparsed_and_remerged(layer_files, monkeypatch):
+    layered = LayeredConfig(layer_files)
+    layered.resolve()
+
+    parses, merges = [], []
+    real_parse, real_merge = yaml_loader.load_yaml_with_lines, config_layers.deep_merge
+    monkeypatch.setattr(yaml_loader, "load_yaml_with_lines", lambda path: parses.append(path.name) or real_parse(path))
+    monkeypatch.setattr(config_layers, "deep_merge", lambda base, override: merges.append(1) or real_merge(base, override))
+
+    assert layered.resolve()["hosts"] == ["c"]
+    assert parses == [] and merges == []
+
+    write(layer_files[2], "hosts: [d]\n")
+    assert layered.resolve()["hosts"] == ["d"]
+    assert parses == ["host.yaml"] and len(merges) == 1
+
+    write(layer_files[0], "name: svc2\ndb: {host: h, port: 1}\n")
+    assert layered.resolve()["name"] == "svc2"
+    assert parses == ["host.yaml", "base.yaml"] and len(merges) == 3
+
+
+def test_load_layer_normalizes_top_level_keys_and_lines(layer_files):
+    layer = load_layer(layer_files[0])
+    assert layer.data["log_level"] == "DEBUG"
+    assert layer.lines[("log_level",)] == 2
+    assert layer.lines[("db", "port")] == 5
+
+
+def test_empty_layers_override_nothing(tmp_path, layer_files):
+    empty = write(tmp_path / "empty.yaml", "")
+    comments = write(tmp_path / "comments.yaml", "# no overrides for this host\n")
+
+    merged = LayeredConfig([*layer_files, empty, comments]).resolve()
+
+    assert merged == LayeredConfig(layer_files).resolve()
+    assert load_layer(comments).data == {}
+
+
+def test_origin_points_at_the_layer_that_set_a_value(layer_files):
+    layered = LayeredConfig(layer_files)
+    layered.resolve()
+    base, env, host = layer_files
+
+    assert layered.origin(("db", "host")) == (env, 3)
+    assert layered.origin(("db", "port")) == (base, 5)
+    assert layered.origin(("hosts", 0)) == (host, 1)
+    assert layered.origin(("db", "user")) == (env, 2)
+    assert layered.origin(("missing",)) is None
+
+
+def test_loader_validates_merged_layers_and_attributes_errors(tmp_path, layer_files):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(SCHEMA)
+
+    loader = ConfigLoader([str(path) for path in layer_files], str(schema_path), lazy=True)
+    assert loader.config["db"] == {"host": "db.prod", "port": 5432}
+    assert loader.watched_paths()[:3] == layer_files
+
+    write(layer_files[2], "log_level: LOUD\ndb:\n  port: nope\n")
+    with pytest.raises(ValidationError) as exc:
+        loader.reload()
+
+    host = layer_files[2]
+    assert len(exc.value.errors) == 2
+    assert exc.value.errors[0].startswith("[log_level]") and exc.value.errors[0].endswith(f"({host}:1)")
+    assert exc.value.errors[1].startswith("[db.port]") and exc.value.errors[1].endswith(f"({host}:3)")
+
+
+def test_loader_caches_layered_configs_on_disk(tmp_path, layer_files):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(SCHEMA)
+    paths = [str(path) for path in layer_files]
+
+    assert not ConfigLoader(paths, str(schema_path), cache_dir=str(tmp_path / "cache"), lazy=True).cache_hit
+    assert ConfigLoader(paths, str(schema_path), cache_dir=str(tmp_path / "cache"), lazy=True).cache_hit
+
+    write(layer_files[1], "log_level: ERROR\n")
+    loader = ConfigLoader(paths, str(schema_path), cache_dir=str(tmp_path / "cache"), lazy=True)
+    assert not loader.cache_hit
+    assert loader.config["log_level"] == "ERROR"
+    assert ConfigCache(tmp_path / "cache").entry_path(layer_files) != ConfigCache(tmp_path / "cache").entry_path(layer_files[2])
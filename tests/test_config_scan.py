@@ -0,0 +1,143 @@
+import pytest
+
+from config_env_initializer import schema_utils
+from config_env_initializer.config_scan import format_path, scan_config
+from config_env_initializer.config_utils import PreparedSchema, validate_config_data
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.incremental_validation import IncrementalValidator
+from config_env_initializer.schema_utils import compile_schema, validate_config_against_schema
+from config_env_initializer.sensitive import SensitiveValue, mask_config_for_logging
+
+
+def test_scan_finds_nested_placeholders_and_sensitive_values():
+    secret = SensitiveValue("hunter2")
+    config = {
+        "name": "<REQUIRED>",
+        "servers": [{"host": "a"}, {"host": " <OPTIONAL> ", "token": secret}],
+        "db": {"password": secret, "tags": ("x", "<REQUIRED>")},
+        "auth": {"google": {"client_id": "<REQUIRED>"}},
+    }
+
+    scan = scan_config(config)
+
+    assert scan.placeholders == {
+        ("name",): "<REQUIRED>",
+        ("servers", 1, "host"): " <OPTIONAL> ",
+        ("db", "tags", 1): "<REQUIRED>",
+    }
+    assert scan.sensitive == (("servers", 1, "token"), ("db", "password"), ("auth", "google"))
+    assert list(scan.placeholders_under(("servers",))) == [("servers", 1, "host")]
+
+
+def test_format_path():
+    assert format_path(("servers", 1, "host")) == "servers[1].host"
+    assert format_path(("name",)) == "name"
+
+
+def test_masking_reaches_nested_values_without_mutating_config():
+    config = {
+        "auth": {"google": {"client_id": "id"}},
+        "servers": [{"token": SensitiveValue("t")}, {"host": "b"}],
+        "plain": {"x": 1},
+    }
+
+    masked = mask_config_for_logging(config)
+
+    assert masked["auth"] == {"google": "*****"}
+    assert masked["servers"] == [{"token": "*****"}, {"host": "b"}]
+    assert masked["plain"] is config["plain"]
+    assert isinstance(config["servers"][0]["token"], SensitiveValue)
+    assert config["auth"] == {"google": {"client_id": "id"}}
+
+
+def test_masking_reuses_a_given_scan():
+    config = {"token": SensitiveValue("t"), "other": "x"}
+    masked = mask_config_for_logging(config, scan=scan_config(config)._replace(sensitive=()))
+    assert masked == config
+
+
+def test_compiled_validation_reports_nested_placeholders():
+    class Schema:
+        schema = {"hosts": {"type": list, "required": True}, "extra": {"required": False}}
+
+    with pytest.raises(ValidationError) as exc:
+        validate_config_against_schema({"hosts": ["a", "<REQUIRED>"], "extra": {"k": ["<OPTIONAL>"]}}, Schema)
+
+    assert exc.value.errors == [
+        "[hosts[1]] contains unresolved placeholder: <REQUIRED>",
+        "[extra.k[0]] contains unresolved placeholder: <OPTIONAL>",
+    ]
+
+
+def test_legacy_validation_reports_nested_placeholders():
+    schema = {"db": {"type": dict, "required": True}, "name": {"type": str, "required": True}}
+    prepared = PreparedSchema(schema, {"db": [], "name": []})
+
+    errors = validate_config_data({"db": {"hosts": ["<REQUIRED>"]}, "name": "<REQUIRED>"}, prepared)
+
+    assert errors == [
+        "db.hosts[0]: contains placeholder value '<REQUIRED>', must be replaced",
+        "name: contains placeholder value '<REQUIRED>', must be replaced",
+    ]
+
+
+def test_only_the_top_level_auth_mapping_is_skipped():
+    config = {"service": {"auth": {"token": "<REQUIRED>"}}, "auth": {"google": {"id": "<REQUIRED>"}}}
+    assert scan_config(config).placeholders == {("service", "auth", "token"): "<REQUIRED>"}
+    assert scan_config(config["service"], prefix=("service",)).placeholders == {("service", "auth", "token"): "<REQUIRED>"}
+
+    class Schema:
+        schema = {"service": {"type": dict, "required": True}}
+
+    for generate_code in (False, True):
+        with pytest.raises(ValidationError) as exc:
+            compile_schema(Schema, generate_code=generate_code).validate(config)
+        assert exc.value.errors == ["[service.auth.token] contains unresolved placeholder: <REQUIRED>"]
+
+    prepared = PreparedSchema(Schema.schema, {"service": []})
+    assert validate_config_data(config, prepared) == [
+        "service.auth.token: contains placeholder value '<REQUIRED>', must be replaced",
+    ]
+
+
+def test_compiled_validation_scans_only_free_form_values(monkeypatch):
+    class Schema:
+        schema = {
+            "a": {"type": dict, "required": True},
+            "b": {"type": list, "required": True},
+            "c": {"type": dict, "required": False, "default": {"k": "<REQUIRED>"}},
+            "d": {"type": str, "required": True},
+        }
+
+    scanned = []
+    real_scan = schema_utils.scan_config
+    monkeypatch.setattr(schema_utils, "scan_config", lambda value, **kwargs: scanned.append(kwargs["prefix"]) or real_scan(value, **kwargs))
+
+    for generate_code in (False, True):
+        scanned.clear()
+        with pytest.raises(ValidationError) as exc:
+            compile_schema(Schema, generate_code=generate_code).validate({"a": {"x": {"y": 1}}, "b": [["<OPTIONAL>"]], "d": "x"})
+        assert exc.value.errors == [
+            "[b[0][0]] contains unresolved placeholder: <OPTIONAL>",
+            "[c.k] contains unresolved placeholder: <REQUIRED>",
+        ]
+        # Each free-form value is scanned on its own; the whole config never is.
+        assert scanned == [("a",), ("b",), ("c",)]
+
+
+def test_incremental_validation_scans_only_changed_keys(monkeypatch):
+    class Schema:
+        schema = {f"k{i}": {"type": dict, "required": True} for i in range(50)}
+
+    config = {f"k{i}": {"nested": [i]} for i in range(50)}
+    validator = IncrementalValidator(Schema)
+    validator.validate(config)
+
+    scanned = []
+    real_scan = schema_utils.scan_config
+    monkeypatch.setattr(schema_utils, "scan_config", lambda value, **kwargs: scanned.append(kwargs["prefix"]) or real_scan(value, **kwargs))
+    with pytest.raises(ValidationError) as exc:
+        validator.validate({**config, "k7": {"nested": ["<REQUIRED>"]}})
+
+    assert exc.value.errors == ["[k7.nested[0]] contains unresolved placeholder: <REQUIRED>"]
+    assert scanned == [("k7",)]
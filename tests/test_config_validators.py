@@ -78,3 +78,58 @@ def test_int_in_range_fails(value):
     validator = ConfigValidator.int_in_range(min_value=1, max_value=5)
     with pytest.raises(ValueError):
         validator(value, key="number")
+
+
+# --- valid_excel_tab_name ---
+
+@pytest.mark.parametrize("name", ["Sheet1", "Q3 Summary", "x" * 31])
+def test_valid_excel_tab_name_passes(name):
+    ConfigValidator.valid_excel_tab_name(name, key="tab")
+
+
+@pytest.mark.parametrize("name,message", [
+    ("   ", "cannot be empty"),
+    ("", "cannot be empty"),
+    ("x" * 32, "exceeds 31-character limit"),
+    ("a/b", "contains invalid characters"),
+    ("data[1]", "contains invalid characters"),
+])
+def test_valid_excel_tab_name_fails(name, message):
+    with pytest.raises(ValueError, match=message):
+        ConfigValidator.valid_excel_tab_name(name, key="tab")
+
+
+# --- valid_filename_string ---
+
+@pytest.mark.parametrize("name", ["a|b", "a<b", 'quote"d', "what?"])
+def test_valid_filename_string_rejects_forbidden_chars(name):
+    with pytest.raises(ValueError, match="forbidden characters"):
+        ConfigValidator.valid_filename_string(name, key="file")
+
+
+# --- regex_match ---
+
+def test_regex_match_passes():
+    validator = ConfigValidator.regex_match(pattern=r"[a-z]+-\d{2}")
+    validator("node-01", key="host")
+
+
+@pytest.mark.parametrize("value", ["node-1", "NODE-01", "node-01 ", 5])
+def test_regex_match_fails(value):
+    validator = ConfigValidator.regex_match(pattern=r"[a-z]+-\d{2}")
+    with pytest.raises(ValueError):
+        validator(value, key="host")
+
+
+def test_regex_match_reuses_compiled_patterns():
+    from config_env_initializer.string_rules import compile_pattern
+    ConfigValidator.regex_match(pattern=r"id-\d+")
+    before = compile_pattern.cache_info().hits
+    ConfigValidator.regex_match(pattern=r"id-\d+")
+    assert compile_pattern.cache_info().hits == before + 1
+
+
+def test_regex_match_rejects_invalid_pattern():
+    import re
+    with pytest.raises(re.error):
+        ConfigValidator.regex_match(pattern="(unclosed")
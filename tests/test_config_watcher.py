@@ -0,0 +1,138 @@
+import os
+import re
+import threading
+from pathlib import Path
+
+import pytest
+
+from config_env_initializer.config_loader import ConfigLoader
+from config_env_initializer.config_watcher import FileWatcher, diff_configs, watch_config_files
+from config_env_initializer.exceptions import ValidationError
+
+
+@pytest.fixture
+def project(write_project):
+    return write_project(
+        '"log_prefix": {"type": str, "required": False, "default": "watch_"}',
+        '"timeout": {"type": int, "required": True, '
+        '"validators": [{"name": "int_in_range", "min_value": 1, "max_value": 60}]}',
+        config="timeout: 5\n",
+    )
+
+
+def write_config(config_path: Path, timeout):
+    previous = config_path.stat().st_mtime_ns
+    config_path.write_text(re.sub(r"(?m)^timeout: .*$", f"timeout: {timeout}", config_path.read_text()))
+    # Guarantee a visible mtime change on filesystems with coarse timestamps.
+    os.utime(config_path, ns=(previous + 10**9, previous + 10**9))
+
+
+def test_diff_configs_reports_key_level_changes():
+    diff = diff_configs({"a": 1, "b": 2, "logger": object()}, {"a": 1, "b": 3, "c": 4})
+    assert diff.added == {"c": 4}
+    assert diff.removed == {}
+    assert diff.changed == {"b": (2, 3)}
+    assert not diff_configs({"a": 1}, {"a": 1})
+
+
+def test_file_watcher_detects_modification(tmp_path):
+    path = tmp_path / "file.yaml"
+    path.write_text("a: 1")
+    watcher = FileWatcher([path])
+
+    assert watcher.poll() == []
+    os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+    assert watcher.poll() == [path]
+    assert watcher.poll() == []
+
+
+def test_reload_swaps_config_and_keeps_runtime_objects(project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path))
+    logger = loader.logger
+
+    write_config(config_path, 30)
+    config, diff = loader.reload()
+
+    assert config is loader.config
+    assert config["timeout"] == 30
+    assert config["logger"] is logger
+    assert diff.changed == {"timeout": (5, 30)}
+    loader.execution_monitor.finalize_script_db_record()
+
+
+def test_reload_failure_keeps_previous_config(project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+
+    write_config(config_path, 999)
+    with pytest.raises(ValidationError):
+        loader.reload()
+    assert loader.config["timeout"] == 5
+
+
+def test_watch_invokes_callback_with_diff(project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+    stop = threading.Event()
+    received = []
+
+    def callback(config, diff):
+        received.append((config["timeout"], diff.changed))
+        stop.set()
+
+    thread = threading.Thread(target=loader.watch, args=(callback,), kwargs={"interval": 0.01, "stop_event": stop})
+    thread.start()
+    stop.wait(0.2)  # let the watcher take its initial snapshot
+    write_config(config_path, 42)
+    thread.join(timeout=5)
+    stop.set()
+
+    assert received == [(42, {"timeout": (5, 42)})]
+    assert loader.config.pending_keys() == ["auth", "logger", "execution_monitor"]
+
+
+def test_watch_sees_edits_made_between_load_and_watch(project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+    write_config(config_path, 42)
+
+    stop = threading.Event()
+    received = []
+
+    def callback(config, diff):
+        received.append(diff.changed)
+        stop.set()
+
+    thread = threading.Thread(target=loader.watch, args=(callback,), kwargs={"interval": 0.01, "stop_event": stop})
+    thread.start()
+    thread.join(timeout=5)
+    stop.set()
+
+    assert received == [{"timeout": (5, 42)}]
+
+
+def test_watch_config_files_revalidates_on_change(project):
+    config_path, schema_path = project
+    stop = threading.Event()
+    reports = []
+
+    def report(path, errors):
+        reports.append(errors)
+        if len(reports) == 2:
+            stop.set()
+
+    thread = threading.Thread(
+        target=watch_config_files,
+        args=([config_path], schema_path, report),
+        kwargs={"interval": 0.01, "stop_event": stop},
+    )
+    thread.start()
+    while not reports and thread.is_alive():
+        stop.wait(0.01)
+    write_config(config_path, 0)
+    thread.join(timeout=5)
+    stop.set()
+
+    assert reports[0] == []
+    assert any("timeout" in err for err in reports[1])
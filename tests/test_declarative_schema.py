@@ -0,0 +1,168 @@
+import hashlib
+import json
+import pickle
+import sys
+
+import pytest
+
+from config_env_initializer import declarative_schema, schema_registry
+from config_env_initializer.__main__ import main, parse_validate_config_args
+from config_env_initializer.config_loader import ConfigLoader
+from config_env_initializer.config_utils import validate_config
+from config_env_initializer.declarative_schema import load_declarative_schema, schema_cache_path
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema, validate_schema_file
+
+YAML_SCHEMA = """
+schema:
+  name: {type: str, required: true, validators: [is_non_empty_str]}
+  port: {type: int, required: true, validators: [{name: int_in_range, min_value: 1, max_value: 65535}]}
+  timeout: {type: [int, float], required: false, default: 30}
+  db:
+    type: dict
+    required: false
+    default: {host: localhost}
+    schema:
+      host: {type: str, required: true}
+  servers:
+    type: list
+    required: false
+    default: []
+    items: {type: dict, schema: {port: {type: int, required: true}}}
+project_dirs: [data]
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    schema_registry.clear_schema_registry()
+    yield
+    schema_registry.clear_schema_registry()
+
+
+def test_type_names_are_resolved(tmp_path):
+    path = tmp_path / "schema.yaml"
+    path.write_text(YAML_SCHEMA)
+
+    schema_module = load_declarative_schema(path)
+
+    rules = schema_module.schema
+    assert rules["name"]["type"] is str
+    assert rules["timeout"]["type"] == (int, float)
+    assert rules["db"]["schema"]["host"]["type"] is str
+    assert rules["servers"]["items"]["schema"]["port"]["type"] is int
+    assert schema_module.project_dirs == ["data"]
+
+
+def test_compiled_schema_validates_like_a_python_schema(tmp_path):
+    path = tmp_path / "schema.yaml"
+    path.write_text(YAML_SCHEMA)
+
+    compiled = compile_schema(path)
+
+    assert compiled.validate({"name": "svc", "port": 80, "timeout": 1.5})["db"] == {"host": "localhost"}
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"name": "", "port": 0, "servers": [{"port": "x"}]})
+    assert len(exc.value.errors) == 3
+
+
+def test_parsed_schema_is_cached_by_content_hash_when_asked(tmp_path, monkeypatch):
+    path = tmp_path / "schema.yaml"
+    path.write_text("schema:\n  name: {type: str, required: true}\n")
+    load_declarative_schema(path)
+    assert list(tmp_path.iterdir()) == [path]
+
+    cache_dir = tmp_path / "cache"
+    load_declarative_schema(path, cache_dir=cache_dir)
+    cache_file, = cache_dir.iterdir()
+    assert cache_file.suffix == ".json"
+
+    monkeypatch.setattr(declarative_schema, "_parse", lambda *a: pytest.fail("parsed again"))
+    assert load_declarative_schema(path, cache_dir=cache_dir).schema["name"]["type"] is str
+
+    path.write_text("schema:\n  name: {type: int, required: true}\n")
+    monkeypatch.undo()
+    assert load_declarative_schema(path, cache_dir=cache_dir).schema["name"]["type"] is int
+
+    schema_registry.clear_schema_registry()
+    monkeypatch.setenv(declarative_schema.SCHEMA_CACHE_DIR_ENV, str(tmp_path / "registry-cache"))
+    assert schema_registry.load_schema_module(path).schema["name"]["type"] is int
+    assert len(list((tmp_path / "registry-cache").iterdir())) == 1
+
+
+def test_cache_holds_only_plain_data(tmp_path):
+    path = tmp_path / "schema.yaml"
+    path.write_text("schema:\n  name: {type: str, required: true}\n")
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    cache_dir = tmp_path / "cache"
+    schema_cache_path(cache_dir, digest).parent.mkdir()
+    schema_cache_path(cache_dir, digest).write_bytes(pickle.dumps({"key": (2, digest)}))
+
+    # An unreadable or foreign cache file is ignored and replaced, never unpickled.
+    assert load_declarative_schema(path, cache_dir=cache_dir).schema["name"]["type"] is str
+    assert json.loads(schema_cache_path(cache_dir, digest).read_text())["data"]["schema"]["name"]["type"] == "str"
+
+
+def test_toml_schema(tmp_path):
+    pytest.importorskip("tomllib")
+    path = tmp_path / "schema.toml"
+    path.write_text('[schema.name]\ntype = "str"\nrequired = true\n')
+    assert load_declarative_schema(path).schema == {"name": {"type": str, "required": True}}
+
+
+def test_unknown_type_names_are_reported(tmp_path):
+    path = tmp_path / "schema.yaml"
+    path.write_text("schema:\n  a: {type: string, required: true}\n  b: {type: [int, decimal], required: true}\n")
+
+    with pytest.raises(ValidationError) as exc:
+        load_declarative_schema(path)
+
+    assert [error.split(";")[0] for error in exc.value.errors] == [
+        "[a] Unknown type name 'string'",
+        "[b] Unknown type name 'decimal'",
+    ]
+
+
+def test_validate_schema_file_accepts_declarative_paths(tmp_path):
+    good = tmp_path / "good.yaml"
+    good.write_text(YAML_SCHEMA)
+    assert validate_schema_file(good) is True
+
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("schema:\n  a: {type: str, validators: [no_such_validator]}\n")
+    with pytest.raises(ValidationError) as exc:
+        validate_schema_file(str(bad))
+    assert exc.value.errors == [
+        "[a] Missing required 'required' key in schema rules.",
+        "[a] Validator 'no_such_validator' not found in registered validators.",
+    ]
+
+
+def test_config_loader_and_validate_config_accept_declarative_schemas(tmp_path):
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(YAML_SCHEMA)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("name: svc\nport: 8080\n")
+
+    assert validate_config(config_path, schema_path) == []
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+    assert loader.config["timeout"] == 30
+
+
+def test_cli_takes_a_positional_declarative_schema(tmp_path, monkeypatch, capsys):
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(YAML_SCHEMA)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("name: svc\nport: 0\n")
+
+    options = parse_validate_config_args([str(config_path), str(schema_path)])
+    assert options["schema_path"] == schema_path and options["patterns"] == [str(config_path)]
+    assert parse_validate_config_args(["a.yaml", "b.yaml"])["patterns"] == ["a.yaml", "b.yaml"]
+    with pytest.raises(ValueError, match="More than one schema"):
+        parse_validate_config_args(["a.yaml", "--schema", "s.py", "app.schema.json"])
+
+    monkeypatch.setattr(sys, "argv", ["config-init", "validate-config", str(config_path), str(schema_path)])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    assert "port" in capsys.readouterr().out
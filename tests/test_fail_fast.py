@@ -0,0 +1,157 @@
+import sys
+
+import pytest
+import yaml
+
+from config_env_initializer.__main__ import main
+from config_env_initializer.config_utils import prepare_schema, validate_config, validate_config_data
+from config_env_initializer.config_validator import ConfigValidator, CustomValidator, EXPENSIVE_VALIDATOR_COST
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema, validate_config_against_schema
+
+CALLS = []
+
+
+@CustomValidator.register(name="costly_lookup", cost=50)
+def costly_lookup(value, key=None):
+    CALLS.append(("costly_lookup", key))
+    if value == "missing":
+        raise ValueError(f"{key} not found")
+
+
+@CustomValidator.register(name="cheap_prefix")
+def cheap_prefix(value, key=None):
+    CALLS.append(("cheap_prefix", key))
+    if not value.startswith("svc-"):
+        raise ValueError(f"{key} must start with 'svc-'")
+
+
+@CustomValidator.register(name="remote_check", io_bound=True)
+def remote_check(value, key=None):
+    CALLS.append(("remote_check", key))
+
+
+class Schema:
+    schema = {
+        "name": {"type": str, "required": True, "validators": ["costly_lookup", "cheap_prefix"]},
+        "owner": {"type": str, "required": True, "validators": ["costly_lookup"]},
+        "port": {"type": int, "required": True},
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+def test_steps_are_ordered_cheapest_first():
+    compiled = compile_schema(Schema)
+    assert [step.label for step in compiled.index["name"].steps] == ["cheap_prefix", "costly_lookup"]
+    assert ConfigValidator.get_validator_options("remote_check")["cost"] == EXPENSIVE_VALIDATOR_COST
+
+
+def test_expensive_validators_are_skipped_after_a_failure():
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(Schema).validate({"name": "db", "owner": "ops", "port": 1})
+
+    assert exc.value.errors == ["[name] cheap_prefix: name must start with 'svc-'"]
+    assert ("costly_lookup", "name") not in CALLS
+    assert ("costly_lookup", "owner") in CALLS
+
+
+def test_fail_fast_stops_at_first_error():
+    config = {"name": "db", "owner": "missing", "port": "x"}
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(Schema).validate(config, fail_fast=True)
+
+    assert exc.value.errors == ["[name] cheap_prefix: name must start with 'svc-'"]
+    assert CALLS == [("cheap_prefix", "name")]
+
+
+def test_max_errors_limits_collected_errors():
+    config = {"name": "db", "owner": "missing", "port": "x"}
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(Schema).validate(config, max_errors=2)
+
+    assert exc.value.errors == [
+        "[name] cheap_prefix: name must start with 'svc-'",
+        "[owner] costly_lookup: owner not found",
+    ]
+
+
+def test_fail_fast_skips_pending_io_validators():
+    class IoSchema:
+        schema = {
+            "a": {"type": str, "required": True, "validators": ["remote_check"]},
+            "b": {"type": int, "required": True},
+            "c": {"type": str, "required": True, "validators": ["remote_check"]},
+        }
+
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(IoSchema).validate({"a": "x", "b": "oops", "c": "y"}, fail_fast=True)
+
+    assert exc.value.errors == ["[b] Config key 'b' must be of type int, but got str."]
+    assert CALLS == []
+
+
+def test_validate_config_data_orders_and_limits(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(
+        'schema = {\n'
+        '    "name": {"type": str, "required": True, "validators": ["costly_lookup", "cheap_prefix"]},\n'
+        '    "port": {"type": int, "required": True},\n'
+        '}\n'
+    )
+    prepared = prepare_schema(schema_path)
+
+    assert validate_config_data({"name": "db", "port": "x"}, prepared) == [
+        "name: validation error - name must start with 'svc-'",
+        "port: expected int, got str",
+    ]
+    assert ("costly_lookup", "name") not in CALLS
+    assert validate_config_data({"name": "db", "port": "x"}, prepared, max_errors=1) == [
+        "name: validation error - name must start with 'svc-'",
+    ]
+
+
+def test_cli_fail_fast(tmp_path, monkeypatch, capsys):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(
+        'schema = {"a": {"type": int, "required": True}, "b": {"type": int, "required": True}}\n'
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"a": "x", "b": "y"}))
+    monkeypatch.setattr(sys, "argv", ["config-init", "validate-config", str(config_path), str(schema_path), "--fail-fast"])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    out = capsys.readouterr().out
+    assert exc.value.code == 1
+    assert "a: expected int" in out
+    assert "b: expected int" not in out
+
+
+@pytest.mark.parametrize("max_errors", [0, -1])
+def test_max_errors_below_one_is_rejected(tmp_path, monkeypatch, capsys, max_errors):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text('schema = {"a": {"type": int, "required": True}}\n')
+    prepared = prepare_schema(schema_path)
+    with pytest.raises(ValueError):
+        compile_schema(Schema).validate({}, max_errors=max_errors)
+    with pytest.raises(ValueError):
+        validate_config_against_schema({}, compile_schema(Schema), max_errors=max_errors)
+    with pytest.raises(ValueError):
+        validate_config_data({}, prepared, max_errors=max_errors)
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"a": "x"}))
+    with pytest.raises(ValueError):
+        validate_config(config_path, prepared_schema=prepared, max_errors=max_errors)
+
+    argv = ["config-init", "validate-config", str(config_path), str(schema_path), "--max-errors", str(max_errors)]
+    monkeypatch.setattr(sys, "argv", argv)
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    assert "--max-errors must be at least 1" in capsys.readouterr().out
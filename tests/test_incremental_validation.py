@@ -0,0 +1,91 @@
+import pytest
+
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.fingerprint import value_fingerprint
+from config_env_initializer.incremental_validation import IncrementalValidator
+
+CALLS = []
+
+
+@CustomValidator.register(name="recording_validator")
+def recording_validator(value, key=None):
+    CALLS.append(key)
+    if value == "bad":
+        raise ValueError(f"{key} is bad")
+
+
+@CustomValidator.register(name="recording_io_validator", io_bound=True)
+def recording_io_validator(value, key=None):
+    CALLS.append(key)
+
+
+class RecordingSchema:
+    schema = {
+        name: {"type": str, "required": True, "validators": ["recording_validator"]}
+        for name in ("alpha", "beta", "gamma")
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+def test_only_changed_keys_are_revalidated():
+    validator = IncrementalValidator(RecordingSchema)
+    validator.validate({"alpha": "a", "beta": "b", "gamma": "c"})
+    CALLS.clear()
+
+    validated = validator.validate({"alpha": "a", "beta": "changed", "gamma": "c"})
+
+    assert CALLS == ["beta"]
+    assert validated["beta"] == "changed"
+    assert validator.hits == 2
+
+
+def test_memoized_errors_are_still_reported():
+    validator = IncrementalValidator(RecordingSchema)
+    config = {"alpha": "bad", "beta": "b", "gamma": "c"}
+
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate(config)
+        assert exc_info.value.errors == ["[alpha] recording_validator: alpha is bad"]
+
+    assert CALLS == ["alpha", "beta", "gamma"]
+
+
+def test_always_rerun_validators_are_not_memoized():
+    validator = IncrementalValidator(RecordingSchema, always_rerun=["recording_validator"])
+    config = {"alpha": "a", "beta": "b", "gamma": "c"}
+    validator.validate(config)
+    validator.validate(config)
+    assert len(CALLS) == 6
+
+
+def test_io_bound_and_file_based_validators_are_rerun_by_default(tmp_path):
+    class VolatileSchema:
+        schema = {
+            "remote": {"type": str, "required": True, "validators": ["recording_io_validator"]},
+            "path": {"type": str, "required": True, "validators": ["file_exists"]},
+            "plain": {"type": str, "required": True, "validators": ["recording_validator"]},
+        }
+
+    target = tmp_path / "input.txt"
+    target.write_text("x")
+    validator = IncrementalValidator(VolatileSchema)
+    config = {"remote": "r", "path": str(target), "plain": "p"}
+    validator.validate(config)
+    validator.validate(config)
+    assert CALLS == ["remote", "plain", "remote"]
+
+    target.unlink()
+    with pytest.raises(ValidationError):
+        validator.validate(config)
+
+
+def test_value_fingerprint_distinguishes_types():
+    assert value_fingerprint([1, {"a": True}]) == value_fingerprint([1, {"a": True}])
+    assert value_fingerprint([1]) != value_fingerprint([True])
+    assert value_fingerprint({"a": 1}) != value_fingerprint({"a": 1.0})
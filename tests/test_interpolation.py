@@ -0,0 +1,212 @@
+import textwrap
+
+import pytest
+
+from config_env_initializer import interpolation
+from config_env_initializer.config_cache import ConfigCache
+from config_env_initializer.config_loader import ConfigLoader
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.interpolation import compile_template, environment_key, index_templates
+
+SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True},
+    "db": {
+        "type": dict,
+        "required": True,
+        "schema": {"host": {"type": str, "required": True}, "port": {"type": int, "required": True}},
+    },
+    "hosts": {"type": list, "required": False, "default": []},
+}
+"""
+
+AUTH_SCHEMA = SCHEMA.replace("},\n}", '},\n    "demo_auth_path": {"type": str, "required": True},\n}')
+
+
+def write_project(tmp_path, config, schema=SCHEMA):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(schema)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(textwrap.dedent(config))
+    return str(config_path), str(schema_path)
+
+
+def test_templates_are_compiled_once_and_render_defaults():
+    compile_template.cache_clear()
+    template = compile_template("postgres://${USER:-admin}@${HOST}:${PORT:-5432}/$${literal}")
+
+    assert compile_template("postgres://${USER:-admin}@${HOST}:${PORT:-5432}/$${literal}") is template
+    assert compile_template.cache_info().hits == 1
+    assert template.variables == {"USER", "HOST", "PORT"}
+    assert template.render({"HOST": "db", "PORT": ""}) == "postgres://admin@db:5432/${literal}"
+
+    missing = []
+    assert template.render({}, missing) == "postgres://admin@:5432/${literal}"
+    assert missing == ["HOST"]
+    assert compile_template("no references, ${ not closed") is None
+
+
+def test_resolve_copies_only_templated_paths():
+    config = {"db": {"host": "${HOST}", "port": "5432"}, "hosts": ["a", "${EXTRA:-b}"], "plain": {"k": 1}}
+    index = index_templates(config)
+
+    resolved = index.resolve(config, {"HOST": "db.internal"})
+
+    assert resolved == {"db": {"host": "db.internal", "port": "5432"}, "hosts": ["a", "b"], "plain": {"k": 1}}
+    assert config["db"]["host"] == "${HOST}"
+    assert resolved["plain"] is config["plain"]
+    assert set(index.templates) == {("db", "host"), ("hosts", 1)}
+    assert not index.changed({"HOST": "db.internal", "OTHER": "x"})
+    assert index.changed({"HOST": "db.other"})
+
+
+def test_lone_references_are_typed_like_yaml_scalars():
+    config = {
+        "port": "${PORT}",
+        "debug": "${DEBUG:-false}",
+        "ratio": "${RATIO:-0.5}",
+        "tag": "${TAG}",
+        "quoted": "${QUOTED}",
+        "url": "http://${HOST}:${PORT}",
+        "date": "${DATE}",
+    }
+    environ = {"PORT": "5432", "TAG": "007x", "QUOTED": "'5'", "HOST": "h", "DATE": "2024-01-01"}
+
+    resolved = index_templates(config).resolve(config, environ)
+
+    assert resolved == {
+        "port": 5432,
+        "debug": False,
+        "ratio": 0.5,
+        "tag": "007x",
+        "quoted": "'5'",
+        "url": "http://h:5432",
+        "date": "2024-01-01",
+    }
+
+
+def test_lone_references_stay_strings_where_the_schema_expects_one(tmp_path):
+    schema = SCHEMA.replace("},\n}", '},\n    "api_token": {"type": str, "required": True},\n    "version": {"type": str, "required": True},\n}')
+    config_path, schema_path = write_project(tmp_path, """\
+        name: "${NAME}"
+        api_token: "${TOKEN}"
+        version: ${VER}
+        db:
+          host: localhost
+          port: "${PORT}"
+        hosts: ["${HOST}"]
+    """, schema)
+
+    loader = ConfigLoader(
+        config_path, schema_path, lazy=True,
+        environ={"NAME": "off", "TOKEN": "123456", "VER": "1.10", "PORT": "5432", "HOST": "7"},
+    )
+
+    assert loader.config["name"] == "off"
+    assert loader.config["api_token"] == "123456"
+    assert loader.config["version"] == "1.10"
+    assert loader.config["db"]["port"] == 5432
+    assert loader.config["hosts"] == ["7"]
+
+
+def test_unset_variables_are_reported_by_path(tmp_path):
+    config_path, schema_path = write_project(tmp_path, """\
+        name: ${APP_NAME}
+        db:
+          host: ${DB_HOST}
+          port: 5432
+    """)
+
+    with pytest.raises(ValidationError) as exc:
+        ConfigLoader(config_path, schema_path, lazy=True, environ={})
+
+    assert exc.value.errors == [
+        "[name] Environment variable 'APP_NAME' is not set and has no default.",
+        "[db.host] Environment variable 'DB_HOST' is not set and has no default.",
+    ]
+
+
+def test_loader_expands_nested_values_and_auth_paths(tmp_path):
+    (tmp_path / "auth.yaml").write_text("token: secret\n")
+    config_path, schema_path = write_project(tmp_path, """\
+        name: svc-${ENV:-dev}
+        db:
+          host: ${DB_HOST}
+          port: ${DB_PORT:-5432}
+        hosts: ["${DB_HOST}", static]
+        demo_auth_path: ${AUTH_DIR}/auth.yaml
+    """, AUTH_SCHEMA)
+
+    loader = ConfigLoader(config_path, schema_path, lazy=True, environ={"DB_HOST": "db.prod", "AUTH_DIR": str(tmp_path)})
+
+    assert loader.config["name"] == "svc-dev"
+    assert loader.config["db"] == {"host": "db.prod", "port": 5432}
+    assert loader.config["hosts"] == ["db.prod", "static"]
+    assert loader.auth["demo"]["token"] == "secret"
+    assert loader.raw_config["db"]["host"] == "${DB_HOST}"
+
+
+def test_placeholders_are_still_detected_after_expansion(tmp_path):
+    config_path, schema_path = write_project(tmp_path, """\
+        name: ${APP_NAME:-<REQUIRED>}
+        db:
+          host: localhost
+          port: 5432
+    """)
+
+    with pytest.raises(ValidationError) as exc:
+        ConfigLoader(config_path, schema_path, lazy=True, environ={})
+    assert len(exc.value.errors) == 1 and "placeholder" in exc.value.errors[0]
+
+    assert ConfigLoader(config_path, schema_path, lazy=True, environ={"APP_NAME": "svc"}).config["name"] == "svc"
+
+
+def test_refresh_environment_only_rerenders_templated_paths(tmp_path, monkeypatch):
+    config_path, schema_path = write_project(tmp_path, """\
+        name: svc
+        db:
+          host: ${DB_HOST}
+          port: 5432
+        hosts: [a, b]
+    """)
+    loader = ConfigLoader(config_path, schema_path, lazy=True, environ={"DB_HOST": "one"})
+    hosts = loader.config["hosts"]
+
+    monkeypatch.setattr(loader, "_load_raw_config", lambda: pytest.fail("files must not be re-read"))
+    config, diff = loader.refresh_environment({"DB_HOST": "one", "UNRELATED": "x"})
+    assert config is loader.config and not diff
+
+    config, diff = loader.refresh_environment({"DB_HOST": "two"})
+    assert config["db"]["host"] == "two"
+    assert config["hosts"] is hosts
+    assert diff
+
+    with pytest.raises(ValidationError):
+        loader.refresh_environment({})
+    assert loader.config["db"]["host"] == "two"
+    with pytest.raises(ValidationError):
+        loader.refresh_environment({})
+
+
+def test_cache_key_tracks_referenced_variables(tmp_path):
+    config_path, schema_path = write_project(tmp_path, """\
+        name: svc
+        db:
+          host: ${DB_HOST}
+          port: 5432
+    """)
+    cache_dir = str(tmp_path / "cache")
+
+    assert not ConfigLoader(config_path, schema_path, cache_dir=cache_dir, lazy=True, environ={"DB_HOST": "a"}).cache_hit
+    cached = ConfigLoader(config_path, schema_path, cache_dir=cache_dir, lazy=True, environ={"DB_HOST": "a", "X": "1"})
+    assert cached.cache_hit and cached.config["db"]["host"] == "a"
+
+    loader = ConfigLoader(config_path, schema_path, cache_dir=cache_dir, lazy=True, environ={"DB_HOST": "b"})
+    assert not loader.cache_hit and loader.config["db"]["host"] == "b"
+
+    config, _ = cached.refresh_environment({"DB_HOST": "c"})
+    assert config["db"]["host"] == "c"
+
+    key = ConfigCache(cache_dir).cache_key(config_path, schema_path, environment_key({"DB_HOST"}, {"DB_HOST": "a"}))
+    assert key != ConfigCache(cache_dir).cache_key(config_path, schema_path)
+    assert interpolation.referenced_variables([config_path]) == {"DB_HOST"}
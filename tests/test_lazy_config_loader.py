@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config_env_initializer.config_loader import ConfigLoader, LazyConfig
+
+
+@pytest.fixture
+def project(tmp_path, write_project):
+    (tmp_path / "auth.yaml").write_text("token: secret\n")
+    return write_project(
+        '"log_prefix": {"type": str, "required": False, "default": "lazy_"}',
+        '"demo_auth_path": {"type": str, "required": False, "default": "auth.yaml"}',
+        config=f"demo_auth_path: {tmp_path / 'auth.yaml'}\n",
+    )
+
+
+def test_lazy_loader_defers_logger_and_monitor(tmp_path, project):
+    config_path, schema_path = project
+
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+
+    assert not (tmp_path / "logs").exists()
+    assert not (tmp_path / "db").exists()
+    assert set(loader.config.pending_keys()) == {"auth", "logger", "execution_monitor"}
+    assert loader.config["log_prefix"] == "lazy_"
+
+
+def test_lazy_keys_materialize_on_first_access(tmp_path, project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+
+    monitor = loader.config["execution_monitor"]
+
+    assert (tmp_path / "db" / "metrics.db").exists()
+    assert loader.config["logger"] is loader.logger
+    assert loader.config["execution_monitor"] is monitor
+    assert loader.config.pending_keys() == ["auth"]
+    monitor.finalize_script_db_record()
+
+
+def test_lazy_auth_loads_on_access(project):
+    config_path, schema_path = project
+    loader = ConfigLoader(str(config_path), str(schema_path), lazy=True)
+
+    assert "auth" in loader.config
+    assert loader.auth_keys == ["demo"]
+    assert loader.auth["demo"]["token"] == "secret"
+
+
+def test_lazy_config_get_and_override():
+    calls = []
+    config = LazyConfig({"a": 1}, {"b": lambda: calls.append("b") or 2})
+
+    assert config.get("missing", "fallback") == "fallback"
+    assert config.get("b") == 2
+    assert config.get("b") == 2
+    assert calls == ["b"]
+
+    overridden = LazyConfig({}, {"c": lambda: 3})
+    overridden["c"] = 4
+    assert overridden["c"] == 4
+    assert overridden.pending_keys() == []
+
+
+def test_importing_the_loader_defers_optional_heavy_modules():
+    deferred = (
+        "sqlite3", "config_env_initializer.validation_ledger", "asyncio", "concurrent.futures",
+        "yaml", "pickle", "inspect", "config_env_initializer.declarative_schema",
+    )
+    script = (
+        "import sys, config_env_initializer.config_loader\n"
+        f"print([name for name in {deferred!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,130 @@
+import sys
+
+import pytest
+
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import (
+    compile_schema,
+    generate_config_template,
+    validate_config_against_schema,
+    validate_schema_file,
+)
+
+
+class ServiceSchema:
+    schema = {
+        "db": {
+            "type": dict,
+            "required": True,
+            "schema": {
+                "host": {"type": str, "required": True, "validators": ["is_non_empty_str"]},
+                "port": {"type": int, "required": False, "default": 5432},
+            },
+        },
+        "servers": {
+            "type": list,
+            "required": True,
+            "items": {
+                "type": dict,
+                "schema": {
+                    "name": {"type": str, "required": True},
+                    "port": {
+                        "type": int,
+                        "required": True,
+                        "validators": [{"name": "int_in_range", "min_value": 1, "max_value": 65535}],
+                    },
+                    "tags": {"type": list, "required": False, "default": []},
+                },
+            },
+        },
+    }
+
+
+def valid_config():
+    return {
+        "db": {"host": "db.internal"},
+        "servers": [{"name": "a", "port": 80}, {"name": "b", "port": 443}],
+    }
+
+
+def test_index_contains_flat_dotted_paths():
+    compiled = compile_schema(ServiceSchema)
+    assert list(compiled.index) == [
+        "db", "db.host", "db.port",
+        "servers", "servers[]", "servers[].name", "servers[].port", "servers[].tags",
+    ]
+    assert compiled.index["servers[].port"].required is True
+
+
+def test_nested_defaults_are_applied_without_touching_input():
+    config = valid_config()
+    validated = validate_config_against_schema(config, ServiceSchema)
+
+    assert validated["db"] == {"host": "db.internal", "port": 5432}
+    assert validated["servers"][1]["tags"] == []
+    assert config == valid_config()
+
+
+def test_unchanged_subtrees_stay_shared():
+    config = valid_config()
+    config["db"]["port"] = 6543
+    validated = validate_config_against_schema(config, ServiceSchema)
+
+    assert validated["db"] is config["db"]
+    assert validated["servers"] is not config["servers"]
+
+
+def test_errors_report_full_paths():
+    config = {
+        "db": {"host": ""},
+        "servers": [{"name": "a", "port": 80}, {"port": 70000}, "not-a-record"],
+    }
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_config_against_schema(config, ServiceSchema)
+
+    errors = exc_info.value.errors
+    assert errors[0].startswith("[db.host] is_non_empty_str:")
+    assert "[servers[1].name] Missing required config key: 'servers[1].name'" in errors
+    assert any(e.startswith("[servers[1].port] int_in_range: servers[1].port=70000") for e in errors)
+    assert "[servers[2]] Config key 'servers[2]' must be of type dict, but got str." in errors
+
+
+def test_large_and_deep_configs_validate_iteratively():
+    depth = sys.getrecursionlimit() + 100
+    rules = {"type": int, "required": True}
+    config_value = 1
+    for _ in range(depth):
+        rules = {"type": dict, "required": True, "schema": {"child": rules}}
+        config_value = {"child": config_value}
+
+    class DeepSchema:
+        schema = {
+            "deep": rules,
+            "ports": {"type": list, "required": True, "items": {"type": int}},
+        }
+
+    config = {"deep": config_value, "ports": list(range(100_000))}
+    validated = validate_config_against_schema(config, compile_schema(DeepSchema))
+    assert validated["ports"] is config["ports"]
+
+
+def test_validate_schema_file_checks_nested_rules():
+    class BrokenNested:
+        schema = {
+            "db": {"type": dict, "required": True, "schema": {"host": {"type": str}}},
+            "servers": {"type": list, "required": True, "items": {"validators": ["nope"]}},
+        }
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_schema_file(BrokenNested)
+
+    assert exc_info.value.errors == [
+        "[db.host] Missing required 'required' key in schema rules.",
+        "[servers[]] Validator 'nope' not found in registered validators.",
+    ]
+
+
+def test_template_includes_nested_sections():
+    template = generate_config_template(ServiceSchema)
+    assert template["db"] == {"host": "<REQUIRED>", "port": 5432}
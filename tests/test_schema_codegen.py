@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from config_env_initializer import schema_codegen
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema
+from config_env_initializer.validation_profile import ValidationProfile
+
+CALLS = []
+
+
+@CustomValidator.register(name="codegen_expensive", cost=20)
+def codegen_expensive(value, key=None):
+    CALLS.append(key)
+
+
+@CustomValidator.register(name="codegen_remote", io_bound=True)
+def codegen_remote(value, key=None):
+    if value == "down":
+        raise ValueError(f"{key} is unreachable")
+
+
+async def async_check(value):
+    await asyncio.sleep(0)
+    if value == "bad":
+        raise ValueError("async says no")
+
+
+class Schema:
+    schema = {
+        "name": {"type": str, "required": True, "validators": ["is_non_empty_str", "codegen_expensive"]},
+        "port": {"type": int, "required": True, "validators": [{"name": "int_in_range", "min_value": 1, "max_value": 65535}]},
+        "level": {"type": str, "required": False, "default": "INFO", "validators": ["log_level_valid"]},
+        "note": {"type": str, "required": False},
+        "anything": {"required": False, "validators": [lambda value: None]},
+        "remote": {"type": str, "required": False, "default": "up", "validators": ["codegen_remote"]},
+        "mode": {"type": str, "required": False, "default": "a", "validators": [async_check]},
+        "broken": {"type": str, "required": False, "default": "x", "validators": ["no_such_validator"]},
+        "db": {
+            "type": dict,
+            "required": False,
+            "default": {"host": "localhost"},
+            "schema": {
+                "host": {"type": str, "required": True},
+                "pool": {"type": int, "required": False, "default": 5},
+            },
+        },
+        "servers": {
+            "type": list,
+            "required": False,
+            "items": {"type": dict, "schema": {"port": {"type": int, "required": True}}},
+        },
+    }
+
+
+class SmallSchema:
+    schema = {
+        "name": {"type": str, "required": True, "validators": ["is_non_empty_str"]},
+        "port": {"type": int, "required": True, "validators": [{"name": "int_in_range", "min_value": 1, "max_value": 65535}]},
+        "level": {"type": str, "required": False, "default": "INFO"},
+    }
+
+
+CONFIGS = [
+    {"name": "svc", "port": 80, "note": "n", "anything": 1, "servers": [{"port": 1}]},
+    {"name": "", "port": 0, "level": "LOUD"},
+    {"name": "<REQUIRED>", "port": "80", "remote": "down", "mode": "bad"},
+    {"port": None, "db": {"pool": 2}, "servers": [{"port": "x"}, {}]},
+    {"name": "svc", "port": 80, "db": "not a mapping", "servers": "nope", "note": 5},
+    {"name": 5, "port": True, "anything": "<OPTIONAL>"},
+    {"name": "svc", "port": 80, "anything": {"hosts": ["ok", "<REQUIRED>"]}},
+]
+
+
+def outcome(compiled, config, **options):
+    try:
+        return "ok", compiled.validate(config, **options)
+    except ValidationError as e:
+        return "error", e.errors
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+@pytest.mark.parametrize("io_workers", [1, 8])
+def test_generated_code_matches_walker(config, io_workers):
+    walker = compile_schema(Schema)
+    generated = compile_schema(Schema, generate_code=True)
+
+    for copy in (True, False):
+        expected = outcome(walker, dict(config), copy=copy, io_workers=io_workers)
+        actual = outcome(generated, dict(config), copy=copy, io_workers=io_workers)
+        assert actual == expected
+
+
+def test_generated_code_skips_expensive_validators_after_failure():
+    compiled = compile_schema(Schema, generate_code=True)
+    CALLS.clear()
+    outcome(compiled, {"name": "", "port": 80})
+    outcome(compiled, {"name": "ok", "port": 80})
+    assert CALLS == ["name"]
+
+
+def test_generated_source_is_straight_line():
+    generated = compile_schema(Schema, generate_code=True).generated
+    assert "for " not in generated.source
+    assert "_F1_0(value, _KP1)" in generated.source
+
+
+def test_code_objects_are_cached_by_source_digest(monkeypatch):
+    first = compile_schema(Schema, generate_code=True).generated
+    compiles = []
+    real_compile = compile
+    monkeypatch.setattr(schema_codegen, "compile", lambda *a: compiles.append(a) or real_compile(*a), raising=False)
+
+    second = compile_schema(Schema, generate_code=True).generated
+
+    assert second.digest == first.digest
+    assert compiles == []
+
+
+def test_bytecode_is_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(schema_codegen, "_code_cache", type(schema_codegen._code_cache)())
+    compile_schema(SmallSchema, generate_code=True, code_cache_dir=tmp_path)
+    files = list(tmp_path.glob("schema-*.marshal"))
+    assert len(files) == 1
+
+    monkeypatch.setattr(schema_codegen, "_code_cache", type(schema_codegen._code_cache)())
+    monkeypatch.setattr(schema_codegen, "compile", lambda *a: pytest.fail("recompiled"), raising=False)
+    compiled = compile_schema(SmallSchema, generate_code=True, code_cache_dir=tmp_path)
+    assert compiled.validate({"name": "svc", "port": 80})["level"] == "INFO"
+
+
+def test_profile_and_max_errors_fall_back_to_walker():
+    compiled = compile_schema(SmallSchema, generate_code=True)
+    profile = ValidationProfile()
+    compiled.validate({"name": "svc", "port": 80}, profile=profile)
+    assert profile.by_key["port"].calls == 1
+
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"name": "", "port": 0}, fail_fast=True)
+    assert len(exc.value.errors) == 1
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from config_env_initializer import schema_registry
+from config_env_initializer.config_loader import ConfigLoader
+from config_env_initializer.config_utils import validate_config
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_registry import load_compiled_schema, load_schema_module
+
+SCHEMA = """
+from pathlib import Path
+with open(Path(__file__).with_suffix(".runs"), "a") as f:
+    f.write("x")
+
+schema = {{"name": {{"type": str, "required": True, "default": "{default}"}}}}
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    schema_registry.clear_schema_registry()
+    yield
+    schema_registry.clear_schema_registry()
+
+
+def write_schema(path, default="svc"):
+    path.write_text(SCHEMA.format(default=default))
+
+
+def runs(path):
+    runs_path = path.with_suffix(".runs")
+    return len(runs_path.read_text()) if runs_path.exists() else 0
+
+
+def test_schema_is_executed_once_per_process(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    write_schema(schema_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("name: app\n")
+
+    first = load_schema_module(schema_path)
+    assert validate_config(config_path, schema_path) == []
+    ConfigLoader(str(config_path), str(schema_path), lazy=True)
+
+    assert load_schema_module(tmp_path / "." / "schema.py") is first
+    assert runs(schema_path) == 1
+
+
+def test_changed_schema_is_reloaded(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    write_schema(schema_path)
+    first = load_schema_module(schema_path)
+    compiled = load_compiled_schema(schema_path)
+    assert load_compiled_schema(schema_path) is compiled
+
+    write_schema(schema_path, default="other")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_schema_module(schema_path) is not first
+    assert load_compiled_schema(schema_path).validate({})["name"] == "other"
+    assert runs(schema_path) == 2
+
+
+def test_compiled_schema_follows_validator_registrations(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text('schema = {"name": {"type": str, "required": True, "validators": ["registry_late_check"]}}\n')
+    with pytest.raises(ValidationError) as exc:
+        load_compiled_schema(schema_path).validate({"name": "x"})
+    assert "registry_late_check" in exc.value.errors[0]
+
+    @CustomValidator.register(name="registry_late_check")
+    def registry_late_check(value, key=None):
+        raise ValueError(f"{key} rejected")
+
+    with pytest.raises(ValidationError) as exc:
+        load_compiled_schema(schema_path).validate({"name": "x"})
+    assert exc.value.errors == ["[name] registry_late_check: name rejected"]
+    assert load_compiled_schema(schema_path) is load_compiled_schema(schema_path)
+
+
+def test_failed_schema_is_not_cached(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text("raise RuntimeError('boom')\n")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            load_schema_module(schema_path)
+
+
+def test_missing_schema(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_schema_module(tmp_path / "missing.py")
@@ -0,0 +1,113 @@
+import pytest
+
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema, validate_schema_file
+from config_env_initializer.sequence_validation import (
+    format_indices,
+    int_in_range_each,
+    int_no_leading_zero_each,
+    valid_filename_string_each,
+)
+
+
+@CustomValidator.register(name="is_even")
+def is_even(value, key=None):
+    if value % 2:
+        raise ValueError(f"{key} must be even.")
+
+
+def validate(validators, value, key="items"):
+    class Schema:
+        schema = {key: {"type": list, "required": True, "validators": validators}}
+    return compile_schema(Schema).validate({key: value})
+
+
+def test_int_in_range_each_reports_offending_indices():
+    validator = int_in_range_each(min_value=1, max_value=65535)
+    validator(list(range(1, 50001)), "ports")
+
+    with pytest.raises(ValueError) as exc:
+        validator([80, 0, 443, 70000, "22"], "ports")
+
+    assert str(exc.value) == (
+        "ports items at indices [4] must be integers.; "
+        "ports items at indices [1, 3] not in range [1, 65535]"
+    )
+
+
+def test_int_no_leading_zero_each_checks_sign_and_digits():
+    validator = int_no_leading_zero_each(digits=4)
+    validator([1000, 2024, 9999])
+
+    with pytest.raises(ValueError) as exc:
+        validator([2024, -5, 123, 12345], "years")
+
+    assert str(exc.value) == (
+        "years items at indices [1] must be positive integers.; "
+        "years items at indices [2, 3] must be exactly 4 digits long."
+    )
+
+
+def test_valid_filename_string_each_scans_all_names():
+    assert valid_filename_string_each(["report.txt", "data.csv"], "files") is True
+
+    with pytest.raises(ValueError) as exc:
+        valid_filename_string_each(["ok.txt", "bad|name", " ", "a<b"], "files")
+
+    message = str(exc.value)
+    assert "files items at indices [2] must not be empty or whitespace." in message
+    assert "files items at indices [1, 3] contain forbidden characters" in message
+
+
+def test_long_index_lists_are_truncated():
+    assert format_indices(list(range(12))) == "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ... (12 total)]"
+
+
+def test_each_modifier_uses_bulk_builtin_in_schema():
+    validated = validate([{"name": "each:int_in_range", "min_value": 1, "max_value": 10}], [1, 5, 10])
+    assert validated["items"] == [1, 5, 10]
+
+    with pytest.raises(ValidationError) as exc:
+        validate([{"name": "each:int_in_range", "min_value": 1, "max_value": 10}], [1, 50, 10])
+
+    assert exc.value.errors == [
+        "[items] each:int_in_range: items items at indices [1] not in range [1, 10]"
+    ]
+
+
+def test_each_modifier_wraps_other_validators_per_item():
+    validate(["each:is_even"], [2, 4, 6])
+
+    with pytest.raises(ValidationError) as exc:
+        validate(["each:is_even"], [2, 3, 4, 5])
+
+    assert exc.value.errors == [
+        "[items] each:is_even: items[1] must be even.; items[3] must be even."
+    ]
+
+
+def test_each_modifier_requires_a_list():
+    class Schema:
+        schema = {"items": {"type": str, "required": True, "validators": ["each:valid_filename_string"]}}
+
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(Schema).validate({"items": "file.txt"})
+
+    assert exc.value.errors == ["[items] each:valid_filename_string: items must be a list."]
+
+
+def test_schema_file_check_accepts_each_modifier():
+    class Schema:
+        schema = {
+            "ports": {
+                "type": list,
+                "required": True,
+                "validators": [{"name": "each:int_in_range", "min_value": 1, "max_value": 10}, "each:nope"],
+            }
+        }
+
+    with pytest.raises(ValidationError) as exc:
+        validate_schema_file(Schema)
+
+    assert exc.value.errors == ["[ports] Validator 'each:nope' not found in registered validators."]
@@ -0,0 +1,92 @@
+import sys
+import textwrap
+
+import pytest
+
+from config_env_initializer.__main__ import main
+from config_env_initializer.streaming_validation import (
+    StreamError,
+    iter_documents,
+    iter_validation_errors,
+)
+
+
+class StreamSchema:
+    schema = {
+        "name": {"type": str, "required": True},
+        "port": {
+            "type": int,
+            "required": False,
+            "default": 80,
+            "validators": [{"name": "int_in_range", "min_value": 1, "max_value": 65535}],
+        },
+    }
+
+
+BUNDLE = textwrap.dedent("""\
+    name: first
+    port: 8080
+    ---
+    Name: second
+    port: 0
+    ---
+    port: 443
+    ---
+    - not
+    - a mapping
+""")
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    path = tmp_path / "bundle.yaml"
+    path.write_text(BUNDLE)
+    return path
+
+
+def test_iter_documents_yields_each_document(bundle_path):
+    documents = list(iter_documents(bundle_path))
+    assert len(documents) == 4
+    assert documents[0] == {"name": "first", "port": 8080}
+
+
+@pytest.mark.parametrize("by_key", [False, True])
+def test_errors_are_tagged_with_document_index(bundle_path, by_key):
+    errors = list(iter_validation_errors(bundle_path, StreamSchema, by_key=by_key))
+
+    assert [e.document for e in errors] == [1, 2, 3, 3]
+    assert errors[0].message.startswith("[port] int_in_range:")
+    assert errors[1] == StreamError(2, "[name] Missing required config key: 'name'")
+    assert errors[2].message == "YAML config must be a dictionary at the top level."
+
+
+def test_errors_are_yielded_before_the_stream_is_exhausted(bundle_path):
+    errors = iter_validation_errors(bundle_path, StreamSchema, by_key=True)
+    first = next(errors)
+    assert first.document == 1
+    errors.close()
+
+
+def test_by_key_resolves_anchors_and_detects_collisions(tmp_path):
+    path = tmp_path / "anchors.yaml"
+    path.write_text("name: &n shared\nalias_name: *n\nNAME: dup\n")
+
+    errors = list(iter_validation_errors(path, StreamSchema, by_key=True))
+
+    assert [e.message for e in errors] == ["Config key collision after normalization: 'NAME' → 'name'"]
+
+
+def test_cli_stream_mode(bundle_path, tmp_path, monkeypatch, capsys):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(textwrap.dedent("""\
+        schema = {"name": {"type": str, "required": True}}
+    """))
+    monkeypatch.setattr(sys, "argv", ["config-init", "validate-config", str(bundle_path), str(schema_path), "--stream"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    out = capsys.readouterr().out
+    assert exc_info.value.code == 1
+    assert "document 2: [name] Missing required config key" in out
+    assert "3 error(s) in 2 document(s)." in out
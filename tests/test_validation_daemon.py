@@ -0,0 +1,176 @@
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from config_env_initializer.__main__ import main
+from config_env_initializer.config_utils import validate_config
+from config_env_initializer.validation_daemon import (
+    SOCKET_PATH_ENV,
+    DaemonUnavailable,
+    ValidationDaemon,
+    default_socket_path,
+    request,
+    validate_with_daemon,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True, "validators": ["is_non_empty_str"]},
+    "level": {"type": str, "required": False, "default": "INFO", "validators": ["log_level_valid"]},
+}
+"""
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    daemon = ValidationDaemon(tmp_path / "d.sock")
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if daemon.socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_daemon_validates_like_validate_config(tmp_path, daemon):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    good = write(tmp_path, "good.yaml", "name: svc\n")
+    bad = write(tmp_path, "bad.yaml", "name: ''\nlevel: LOUD\n")
+
+    assert validate_with_daemon(good, schema_path, socket_path=daemon.socket_path) == []
+    assert validate_with_daemon(bad, schema_path, socket_path=daemon.socket_path) == validate_config(bad, schema_path)
+    assert len(validate_with_daemon(bad, schema_path, max_errors=1, socket_path=daemon.socket_path)) == 1
+    assert request({"op": "ping"}, daemon.socket_path) == {"ok": True, "pid": os.getpid(), "schemas": 1}
+
+
+def test_daemon_reports_bad_requests(tmp_path, daemon):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(daemon.socket_path))
+        sock.sendall(b"not json\n{\"op\": \"explode\"}\n")
+        with sock.makefile("rb") as reader:
+            first, second = reader.readline(), reader.readline()
+    assert b"Invalid JSON" in first
+    assert b"Unknown op" in second
+
+    response = request({"op": "validate", "config": str(tmp_path / "missing.yaml"), "schema": str(tmp_path / "s.py")}, daemon.socket_path)
+    assert response["ok"] is False and response["error"].startswith("FileNotFoundError")
+
+
+def test_daemon_reloads_changed_schemas(tmp_path, daemon):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    config_path = write(tmp_path, "config.yaml", "name: svc\n")
+    assert validate_with_daemon(config_path, schema_path, socket_path=daemon.socket_path) == []
+
+    schema_path.write_text(SCHEMA.replace('"required": False', '"required": True').replace('"default": "INFO", ', ""))
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert validate_with_daemon(config_path, schema_path, socket_path=daemon.socket_path) == ["level: missing required field"]
+
+
+def test_shutdown_request_stops_the_daemon_and_removes_the_socket(tmp_path):
+    socket_path = tmp_path / "d.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+    daemon = ValidationDaemon(socket_path)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        try:
+            assert request({"op": "shutdown"}, socket_path) == {"ok": True}
+            break
+        except DaemonUnavailable:
+            threading.Event().wait(0.01)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+    with pytest.raises(DaemonUnavailable):
+        request({"op": "ping"}, socket_path)
+
+
+def test_cli_uses_the_daemon_and_falls_back_without_one(tmp_path, daemon, monkeypatch, capsys):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    config_path = write(tmp_path, "config.yaml", "name: svc\n")
+
+    for socket_path in (daemon.socket_path, tmp_path / "nobody.sock"):
+        monkeypatch.setattr(sys, "argv", [
+            "config-init", "validate-config", str(config_path), str(schema_path), "--socket", str(socket_path),
+        ])
+        try:
+            main()
+        except SystemExit as exc:
+            assert exc.code == 0
+
+        captured = capsys.readouterr()
+        assert "[SUCCESS] Config is valid." in captured.out
+        assert ("validating in-process" in captured.err) == (socket_path != daemon.socket_path)
+
+
+def test_daemon_client_skips_the_validation_imports(tmp_path, daemon):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    config_path = write(tmp_path, "config.yaml", "name: svc\n")
+    deferred = ("yaml", "config_env_initializer.config_utils", "config_env_initializer.validation_daemon")
+    script = (
+        "import atexit, sys\n"
+        f"atexit.register(lambda: print([name for name in {deferred!r} if name in sys.modules]))\n"
+        f"sys.argv = ['config-init', 'validate-config', {str(config_path)!r}, {str(schema_path)!r}, '--socket', {str(daemon.socket_path)!r}]\n"
+        "from config_env_initializer.__main__ import main\n"
+        "main()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=30,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["[SUCCESS] Config is valid.", "[]"]
+
+
+def test_daemon_never_replaces_a_file_that_is_not_a_socket(tmp_path):
+    important = write(tmp_path, "important.txt", "keep me")
+
+    with pytest.raises(OSError, match="not a socket"):
+        ValidationDaemon(important).serve_forever()
+    assert important.read_text() == "keep me"
+    with pytest.raises(DaemonUnavailable, match="not a socket"):
+        request({"op": "ping"}, important)
+
+
+def test_socket_is_private_to_its_owner(tmp_path, daemon, monkeypatch):
+    assert stat.S_IMODE(os.lstat(daemon.socket_path).st_mode) == stat.S_IRUSR | stat.S_IWUSR
+
+    monkeypatch.delenv(SOCKET_PATH_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    assert default_socket_path() == tmp_path / "run" / "config-init.sock"
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    shared = default_socket_path().parent
+    shared.mkdir(parents=True, mode=0o777)
+    os.chmod(shared, 0o777)
+    with pytest.raises(OSError, match="only you can access"):
+        ValidationDaemon(default_socket_path()).serve_forever()
+
+    monkeypatch.setattr(os, "getuid", lambda: os.lstat(daemon.socket_path).st_uid + 1)
+    with pytest.raises(DaemonUnavailable, match="another user"):
+        request({"op": "ping"}, daemon.socket_path)
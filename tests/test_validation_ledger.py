@@ -0,0 +1,152 @@
+import json
+import sys
+
+import pytest
+
+from config_env_initializer import schema_registry, yaml_loader
+from config_env_initializer.__main__ import main
+from config_env_initializer.config_utils import prepare_schema, validate_config
+from config_env_initializer.config_validator import CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import CompiledSchema, validate_config_against_schema
+from config_env_initializer.sensitive import SensitiveValue
+from config_env_initializer.validation_ledger import ValidationLedger, config_hash, ledger_scope, validator_registry_version
+
+SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True, "validators": ["is_non_empty_str"]},
+    "level": {"type": str, "required": False, "default": "INFO", "validators": ["log_level_valid"]},
+}
+"""
+
+FILE_SCHEMA = """
+schema = {"data": {"type": str, "required": True, "validators": ["each:file_exists"]}}
+"""
+
+PROBE_SCHEMA = """
+schema = {
+    "name": {"type": str, "required": True, "validators": ["ledger_probe"]},
+    "level": {"type": str, "required": False, "default": "INFO"},
+}
+"""
+
+PROBED = []
+
+
+@CustomValidator.register(name="ledger_probe")
+def ledger_probe(value, key=None):
+    PROBED.append(value)
+    if not value:
+        raise ValueError(f"{key} must not be empty")
+
+
+@CustomValidator.register(name="ledger_clock_check", volatile=True)
+def ledger_clock_check(value, key=None):
+    pass
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    with ValidationLedger(tmp_path / "ledger" / "validation.db") as ledger:
+        yield ledger
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def no_parsing(monkeypatch):
+    monkeypatch.setattr(yaml_loader, "safe_load", lambda data: pytest.fail("config parsed again"))
+
+
+def test_validate_config_skips_recorded_configs(tmp_path, ledger, monkeypatch):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    good = write(tmp_path, "good.yaml", "name: svc\n")
+    bad = write(tmp_path, "bad.yaml", "name: ''\nlevel: LOUD\n")
+    expected = validate_config(bad, schema_path)
+
+    assert validate_config(good, schema_path, ledger=ledger) == []
+    assert validate_config(bad, schema_path, ledger=ledger) == expected
+
+    no_parsing(monkeypatch)
+    assert validate_config(good, schema_path, ledger=ledger) == []
+    assert validate_config(bad, schema_path, ledger=ledger) == expected
+    assert validate_config(bad, schema_path, ledger=ledger, max_errors=1) == expected[:1]
+
+    monkeypatch.undo()
+    bad.write_text("name: ''\n")
+    assert len(validate_config(bad, schema_path, ledger=ledger)) == 1
+
+
+def test_truncated_results_are_not_recorded(tmp_path, ledger, monkeypatch):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    bad = write(tmp_path, "bad.yaml", "name: ''\nlevel: LOUD\n")
+
+    assert len(validate_config(bad, schema_path, ledger=ledger, max_errors=1)) == 1
+    assert len(validate_config(bad, schema_path, ledger=ledger)) == 2
+
+
+def test_registering_a_validator_changes_the_registry_version():
+    before = validator_registry_version()
+
+    @CustomValidator.register(name="ledger_version_probe")
+    def ledger_version_probe(value, key=None):
+        pass
+
+    assert validator_registry_version() != before
+
+
+def test_volatile_validators_opt_out(tmp_path):
+    prepared = prepare_schema(write(tmp_path, "schema.py", FILE_SCHEMA))
+    assert ledger_scope(prepared.schema, prepared.digest) is None
+    assert ledger_scope({"a": {"validators": ["is_non_empty_str"]}}, "digest") is not None
+    assert ledger_scope({"a": {"items": {"validators": ["ledger_clock_check"]}}}, "volatile") is None
+    assert ledger_scope({"a": {}}, None) is None
+
+
+def test_validate_config_against_schema_returns_recorded_outcomes(tmp_path, ledger):
+    schema_registry.clear_schema_registry()
+    schema_module = schema_registry.load_schema_module(write(tmp_path, "schema.py", PROBE_SCHEMA))
+
+    assert validate_config_against_schema({"name": "svc"}, schema_module, ledger=ledger)["level"] == "INFO"
+    with pytest.raises(ValidationError) as first:
+        validate_config_against_schema({"name": ""}, schema_module, ledger=ledger)
+
+    PROBED.clear()
+    assert validate_config_against_schema({"name": "svc"}, schema_module, ledger=ledger) == {"name": "svc", "level": "INFO"}
+    config = {"name": "svc"}
+    assert validate_config_against_schema(config, schema_module, copy=False, ledger=ledger) is config
+    assert config["level"] == "INFO"
+    with pytest.raises(ValidationError) as second:
+        validate_config_against_schema({"name": ""}, schema_module, ledger=ledger)
+    assert second.value.errors == first.value.errors
+    assert PROBED == []
+
+    columns = [row[1] for row in ledger._connection().execute("PRAGMA table_info(validation_results)")]
+    assert "result" not in columns
+
+
+def test_secrets_are_hashed_by_their_contents():
+    assert config_hash({"token": SensitiveValue("a")}) != config_hash({"token": SensitiveValue("b")})
+    assert config_hash({"token": SensitiveValue("a")}) == config_hash({"token": SensitiveValue("a")})
+    assert config_hash({"token": SensitiveValue("a")}) != config_hash({"token": "a"})
+
+
+def test_cli_ledger_option(tmp_path, monkeypatch, capsys):
+    schema_path = write(tmp_path, "schema.py", SCHEMA)
+    config_path = write(tmp_path, "config.yaml", "name: svc\n")
+    ledger_path = tmp_path / "validation.db"
+    argv = ["config-init", "validate-config", str(config_path), "--schema", str(schema_path), "--ledger", str(ledger_path), "--json"]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    for _ in range(2):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+        assert json.loads(capsys.readouterr().out)["valid"] is True
+
+    with ValidationLedger(ledger_path) as ledger:
+        rows = ledger._connection().execute("SELECT valid, errors FROM validation_results").fetchall()
+    assert rows == [(1, "[]")]
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import sys
+import time
+
+import pytest
+import yaml
+
+from config_env_initializer.__main__ import main
+from config_env_initializer.config_utils import prepare_schema, validate_config_data
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import validate_config_against_schema
+from config_env_initializer.validation_profile import ValidationProfile
+
+
+def slow(value, key=None):
+    time.sleep(0.02)
+
+
+async def slow_async(value):
+    await asyncio.sleep(0.01)
+
+
+class Schema:
+    schema = {
+        "level": {"type": str, "required": True, "validators": ["log_level_valid"]},
+        "servers": {
+            "type": list,
+            "required": True,
+            "items": {"schema": {"host": {"type": str, "required": True, "validators": [slow, "is_non_empty_str"]}}},
+        },
+        "name": {"type": str, "required": True, "validators": [slow_async]},
+    }
+
+
+CONFIG = {"level": "INFO", "servers": [{"host": "a"}, {"host": "b"}], "name": "svc"}
+
+
+def test_profile_records_per_key_and_validator():
+    profile = ValidationProfile()
+    validate_config_against_schema(CONFIG, Schema, profile=profile)
+
+    assert profile.by_key["servers[].host"].calls == 4
+    assert profile.by_validator["inline validator"].calls == 3
+    assert profile.by_validator["log_level_valid"].calls == 1
+    assert profile.top(1)[0][0] == "inline validator"
+    assert profile.top(1, by="key")[0][0] == "servers[].host"
+    assert profile.by_key["servers[].host"].wall_ns >= 40_000_000
+
+
+def test_profile_still_reports_errors():
+    profile = ValidationProfile()
+    with pytest.raises(ValidationError):
+        validate_config_against_schema({**CONFIG, "level": "LOUD"}, Schema, profile=profile)
+
+    assert profile.by_validator["log_level_valid"].calls == 1
+
+
+def test_validate_config_data_accepts_profile(tmp_path):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(
+        'schema = {"level": {"type": str, "required": True, "validators": ["log_level_valid"]}}\n'
+    )
+    profile = ValidationProfile()
+
+    errors = validate_config_data({"level": "INFO"}, prepare_schema(schema_path), profile=profile)
+
+    assert errors == []
+    assert profile.by_key["level"].calls == 1
+    assert set(profile.to_dict()["by_validator"]) == {"log_level_valid"}
+
+
+def test_format_table_lists_slowest_first():
+    profile = ValidationProfile()
+    profile.record("a", "fast", 1_000, 1_000)
+    profile.record("b", "slow", 5_000_000, 4_000_000)
+
+    lines = profile.format_table(n=1).splitlines()
+
+    assert lines[0].split() == ["Validator", "calls", "wall", "ms", "cpu", "ms"]
+    assert lines[1].split() == ["slow", "1", "5.000", "4.000"]
+    assert "fast" not in profile.format_table(n=1)
+
+
+def test_cli_profile_prints_table_and_json(tmp_path, monkeypatch, capsys):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text(
+        'schema = {"level": {"type": str, "required": True, "validators": ["log_level_valid"]}}\n'
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"level": "INFO"}))
+    json_path = tmp_path / "profile.json"
+    monkeypatch.setattr(sys, "argv", [
+        "config-init", "validate-config", str(config_path), str(schema_path),
+        "--profile", "--profile-json", str(json_path),
+    ])
+
+    try:
+        main()
+    except SystemExit as e:
+        assert e.code in (0, None)
+
+    out = capsys.readouterr().out
+    assert "is valid" in out
+    assert "log_level_valid" in out
+    assert json.loads(json_path.read_text())["by_key"]["level"]["calls"] == 1
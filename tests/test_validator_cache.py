@@ -0,0 +1,145 @@
+import os
+import time
+
+import pytest
+
+from config_env_initializer.config_validator import ConfigValidator, CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema
+from config_env_initializer.validator_cache import (
+    VALIDATOR_CACHE,
+    ValidatorCache,
+    cached_validator,
+    validator_cache_stats,
+)
+
+CALLS = []
+
+
+@CustomValidator.register(name="pure_checksum", pure=True)
+def pure_checksum(value, key=None):
+    CALLS.append(value)
+    if value == "bad":
+        raise ValueError(f"{key} has a bad checksum")
+
+
+@CustomValidator.register(name="short_lived_check", cacheable=True, ttl=0.05)
+def short_lived_check(value, key=None):
+    CALLS.append(value)
+
+
+@CustomValidator.register(name="document_parses", file_based=True)
+def document_parses(value, key=None):
+    CALLS.append(value)
+    with open(value) as f:
+        if "broken" in f.read():
+            raise ValueError(f"{key} does not parse")
+
+
+def make_schema(validator):
+    class Schema:
+        schema = {"value": {"type": str, "required": True, "validators": [validator]}}
+    return Schema
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    CALLS.clear()
+    VALIDATOR_CACHE.clear()
+    yield
+    VALIDATOR_CACHE.clear()
+
+
+def test_pure_validator_is_memoized_across_compiles():
+    for _ in range(3):
+        compile_schema(make_schema("pure_checksum")).validate({"value": "ok"})
+
+    assert CALLS == ["ok"]
+    stats = validator_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+
+def test_cached_failures_are_reported_again():
+    compiled = compile_schema(make_schema("pure_checksum"))
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc:
+            compiled.validate({"value": "bad"})
+        assert exc.value.errors == ["[value] pure_checksum: value has a bad checksum"]
+
+    assert CALLS == ["bad"]
+
+
+def test_ttl_entries_expire():
+    compiled = compile_schema(make_schema("short_lived_check"))
+    compiled.validate({"value": "x"})
+    compiled.validate({"value": "x"})
+    time.sleep(0.06)
+    compiled.validate({"value": "x"})
+
+    assert CALLS == ["x", "x"]
+
+
+def test_file_based_entries_are_invalidated_by_stat(tmp_path):
+    document = tmp_path / "doc.yaml"
+    document.write_text("fine: true\n")
+    compiled = compile_schema(make_schema("document_parses"))
+
+    compiled.validate({"value": str(document)})
+    compiled.validate({"value": str(document)})
+    assert len(CALLS) == 1
+
+    document.write_text("broken: [\n")
+    os.utime(document, ns=(0, 1))
+    with pytest.raises(ValidationError):
+        compiled.validate({"value": str(document)})
+    assert len(CALLS) == 2
+
+
+def test_file_exists_is_cached_but_tracks_the_filesystem(tmp_path):
+    target = tmp_path / "data.txt"
+    compiled = compile_schema(make_schema("file_exists"))
+
+    with pytest.raises(ValidationError):
+        compiled.validate({"value": str(target)})
+    target.write_text("now here")
+    compiled.validate({"value": str(target)})
+    compiled.validate({"value": str(target)})
+
+    assert ConfigValidator.get_validator_options("file_exists")["cacheable"] is True
+    assert validator_cache_stats().hits == 1
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ValidatorCache(maxsize=2)
+    calls = []
+    validator = cached_validator(lambda value, key=None: calls.append(value), "token", cache=cache)
+
+    validator(1, "k")
+    validator(2, "k")
+    validator(1, "k")
+    validator(3, "k")
+    validator(1, "k")
+    validator(2, "k")
+
+    assert calls == [1, 2, 3, 2]
+    assert cache.stats().evictions == 2
+
+
+def test_disabled_cache_always_calls_through():
+    cache = ValidatorCache()
+    cache.enabled = False
+    calls = []
+    validator = cached_validator(lambda value, key=None: calls.append(value), "token", cache=cache)
+
+    validator(1, "k")
+    validator(1, "k")
+
+    assert calls == [1, 1]
+    assert cache.stats().misses == 0
+
+
+def test_uncacheable_validators_are_not_wrapped():
+    compiled = compile_schema(make_schema("is_non_empty_str"))
+    compiled.validate({"value": "x"})
+
+    assert validator_cache_stats().misses == 0
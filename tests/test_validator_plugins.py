@@ -0,0 +1,119 @@
+import sys
+import textwrap
+
+import pytest
+
+from config_env_initializer import validator_plugins
+from config_env_initializer.config_utils import prepare_schema, validate_config_data
+from config_env_initializer.config_validator import ConfigValidator, CustomValidator
+from config_env_initializer.exceptions import ValidationError
+from config_env_initializer.schema_utils import compile_schema, validate_schema_file
+from config_env_initializer.validator_plugins import plugin_index, refresh_plugin_index
+
+ENTRY_POINTS = """
+[config_env_initializer.validators]
+plugin_even = plugin_validators_demo.numbers:plugin_even
+plugin_registered = plugin_validators_demo.registered
+plugin_broken = plugin_validators_demo.broken:missing
+"""
+
+
+@pytest.fixture
+def plugin_dist(tmp_path, monkeypatch):
+    package = tmp_path / "plugin_validators_demo"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "numbers.py").write_text(textwrap.dedent("""
+        def plugin_even(value, key=None):
+            if value % 2:
+                raise ValueError(f"{key} must be even.")
+    """))
+    (package / "registered.py").write_text(textwrap.dedent("""
+        from config_env_initializer.config_validator import CustomValidator
+
+        @CustomValidator.register(name="plugin_registered", pure=True)
+        def check(value, key=None):
+            if value != "ok":
+                raise ValueError(f"{key} must be ok.")
+    """))
+    (package / "broken.py").write_text("")
+    dist_info = tmp_path / "plugin_validators_demo-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: plugin-validators-demo\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    refresh_plugin_index()
+    yield
+    for name in ("plugin_even", "plugin_registered", "plugin_broken"):
+        CustomValidator._registry.pop(name, None)
+        CustomValidator._options.pop(name, None)
+    for module in [m for m in sys.modules if m.startswith("plugin_validators_demo")]:
+        del sys.modules[module]
+    refresh_plugin_index()
+
+
+def schema_using(validator, value_type=int):
+    class Schema:
+        schema = {"value": {"type": value_type, "required": True, "validators": [validator]}}
+    return Schema
+
+
+def test_index_lists_names_without_importing(plugin_dist):
+    assert {"plugin_even", "plugin_registered", "plugin_broken"} <= set(plugin_index())
+    assert "plugin_validators_demo.numbers" not in sys.modules
+
+
+def test_plugin_is_imported_on_first_reference(plugin_dist):
+    compiled = compile_schema(schema_using("plugin_even"))
+
+    assert "plugin_validators_demo.numbers" in sys.modules
+    assert "plugin_validators_demo.registered" not in sys.modules
+    compiled.validate({"value": 2})
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({"value": 3})
+    assert exc.value.errors == ["[value] plugin_even: value must be even."]
+
+
+def test_module_entry_point_keeps_registration_options(plugin_dist):
+    compile_schema(schema_using("plugin_registered", str)).validate({"value": "ok"})
+
+    assert ConfigValidator.get_validator_options("plugin_registered")["cacheable"] is True
+
+
+def test_plugin_load_failure_is_reported(plugin_dist):
+    with pytest.raises(ValidationError) as exc:
+        compile_schema(schema_using("plugin_broken")).validate({"value": 1})
+
+    assert exc.value.errors[0].startswith("[value] Validator 'plugin_broken' failed to load:")
+
+    with pytest.raises(ValidationError) as exc:
+        validate_schema_file(schema_using("plugin_broken"))
+    assert exc.value.errors[0].startswith("[value] Validator 'plugin_broken' failed to load:")
+
+
+def test_plugins_resolve_in_validate_config(plugin_dist, tmp_path):
+    schema_path = tmp_path / "schema.py"
+    schema_path.write_text('schema = {"value": {"type": int, "required": True, "validators": ["plugin_even"]}}\n')
+
+    errors = validate_config_data({"value": 3}, prepare_schema(schema_path))
+
+    assert errors == ["value: validation error - value must be even."]
+
+
+def test_unknown_names_still_fail(plugin_dist):
+    with pytest.raises(ValidationError) as exc:
+        validate_schema_file(schema_using("no_such_plugin"))
+    assert exc.value.errors == ["[value] Validator 'no_such_plugin' not found in registered validators."]
+
+
+def test_index_is_read_once(monkeypatch):
+    refresh_plugin_index()
+    reads = []
+    monkeypatch.setattr(validator_plugins, "_read_entry_points", lambda: reads.append(1) or {})
+
+    plugin_index()
+    plugin_index()
+
+    assert reads == [1]
+    refresh_plugin_index()
@@ -0,0 +1,26 @@
+import yaml
+from config_env_initializer import yaml_loader
+from config_env_initializer.yaml_loader import load_yaml_file, safe_load
+
+
+def test_loader_matches_pure_python_safe_load(tmp_path):
+    text = "name: demo\nports: [80, 443]\nnested:\n  enabled: true\n  ratio: 0.5\n"
+    path = tmp_path / "config.yaml"
+    path.write_text(text, encoding="utf-8")
+
+    assert load_yaml_file(path) == yaml.safe_load(text)
+
+
+def test_empty_file_returns_none(tmp_path):
+    path = tmp_path / "empty.yaml"
+    path.write_text("")
+    assert load_yaml_file(path) is None
+
+
+def test_falls_back_to_pure_python_loader(monkeypatch):
+    monkeypatch.setattr(yaml_loader, "SafeLoader", yaml.SafeLoader)
+    assert safe_load("a: 1") == {"a": 1}
+
+
+def test_libyaml_flag_matches_selected_loader():
+    assert yaml_loader.LIBYAML_AVAILABLE == (yaml_loader.SafeLoader is not yaml.SafeLoader)